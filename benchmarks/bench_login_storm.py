@@ -0,0 +1,106 @@
+import argparse
+import asyncio
+import logging
+import os
+import statistics
+import tempfile
+import time
+from pathlib import Path
+
+DB_PATH = Path(tempfile.mkdtemp()) / "bench_login_storm.db"
+os.environ.setdefault("DATABASE_URL", f"sqlite+aiosqlite:///{DB_PATH}")
+os.environ.setdefault("PRINCIPAL_CACHE_REDIS_ENABLED", "false")
+os.environ.setdefault("APP_DEBUG", "false")
+
+import httpx
+
+from src.core.database import Base, engine
+from src.main import app
+from src.models import Tenant, User
+from src.services import auth
+from src.services.auth import hash_password
+from src.services.hashing import run_hash
+
+EMAIL = "storm@bench.io"
+
+
+async def seed() -> None:
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(Tenant.__table__.insert().values(id="t1", name="Bench", slug="bench"))
+        await conn.execute(
+            User.__table__.insert().values(
+                id="u1", tenant_id="t1", email=EMAIL, password_hash=hash_password("correct-horse")
+            )
+        )
+
+
+async def inline_hash(operation, fn, *args):
+    return fn(*args)
+
+
+def percentile(samples: list[float], q: float) -> float:
+    ordered = sorted(samples)
+    return ordered[min(len(ordered) - 1, int(q * len(ordered)))]
+
+
+async def probe(client: httpx.AsyncClient, stop: asyncio.Event, latencies: list[float]) -> None:
+    # Latency is measured from each probe's scheduled send time, so probes delayed by a
+    # blocked event loop count against it instead of silently being skipped.
+    scheduled = time.perf_counter()
+    while not stop.is_set():
+        await asyncio.sleep(max(0.0, scheduled - time.perf_counter()))
+        await client.get("/api/v1/health")
+        latencies.append(time.perf_counter() - scheduled)
+        scheduled += 0.01
+
+
+async def attacker(client: httpx.AsyncClient, stop: asyncio.Event, statuses: list[int]) -> None:
+    while not stop.is_set():
+        response = await client.post(
+            "/api/v1/auth/login", json={"email": EMAIL, "password": "wrong-password"}
+        )
+        statuses.append(response.status_code)
+        if response.status_code == 429:
+            await asyncio.sleep(0.05)
+
+
+async def run(mode: str, concurrency: int, seconds: float) -> None:
+    auth.run_hash = inline_hash if mode == "inline" else run_hash
+    latencies, statuses = [], []
+    stop = asyncio.Event()
+    transport = httpx.ASGITransport(app=app)
+    async with httpx.AsyncClient(transport=transport, base_url="http://bench") as client:
+        tasks = [asyncio.create_task(probe(client, stop, latencies))]
+        tasks += [asyncio.create_task(attacker(client, stop, statuses)) for _ in range(concurrency)]
+        await asyncio.sleep(seconds)
+        stop.set()
+        await asyncio.gather(*tasks)
+
+    print(
+        f"{mode:>8} x{concurrency:<3} health p50 {statistics.median(latencies) * 1000:7.1f} ms"
+        f"  p99 {percentile(latencies, 0.99) * 1000:7.1f} ms"
+        f"  ({len(latencies)} probes, {statuses.count(401)} logins,"
+        f" {statuses.count(429)} shed)"
+    )
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description="Unrelated endpoint latency during a login storm")
+    parser.add_argument("--concurrency", type=int, default=16)
+    parser.add_argument("--seconds", type=float, default=10)
+    args = parser.parse_args()
+
+    logging.getLogger("httpx").setLevel(logging.WARNING)
+    await seed()
+    try:
+        await run("idle", 0, args.seconds / 2)
+        for mode in ("inline", "pool"):
+            await run(mode, args.concurrency, args.seconds)
+    finally:
+        await engine.dispose()
+        DB_PATH.unlink(missing_ok=True)
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
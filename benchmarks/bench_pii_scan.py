@@ -0,0 +1,66 @@
+import argparse
+import random
+import string
+import time
+
+from src.services.pii import ScanChunk, detect_pii
+
+SAMPLE_FIELDS = [
+    lambda: f"name: {random.choice(['Ravi', 'Anita', 'Suresh', 'Priya'])} Kumar",
+    lambda: f"email: user{random.randint(1, 10**6)}@example.com",
+    lambda: f"phone: +91 9{random.randint(100000000, 999999999)}",
+    lambda: f"aadhaar: {random.randint(2000, 9999)} {random.randint(1000, 9999)} "
+    f"{random.randint(1000, 9999)}",
+    lambda: f"pan: ABCPE{random.randint(1000, 9999)}F",
+    lambda: "card: 4111 1111 1111 1111",
+    lambda: f"dob: {random.randint(1, 28):02d}/{random.randint(1, 12):02d}/19{random.randint(50, 99)}",
+    lambda: f"address: {random.randint(1, 300)} MG Road, Bengaluru - 560001",
+]
+
+
+def filler() -> str:
+    words = (
+        "".join(random.choices(string.ascii_lowercase, k=random.randint(3, 9)))
+        for _ in range(random.randint(4, 12))
+    )
+    return "notes: " + " ".join(words)
+
+
+def make_row() -> str:
+    fields = [filler(), f"order_id: {random.randint(1, 10**9)}", f"amount: {random.random() * 1000:.2f}"]
+    fields.extend(random.choice(SAMPLE_FIELDS)() for _ in range(random.randint(0, 3)))
+    return "\n".join(fields)
+
+
+def make_chunk(chunk_bytes: int) -> ScanChunk:
+    rows = []
+    size = 0
+    while size < chunk_bytes:
+        row = make_row()
+        rows.append(row)
+        size += len(row) + 1
+    text = "\n".join(rows)
+    return ScanChunk(text, len(rows), len(text.encode()))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Single-core PII detector throughput")
+    parser.add_argument("--chunk-mb", type=float, default=4)
+    parser.add_argument("--chunks", type=int, default=5)
+    args = parser.parse_args()
+
+    random.seed(42)
+    chunk = make_chunk(int(args.chunk_mb * 1024 * 1024))
+    detect_pii(chunk.text)
+
+    start = time.perf_counter()
+    for _ in range(args.chunks):
+        detect_pii(chunk.text)
+    elapsed = time.perf_counter() - start
+
+    megabytes = chunk.nbytes * args.chunks / (1024 * 1024)
+    print(f"scanned {megabytes:.1f} MB in {elapsed:.2f}s: {megabytes / elapsed:.1f} MB/s per core")
+
+
+if __name__ == "__main__":
+    main()
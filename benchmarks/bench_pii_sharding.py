@@ -0,0 +1,67 @@
+import argparse
+import random
+import shutil
+import time
+
+from benchmarks.bench_pii_scan import make_row
+from src.core.config import settings
+from src.services.pii import group_units, manifest_stats, plan_incremental, scan_unit_group
+
+
+def write_source(path, megabytes: float) -> None:
+    target = int(megabytes * 1024 * 1024)
+    with open(path, "w") as fh:
+        while fh.tell() < target:
+            fh.write(make_row().replace("\n", ", ") + "\n")
+
+
+def main() -> None:
+    # Times the path sharded scans take in production: manifest units are bin-packed by
+    # group_units, each group is what one scan_pii_shard task scans, and the results are
+    # merged as merge_pii_scan_shards does. Groups run one after another here, each timed
+    # on its own; with one worker per group the scan takes as long as the slowest group.
+    parser = argparse.ArgumentParser(description="PII scan scaling across shard tasks")
+    parser.add_argument("--size-mb", type=float, default=64)
+    parser.add_argument("--block-mb", type=float, default=4)
+    parser.add_argument("--max-shards", type=int, default=8)
+    args = parser.parse_args()
+
+    random.seed(42)
+    bench_dir = settings.get_upload_dir() / "bench_pii_sharding"
+    bench_dir.mkdir(parents=True, exist_ok=True)
+    location = "bench_pii_sharding/source.jsonl"
+    config = {"block_bytes": int(args.block_mb * 1024 * 1024)}
+    try:
+        write_source(bench_dir / "source.jsonl", args.size_mb)
+        start = time.perf_counter()
+        plan = plan_incremental("jsonl", location, config, None)
+        planning = time.perf_counter() - start
+        print(f"planned {len(plan.units)} units in {planning:.2f}s")
+
+        baseline = None
+        for shards in range(1, args.max_shards + 1):
+            groups = group_units(plan.units, shards)
+            entries, timings = {}, []
+            for group in groups:
+                start = time.perf_counter()
+                entries.update(scan_unit_group(group, location, config))
+                timings.append(time.perf_counter() - start)
+            start = time.perf_counter()
+            stats = manifest_stats(entries)
+            merging = time.perf_counter() - start
+
+            elapsed = planning + max(timings) + merging
+            baseline = baseline or elapsed
+            megabytes = stats.bytes / (1024 * 1024)
+            balance = max(timings) / (sum(timings) / len(timings))
+            print(
+                f"{len(groups):>2} shard tasks: {megabytes:.1f} MB in {elapsed:.2f}s "
+                f"({megabytes / elapsed:.1f} MB/s, {baseline / elapsed:.2f}x, "
+                f"slowest group {balance:.2f}x the mean)"
+            )
+    finally:
+        shutil.rmtree(bench_dir, ignore_errors=True)
+
+
+if __name__ == "__main__":
+    main()
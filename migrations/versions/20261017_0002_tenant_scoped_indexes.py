@@ -0,0 +1,67 @@
+"""tenant scoped indexes
+
+Revision ID: 0002
+Revises: 0001
+Create Date: 2026-10-17 03:39:49.932807
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0002"
+down_revision: Union[str, None] = "0001"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_frameworks_tenant_type", "frameworks", ["tenant_id", "framework_type"]),
+    ("ix_assessments_tenant_created", "assessments", ["tenant_id", "created_at"]),
+    (
+        "ix_assessments_tenant_status_created",
+        "assessments",
+        ["tenant_id", "status", "created_at"],
+    ),
+    ("ix_assessments_tenant_framework", "assessments", ["tenant_id", "framework_id"]),
+    ("ix_assessments_tenant_updated", "assessments", ["tenant_id", "updated_at"]),
+    ("ix_consent_records_tenant_created", "consent_records", ["tenant_id", "created_at"]),
+    ("ix_consent_records_tenant_subject", "consent_records", ["tenant_id", "data_subject_id"]),
+    ("ix_dsr_requests_tenant_created", "dsr_requests", ["tenant_id", "created_at"]),
+    (
+        "ix_dsr_requests_tenant_status_created",
+        "dsr_requests",
+        ["tenant_id", "status", "created_at"],
+    ),
+    ("ix_dsr_requests_tenant_subject", "dsr_requests", ["tenant_id", "data_subject_id"]),
+    (
+        "ix_data_discovery_scans_tenant_created",
+        "data_discovery_scans",
+        ["tenant_id", "created_at"],
+    ),
+    (
+        "ix_data_discovery_scans_tenant_source",
+        "data_discovery_scans",
+        ["tenant_id", "source_name", "source_type", "completed_at"],
+    ),
+    ("ix_audit_logs_tenant_created", "audit_logs", ["tenant_id", "created_at"]),
+    (
+        "ix_audit_logs_tenant_resource",
+        "audit_logs",
+        ["tenant_id", "resource_type", "resource_id"],
+    ),
+    ("ix_users_email", "users", ["email"]),
+]
+
+
+def upgrade() -> None:
+    # CONCURRENTLY keeps the tables writable while the indexes build on Postgres.
+    with op.get_context().autocommit_block():
+        for name, table, columns in INDEXES:
+            op.create_index(name, table, columns, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for name, table, _ in reversed(INDEXES):
+            op.drop_index(name, table_name=table, postgresql_concurrently=True)
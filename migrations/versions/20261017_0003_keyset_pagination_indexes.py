@@ -0,0 +1,77 @@
+"""keyset pagination indexes
+
+Revision ID: 0003
+Revises: 0002
+Create Date: 2026-10-17 03:44:12.418930
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0003"
+down_revision: Union[str, None] = "0002"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+# (table, replaced index, new index, new columns): list endpoints order by (created_at, id),
+# so id has to be in the index for cursor pages to be read straight off it.
+INDEXES = [
+    (
+        "assessments",
+        "ix_assessments_tenant_created",
+        "ix_assessments_tenant_created_id",
+        ["tenant_id", "created_at", "id"],
+    ),
+    (
+        "assessments",
+        "ix_assessments_tenant_status_created",
+        "ix_assessments_tenant_status_created_id",
+        ["tenant_id", "status", "created_at", "id"],
+    ),
+    (
+        "consent_records",
+        "ix_consent_records_tenant_created",
+        "ix_consent_records_tenant_created_id",
+        ["tenant_id", "created_at", "id"],
+    ),
+    (
+        "dsr_requests",
+        "ix_dsr_requests_tenant_created",
+        "ix_dsr_requests_tenant_created_id",
+        ["tenant_id", "created_at", "id"],
+    ),
+    (
+        "dsr_requests",
+        "ix_dsr_requests_tenant_status_created",
+        "ix_dsr_requests_tenant_status_created_id",
+        ["tenant_id", "status", "created_at", "id"],
+    ),
+    (
+        "data_discovery_scans",
+        "ix_data_discovery_scans_tenant_created",
+        "ix_data_discovery_scans_tenant_created_id",
+        ["tenant_id", "created_at", "id"],
+    ),
+    (
+        "audit_logs",
+        "ix_audit_logs_tenant_created",
+        "ix_audit_logs_tenant_created_id",
+        ["tenant_id", "created_at", "id"],
+    ),
+]
+
+
+def upgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, old, new, columns in INDEXES:
+            op.create_index(new, table, columns, postgresql_concurrently=True)
+            op.drop_index(old, table_name=table, postgresql_concurrently=True)
+
+
+def downgrade() -> None:
+    with op.get_context().autocommit_block():
+        for table, old, new, columns in reversed(INDEXES):
+            op.create_index(old, table, columns[:-1], postgresql_concurrently=True)
+            op.drop_index(new, table_name=table, postgresql_concurrently=True)
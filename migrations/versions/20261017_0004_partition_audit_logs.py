@@ -0,0 +1,139 @@
+"""partition audit_logs by month
+
+Revision ID: 0004
+Revises: 0003
+Create Date: 2026-10-17 04:02:51.662104
+"""
+
+from datetime import datetime
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0004"
+down_revision: Union[str, None] = "0003"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+INDEXES = [
+    ("ix_audit_logs_tenant_created_id", ["tenant_id", "created_at", "id"]),
+    ("ix_audit_logs_tenant_resource", ["tenant_id", "resource_type", "resource_id"]),
+]
+COLUMNS = (
+    "id, tenant_id, user_id, action, resource_type, resource_id, details, ip_address, "
+    "user_agent, status, error_message"
+)
+PREMAKE_MONTHS = 3
+
+
+def audit_log_columns(created_at_nullable: bool) -> list:
+    return [
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("user_id", sa.String(length=36), nullable=True),
+        sa.Column("action", sa.String(length=100), nullable=False),
+        sa.Column("resource_type", sa.String(length=100), nullable=True),
+        sa.Column("resource_id", sa.String(length=36), nullable=True),
+        sa.Column("details", sa.JSON(), nullable=True),
+        sa.Column("ip_address", sa.String(length=50), nullable=True),
+        sa.Column("user_agent", sa.String(length=500), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=created_at_nullable),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.ForeignKeyConstraint(["user_id"], ["users.id"]),
+    ]
+
+
+def audit_log_table(created_at_nullable: bool, primary_key: list[str]) -> sa.Table:
+    return sa.Table(
+        "audit_logs",
+        sa.MetaData(),
+        *audit_log_columns(created_at_nullable),
+        sa.PrimaryKeyConstraint(*primary_key),
+        *[sa.Index(name, *columns) for name, columns in INDEXES],
+    )
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def rename_existing(suffix: str) -> None:
+    renamed = f"audit_logs_{suffix}"
+    op.execute(f"ALTER TABLE audit_logs RENAME TO {renamed}")
+    op.execute(f"ALTER TABLE {renamed} RENAME CONSTRAINT audit_logs_pkey TO {renamed}_pkey")
+    for name, _ in INDEXES:
+        op.execute(f"ALTER INDEX {name} RENAME TO {name}_{suffix}")
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        # SQLite has no partitioning; only the key and NOT NULL change, via a table rebuild.
+        copy_from = audit_log_table(False, ["id", "created_at"])
+        with op.batch_alter_table("audit_logs", recreate="always", copy_from=copy_from):
+            pass
+        return
+
+    rename_existing("unpartitioned")
+    op.create_table(
+        "audit_logs",
+        *audit_log_columns(created_at_nullable=False),
+        sa.PrimaryKeyConstraint("id", "created_at"),
+        postgresql_partition_by="RANGE (created_at)",
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", columns)
+
+    oldest, newest = (
+        op.get_bind()
+        .execute(sa.text("SELECT min(created_at), max(created_at) FROM audit_logs_unpartitioned"))
+        .one()
+    )
+    now = datetime.utcnow()
+    month = month_start(oldest or now)
+    last = add_months(month_start(now), PREMAKE_MONTHS)
+    if newest:
+        last = max(last, month_start(newest))
+    while month <= last:
+        op.execute(
+            f"CREATE TABLE audit_logs_y{month.year}m{month.month:02d} PARTITION OF audit_logs "
+            f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+        )
+        month = add_months(month, 1)
+
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}, created_at) "
+        f"SELECT {COLUMNS}, coalesce(created_at, now() at time zone 'utc') "
+        "FROM audit_logs_unpartitioned"
+    )
+    op.drop_table("audit_logs_unpartitioned")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        copy_from = audit_log_table(True, ["id"])
+        with op.batch_alter_table("audit_logs", recreate="always", copy_from=copy_from):
+            pass
+        return
+
+    rename_existing("partitioned")
+    op.create_table(
+        "audit_logs",
+        *audit_log_columns(created_at_nullable=True),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    for name, columns in INDEXES:
+        op.create_index(name, "audit_logs", columns)
+    op.execute(
+        f"INSERT INTO audit_logs ({COLUMNS}, created_at) "
+        f"SELECT {COLUMNS}, created_at FROM audit_logs_partitioned"
+    )
+    op.drop_table("audit_logs_partitioned")
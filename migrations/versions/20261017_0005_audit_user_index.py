@@ -0,0 +1,29 @@
+"""audit log user index
+
+Revision ID: 0005
+Revises: 0004
+Create Date: 2026-10-17 04:11:37.205816
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+
+
+revision: str = "0005"
+down_revision: Union[str, None] = "0004"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Partitioned tables cannot be indexed CONCURRENTLY; the index is built per partition.
+    op.create_index(
+        "ix_audit_logs_tenant_user_created_id",
+        "audit_logs",
+        ["tenant_id", "user_id", "created_at", "id"],
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_logs_tenant_user_created_id", table_name="audit_logs")
@@ -0,0 +1,65 @@
+"""audit log hash chain
+
+Revision ID: 0006
+Revises: 0005
+Create Date: 2026-10-17 05:26:48.913470
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0006"
+down_revision: Union[str, None] = "0005"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Nullable: entries written before the chain existed keep a NULL seq and are not verified.
+    op.add_column("audit_logs", sa.Column("seq", sa.BigInteger(), nullable=True))
+    op.add_column("audit_logs", sa.Column("prev_hash", sa.String(length=64), nullable=True))
+    op.add_column("audit_logs", sa.Column("entry_hash", sa.String(length=64), nullable=True))
+    op.create_index("ix_audit_logs_tenant_seq", "audit_logs", ["tenant_id", "seq"])
+
+    op.create_table(
+        "audit_chain_heads",
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("seq", sa.BigInteger(), nullable=False),
+        sa.Column("entry_hash", sa.String(length=64), nullable=False),
+        sa.Column("checkpoint_seq", sa.BigInteger(), nullable=False),
+        sa.Column("checkpoint_at", sa.DateTime(), nullable=True),
+        sa.Column("frontier", sa.JSON(), nullable=True),
+        sa.Column("updated_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("tenant_id"),
+    )
+    op.create_table(
+        "audit_checkpoints",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("first_seq", sa.BigInteger(), nullable=False),
+        sa.Column("last_seq", sa.BigInteger(), nullable=False),
+        sa.Column("last_hash", sa.String(length=64), nullable=False),
+        sa.Column("merkle_root", sa.String(length=64), nullable=False),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("verified_at", sa.DateTime(), nullable=True),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index(
+        "ix_audit_checkpoints_tenant_last_seq", "audit_checkpoints", ["tenant_id", "last_seq"]
+    )
+
+
+def downgrade() -> None:
+    op.drop_index("ix_audit_checkpoints_tenant_last_seq", table_name="audit_checkpoints")
+    op.drop_table("audit_checkpoints")
+    op.drop_table("audit_chain_heads")
+    op.drop_index("ix_audit_logs_tenant_seq", table_name="audit_logs")
+    with op.batch_alter_table("audit_logs") as batch_op:
+        batch_op.drop_column("entry_hash")
+        batch_op.drop_column("prev_hash")
+        batch_op.drop_column("seq")
@@ -0,0 +1,54 @@
+"""reports
+
+Revision ID: 0007
+Revises: 0006
+Create Date: 2026-10-17 06:12:09.402117
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0007"
+down_revision: Union[str, None] = "0006"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "reports",
+        sa.Column("id", sa.String(length=36), nullable=False),
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("report_type", sa.String(length=50), nullable=False),
+        sa.Column("format", sa.String(length=10), nullable=False),
+        sa.Column("framework_id", sa.String(length=36), nullable=True),
+        sa.Column("assessment_id", sa.String(length=36), nullable=True),
+        sa.Column("start_date", sa.DateTime(), nullable=True),
+        sa.Column("end_date", sa.DateTime(), nullable=True),
+        sa.Column("status", sa.String(length=50), nullable=True),
+        sa.Column("storage_key", sa.String(length=500), nullable=True),
+        sa.Column("size_bytes", sa.BigInteger(), nullable=True),
+        sa.Column("etag", sa.String(length=64), nullable=True),
+        sa.Column("error_message", sa.Text(), nullable=True),
+        sa.Column("created_by", sa.String(length=36), nullable=True),
+        sa.Column("created_at", sa.DateTime(), nullable=True),
+        sa.Column("started_at", sa.DateTime(), nullable=True),
+        sa.Column("completed_at", sa.DateTime(), nullable=True),
+        sa.Column("expires_at", sa.DateTime(), nullable=False),
+        sa.ForeignKeyConstraint(["assessment_id"], ["assessments.id"]),
+        sa.ForeignKeyConstraint(["created_by"], ["users.id"]),
+        sa.ForeignKeyConstraint(["framework_id"], ["frameworks.id"]),
+        sa.ForeignKeyConstraint(["tenant_id"], ["tenants.id"]),
+        sa.PrimaryKeyConstraint("id"),
+    )
+    op.create_index("ix_reports_tenant_created_id", "reports", ["tenant_id", "created_at", "id"])
+    op.create_index("ix_reports_status_expires", "reports", ["status", "expires_at"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_status_expires", table_name="reports")
+    op.drop_index("ix_reports_tenant_created_id", table_name="reports")
+    op.drop_table("reports")
@@ -0,0 +1,34 @@
+"""report cache keys and tenant data version
+
+Revision ID: 0008
+Revises: 0007
+Create Date: 2026-10-17 07:03:44.518230
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0008"
+down_revision: Union[str, None] = "0007"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column(
+        "tenants",
+        sa.Column("data_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.add_column("reports", sa.Column("cache_key", sa.String(length=64), nullable=True))
+    op.create_index("ix_reports_tenant_cache_key", "reports", ["tenant_id", "cache_key"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_reports_tenant_cache_key", table_name="reports")
+    with op.batch_alter_table("reports") as batch_op:
+        batch_op.drop_column("cache_key")
+    with op.batch_alter_table("tenants") as batch_op:
+        batch_op.drop_column("data_version")
@@ -0,0 +1,97 @@
+"""assessment control counters
+
+Revision ID: 0009
+Revises: 0008
+Create Date: 2026-10-17 09:12:37.604118
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0009"
+down_revision: Union[str, None] = "0008"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+BACKFILL_BATCH_SIZE = 1000
+
+
+def upgrade() -> None:
+    op.add_column(
+        "assessments",
+        sa.Column("controls_total", sa.Integer(), nullable=False, server_default="0"),
+    )
+    op.add_column(
+        "assessments",
+        sa.Column("controls_compliant", sa.Integer(), nullable=False, server_default="0"),
+    )
+
+    # Backfill once from the stored statuses; afterwards the API keeps them current.
+    bind = op.get_bind()
+    if bind.dialect.name == "postgresql":
+        op.execute(
+            """
+            UPDATE assessments AS a
+            SET controls_total = c.total, controls_compliant = c.compliant
+            FROM (
+                SELECT s.id,
+                       count(*) AS total,
+                       count(*) FILTER (WHERE e.value ->> 'status' = 'compliant') AS compliant
+                FROM assessments AS s, json_each(s.controls_status) AS e
+                WHERE json_typeof(s.controls_status) = 'object'
+                GROUP BY s.id
+            ) AS c
+            WHERE a.id = c.id
+            """
+        )
+        return
+
+    assessments = sa.table(
+        "assessments",
+        sa.column("id", sa.String),
+        sa.column("controls_status", sa.JSON),
+        sa.column("controls_total", sa.Integer),
+        sa.column("controls_compliant", sa.Integer),
+    )
+    update = (
+        assessments.update()
+        .where(assessments.c.id == sa.bindparam("assessment_id"))
+        .values(
+            controls_total=sa.bindparam("total"),
+            controls_compliant=sa.bindparam("compliant"),
+        )
+    )
+    # Keyset pages keep memory bounded; each page is written back with one executemany.
+    last_id = None
+    while True:
+        query = sa.select(assessments.c.id, assessments.c.controls_status).order_by(
+            assessments.c.id
+        )
+        if last_id is not None:
+            query = query.where(assessments.c.id > last_id)
+        rows = bind.execute(query.limit(BACKFILL_BATCH_SIZE)).fetchall()
+        if not rows:
+            break
+        last_id = rows[-1][0]
+        params = [
+            {
+                "assessment_id": assessment_id,
+                "total": len(controls),
+                "compliant": sum(
+                    1 for control in controls.values() if control.get("status") == "compliant"
+                ),
+            }
+            for assessment_id, controls in rows
+            if controls
+        ]
+        if params:
+            bind.execute(update, params)
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("assessments") as batch_op:
+        batch_op.drop_column("controls_compliant")
+        batch_op.drop_column("controls_total")
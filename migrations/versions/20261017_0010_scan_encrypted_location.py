@@ -0,0 +1,26 @@
+"""encrypted scan source location
+
+Revision ID: 0010
+Revises: 0009
+Create Date: 2026-10-17 10:41:05.227816
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0010"
+down_revision: Union[str, None] = "0009"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.add_column("data_discovery_scans", sa.Column("encrypted_location", sa.Text(), nullable=True))
+
+
+def downgrade() -> None:
+    with op.batch_alter_table("data_discovery_scans") as batch_op:
+        batch_op.drop_column("encrypted_location")
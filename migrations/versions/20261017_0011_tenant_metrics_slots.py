@@ -0,0 +1,49 @@
+"""tenant metrics slots
+
+Revision ID: 0011
+Revises: 0010
+Create Date: 2026-10-17 11:52:37.604118
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0011"
+down_revision: Union[str, None] = "0010"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    # Existing rows become slot 0; the other slots are created by the next reconcile.
+    postgres = op.get_bind().dialect.name == "postgresql"
+    with op.batch_alter_table("tenant_metrics") as batch_op:
+        batch_op.add_column(
+            sa.Column("slot", sa.Integer(), nullable=False, server_default=sa.text("0"))
+        )
+        if postgres:
+            batch_op.drop_constraint("tenant_metrics_pkey", type_="primary")
+        batch_op.create_primary_key("tenant_metrics_pkey", ["tenant_id", "slot"])
+        batch_op.drop_column("upcoming_deadlines")
+    with op.batch_alter_table("tenant_metrics") as batch_op:
+        batch_op.alter_column("slot", server_default=None)
+    op.create_index("ix_assessments_tenant_due", "assessments", ["tenant_id", "due_date"])
+
+
+def downgrade() -> None:
+    op.drop_index("ix_assessments_tenant_due", table_name="assessments")
+    op.execute("DELETE FROM tenant_metrics WHERE slot <> 0")
+    postgres = op.get_bind().dialect.name == "postgresql"
+    with op.batch_alter_table("tenant_metrics") as batch_op:
+        batch_op.add_column(
+            sa.Column(
+                "upcoming_deadlines", sa.BigInteger(), nullable=False, server_default=sa.text("0")
+            )
+        )
+        if postgres:
+            batch_op.drop_constraint("tenant_metrics_pkey", type_="primary")
+        batch_op.create_primary_key("tenant_metrics_pkey", ["tenant_id"])
+        batch_op.drop_column("slot")
@@ -0,0 +1,34 @@
+"""audit_logs default partition
+
+Revision ID: 0012
+Revises: 0011
+Create Date: 2026-10-17 12:36:18.941027
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0012"
+down_revision: Union[str, None] = "0011"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    op.execute("CREATE TABLE IF NOT EXISTS audit_logs_default PARTITION OF audit_logs DEFAULT")
+
+
+def downgrade() -> None:
+    if op.get_bind().dialect.name != "postgresql":
+        return
+    rows = op.get_bind().scalar(sa.text("SELECT count(*) FROM audit_logs_default"))
+    if rows:
+        raise RuntimeError(
+            f"audit_logs_default holds {rows} rows; create partitions for them first"
+        )
+    op.execute("DROP TABLE audit_logs_default")
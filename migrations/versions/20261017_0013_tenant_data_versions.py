@@ -0,0 +1,49 @@
+"""move tenant data version to its own table
+
+Revision ID: 0013
+Revises: 0012
+Create Date: 2026-10-17 13:14:52.380664
+"""
+
+from typing import Sequence, Union
+
+from alembic import op
+import sqlalchemy as sa
+
+
+revision: str = "0013"
+down_revision: Union[str, None] = "0012"
+branch_labels: Union[str, Sequence[str], None] = None
+depends_on: Union[str, Sequence[str], None] = None
+
+
+def upgrade() -> None:
+    op.create_table(
+        "tenant_data_versions",
+        sa.Column("tenant_id", sa.String(length=36), nullable=False),
+        sa.Column("version", sa.BigInteger(), nullable=False),
+        sa.ForeignKeyConstraint(
+            ["tenant_id"],
+            ["tenants.id"],
+        ),
+        sa.PrimaryKeyConstraint("tenant_id"),
+    )
+    op.execute(
+        "INSERT INTO tenant_data_versions (tenant_id, version) "
+        "SELECT id, data_version FROM tenants WHERE data_version > 0"
+    )
+    with op.batch_alter_table("tenants") as batch_op:
+        batch_op.drop_column("data_version")
+
+
+def downgrade() -> None:
+    op.add_column(
+        "tenants",
+        sa.Column("data_version", sa.BigInteger(), nullable=False, server_default="0"),
+    )
+    op.execute(
+        "UPDATE tenants SET data_version = (SELECT version FROM tenant_data_versions "
+        "WHERE tenant_data_versions.tenant_id = tenants.id) "
+        "WHERE id IN (SELECT tenant_id FROM tenant_data_versions)"
+    )
+    op.drop_table("tenant_data_versions")
@@ -4,12 +4,16 @@ from uuid import uuid4
 from fastapi import APIRouter, Depends, HTTPException, status
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm.attributes import flag_modified
 
 from src.core.database import get_db
 from src.core.logging import get_logger
 from src.models.user import User
 from src.models.assessment import Assessment, Framework
+from src.services.audit import record_audit
 from src.services.auth import get_current_user
+from src.services.frameworks.registry import FRAMEWORK_REGISTRY, catalog_name
+from src.services.metrics import metrics_of, update_tenant_metrics
 from src.schemas.framework import (
     AssessmentUpdate,
     AssessmentResponse,
@@ -38,6 +42,7 @@ async def update_assessment(
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
+    before = metrics_of(assessment)
     if update_data.name is not None:
         assessment.name = update_data.name
     if update_data.description is not None:
@@ -46,8 +51,18 @@ async def update_assessment(
         assessment.due_date = update_data.due_date
     if update_data.status is not None:
         assessment.status = update_data.status
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="assessment.updated",
+        resource_type="assessment",
+        resource_id=assessment.id,
+        details={"fields": sorted(update_data.model_dump(exclude_none=True))},
+    )
 
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, before, metrics_of(assessment))
     await db.refresh(assessment)
     return AssessmentResponse.from_orm(assessment)
 
@@ -71,9 +86,19 @@ async def start_assessment(
     if assessment.status != "draft":
         raise HTTPException(status_code=400, detail="Assessment already started")
 
+    before = metrics_of(assessment)
     assessment.status = "in_progress"
     assessment.started_at = datetime.utcnow()
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="assessment.started",
+        resource_type="assessment",
+        resource_id=assessment.id,
+    )
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, before, metrics_of(assessment))
 
     return {"message": "Assessment started", "assessment_id": assessment_id}
 
@@ -95,21 +120,69 @@ async def submit_control_status(
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
+    framework = await db.get(Framework, assessment.framework_id)
+    catalog = catalog_name(framework.framework_type if framework else None)
+    columns = FRAMEWORK_REGISTRY[catalog] if catalog else None
+    if columns is not None:
+        unknown = [
+            c.control_id for c in controls_data.controls if c.control_id not in columns.index
+        ]
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown {catalog} controls: {', '.join(unknown)}",
+            )
+        unknown = {
+            item
+            for c in controls_data.controls
+            for item in c.evidence or []
+            if item not in columns.evidence_fields
+        }
+        if unknown:
+            raise HTTPException(
+                status_code=400,
+                detail=f"Unknown {catalog} evidence: {', '.join(sorted(unknown))}; "
+                f"expected any of {', '.join(columns.evidence_fields)}",
+            )
+    elif any(c.status is None for c in controls_data.controls):
+        raise HTTPException(status_code=400, detail="status is required for every control")
+
+    # Only the submitted controls are touched: the counters move by delta and the JSON
+    # column is flagged dirty instead of being copied or re-counted.
     current_controls = assessment.controls_status or {}
+    total, compliant = assessment.controls_total or 0, assessment.controls_compliant or 0
     for control in controls_data.controls:
-        current_controls[control.control_id] = {
+        entry = {
             "status": control.status,
             "evidence": control.evidence,
             "notes": control.notes,
         }
+        if columns is not None:
+            result = columns.assess(
+                control.control_id, {item: True for item in control.evidence or []}
+            )
+            entry["status"], entry["score"] = result["status"], result["score"]
+
+        previous = current_controls.get(control.control_id)
+        if previous is None:
+            total += 1
+        elif previous.get("status") == "compliant":
+            compliant -= 1
+        compliant += entry["status"] == "compliant"
+        current_controls[control.control_id] = entry
 
     assessment.controls_status = current_controls
-    total_controls = len(current_controls)
-    completed_controls = len(
-        [c for c in current_controls.values() if c.get("status") == "compliant"]
-    )
-    assessment.progress = int(
-        (completed_controls / total_controls * 100) if total_controls > 0 else 0
+    flag_modified(assessment, "controls_status")
+    assessment.controls_total, assessment.controls_compliant = total, compliant
+    assessment.progress = int((compliant / total * 100) if total > 0 else 0)
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="assessment.controls_submitted",
+        resource_type="assessment",
+        resource_id=assessment.id,
+        details={"controls": [c.control_id for c in controls_data.controls]},
     )
 
     await db.flush()
@@ -136,12 +209,12 @@ async def complete_assessment(
     if assessment.status != "in_progress":
         raise HTTPException(status_code=400, detail="Assessment not in progress")
 
+    before = metrics_of(assessment)
     assessment.status = "completed"
     assessment.completed_at = datetime.utcnow()
 
     controls = assessment.controls_status or {}
-    total = len(controls)
-    compliant = len([c for c in controls.values() if c.get("status") == "compliant"])
+    total, compliant = assessment.controls_total or 0, assessment.controls_compliant or 0
     assessment.score = int((compliant / total * 100) if total > 0 else 0)
 
     findings = []
@@ -155,8 +228,18 @@ async def complete_assessment(
                 }
             )
     assessment.findings = findings
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="assessment.completed",
+        resource_type="assessment",
+        resource_id=assessment.id,
+        details={"score": assessment.score},
+    )
 
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, before, metrics_of(assessment))
     await db.refresh(assessment)
     return AssessmentResponse.from_orm(assessment)
 
@@ -177,7 +260,16 @@ async def delete_assessment(
     if not assessment:
         raise HTTPException(status_code=404, detail="Assessment not found")
 
+    await update_tenant_metrics(db, current_user.tenant_id, metrics_of(assessment), {})
     await db.delete(assessment)
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="assessment.deleted",
+        resource_type="assessment",
+        resource_id=assessment_id,
+    )
     await db.commit()
 
     return {"message": "Assessment deleted"}
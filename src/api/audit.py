@@ -0,0 +1,135 @@
+from datetime import datetime
+
+from fastapi import APIRouter, Depends, HTTPException, Request
+from fastapi.responses import StreamingResponse
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.database import get_db
+from src.core.logging import get_logger
+from src.models.user import User
+from src.models.audit import AuditLog
+from src.services.audit import (
+    EXPORT_MEDIA_TYPES,
+    audit_log_query,
+    record_audit,
+    stream_audit_export,
+)
+from src.services.audit_chain import AuditWindowTooLarge, verify_audit_window
+from src.services.auth import get_current_user
+from src.services.pagination import PaginationError, fetch_page
+from src.schemas.audit import (
+    AuditChainVerificationResponse,
+    AuditLogListResponse,
+    AuditLogResponse,
+)
+
+logger = get_logger(__name__)
+router = APIRouter()
+
+AUDIT_READER_ROLES = {"admin", "auditor"}
+
+
+def require_audit_reader(current_user: User = Depends(get_current_user)) -> User:
+    if current_user.role not in AUDIT_READER_ROLES:
+        raise HTTPException(status_code=403, detail="Audit log access requires an auditor role")
+    return current_user
+
+
+@router.get("", response_model=AuditLogListResponse)
+async def list_audit_logs(
+    user_id: str = None,
+    action: str = None,
+    resource_type: str = None,
+    resource_id: str = None,
+    since: datetime = None,
+    until: datetime = None,
+    page: int = 1,
+    page_size: int = 50,
+    cursor: str = None,
+    total: str = "none",
+    current_user: User = Depends(require_audit_reader),
+    db: AsyncSession = Depends(get_db),
+):
+    query = audit_log_query(
+        current_user.tenant_id, user_id, action, resource_type, resource_id, since, until
+    )
+    try:
+        entries, next_cursor, count = await fetch_page(
+            db, query, AuditLog, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
+    return AuditLogListResponse(
+        entries=[AuditLogResponse.from_orm(e) for e in entries],
+        total=count,
+        next_cursor=next_cursor,
+    )
+
+
+@router.get("/export")
+async def export_audit_logs(
+    request: Request,
+    format: str = "ndjson",
+    user_id: str = None,
+    action: str = None,
+    resource_type: str = None,
+    resource_id: str = None,
+    since: datetime = None,
+    until: datetime = None,
+    current_user: User = Depends(require_audit_reader),
+    db: AsyncSession = Depends(get_db),
+):
+    if format not in EXPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400, detail=f"format must be one of {', '.join(EXPORT_MEDIA_TYPES)}"
+        )
+
+    filters = {
+        "user_id": user_id,
+        "action": action,
+        "resource_type": resource_type,
+        "resource_id": resource_id,
+        "since": since.isoformat() if since else None,
+        "until": until.isoformat() if until else None,
+    }
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="audit.exported",
+        resource_type="audit_log",
+        details={"format": format, **{k: v for k, v in filters.items() if v}},
+        request=request,
+    )
+
+    query = audit_log_query(
+        current_user.tenant_id, user_id, action, resource_type, resource_id, since, until
+    )
+    filename = f"audit_log_{datetime.utcnow():%Y%m%dT%H%M%S}.{format}"
+    return StreamingResponse(
+        stream_audit_export(query, format),
+        media_type=EXPORT_MEDIA_TYPES[format],
+        headers={"Content-Disposition": f"attachment; filename={filename}"},
+    )
+
+
+@router.get("/verify", response_model=AuditChainVerificationResponse)
+async def verify_audit_chain(
+    since: datetime = None,
+    until: datetime = None,
+    current_user: User = Depends(require_audit_reader),
+    db: AsyncSession = Depends(get_db),
+):
+    try:
+        result = await verify_audit_window(db, current_user.tenant_id, since, until)
+    except AuditWindowTooLarge as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if not result["valid"]:
+        logger.error(
+            "Audit chain verification failed",
+            tenant_id=current_user.tenant_id,
+            error=result["error"],
+            seq=result["error_seq"],
+        )
+    return AuditChainVerificationResponse(**result)
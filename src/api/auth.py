@@ -9,7 +9,6 @@ from src.core.config import settings
 from src.core.database import get_db
 from src.core.logging import get_logger
 from src.models.user import Tenant, User
-from src.models.audit import AuditLog
 from src.services.auth import (
     authenticate_user,
     create_access_token,
@@ -17,12 +16,18 @@ from src.services.auth import (
     create_refresh_token_record,
     create_user,
     decode_token,
+    get_user_by_id,
     revoke_refresh_token,
     validate_refresh_token,
     get_current_user,
+    get_current_user_record,
+    get_token_payload,
     hash_password,
     verify_password,
 )
+from src.services.audit import record_audit
+from src.services.hashing import run_hash
+from src.services.revocation import revoke, token_member
 from src.schemas.auth import (
     LoginRequest,
     LoginResponse,
@@ -30,6 +35,7 @@ from src.schemas.auth import (
     RegisterResponse,
     RefreshTokenRequest,
     Token,
+    TokenPayload,
     UserResponse,
     PasswordChangeRequest,
 )
@@ -75,17 +81,13 @@ async def login(
     user.last_login = datetime.utcnow()
     await db.flush()
 
-    await db.execute(
-        AuditLog.__table__.insert().values(
-            AuditLog.create_entry(
-                tenant_id=user.tenant_id,
-                user_id=user.id,
-                action="user.login",
-                details={"email": user.email},
-                ip_address=request.client.host if request.client else None,
-                user_agent=request.headers.get("user-agent"),
-            ).__dict__
-        )
+    record_audit(
+        db,
+        tenant_id=user.tenant_id,
+        user_id=user.id,
+        action="user.login",
+        details={"email": user.email},
+        request=request,
     )
     await db.commit()
 
@@ -225,29 +227,24 @@ async def refresh_token(
 @router.post("/logout")
 async def logout(
     refresh_data: RefreshTokenRequest,
+    payload: TokenPayload = Depends(get_token_payload),
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     await revoke_refresh_token(db, refresh_data.refresh_token)
-    await db.commit()
-
-    await db.execute(
-        AuditLog.__table__.insert().values(
-            AuditLog.create_entry(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                action="user.logout",
-            ).__dict__
-        )
+    record_audit(
+        db, tenant_id=current_user.tenant_id, user_id=current_user.id, action="user.logout"
     )
     await db.commit()
+    if payload.jti:
+        await revoke([token_member(payload.jti)])
 
     return {"message": "Successfully logged out"}
 
 
 @router.get("/me", response_model=UserResponse)
 async def get_me(
-    current_user: User = Depends(get_current_user),
+    current_user: User = Depends(get_current_user_record),
 ):
     return UserResponse.from_orm(current_user)
 
@@ -258,23 +255,21 @@ async def change_password(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    if not verify_password(password_data.current_password, current_user.password_hash):
+    user = await get_user_by_id(db, current_user.id)
+    if not await run_hash(
+        "verify", verify_password, password_data.current_password, user.password_hash
+    ):
         raise HTTPException(
             status_code=status.HTTP_400_BAD_REQUEST,
             detail="Current password is incorrect",
         )
 
-    current_user.password_hash = hash_password(password_data.new_password)
-    await db.commit()
-
-    await db.execute(
-        AuditLog.__table__.insert().values(
-            AuditLog.create_entry(
-                tenant_id=current_user.tenant_id,
-                user_id=current_user.id,
-                action="user.password_changed",
-            ).__dict__
-        )
+    user.password_hash = await run_hash("hash", hash_password, password_data.new_password)
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="user.password_changed",
     )
     await db.commit()
 
@@ -3,10 +3,11 @@ from uuid import uuid4
 import hashlib
 import secrets
 
-from fastapi import APIRouter, Depends, HTTPException, status, Request
+from fastapi import APIRouter, Depends, HTTPException, status, Request, Response
 from sqlalchemy import select, func
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.celery import celery_app
 from src.core.database import get_db
 from src.core.logging import get_logger
 from src.models.user import User
@@ -17,7 +18,18 @@ from src.models.assessment import (
     DSRRequest,
     DataDiscoveryScan,
 )
+from src.services.audit import record_audit
 from src.services.auth import get_current_user
+from src.services.crypto import encrypt_secret
+from src.services.metrics import get_tenant_metrics, metrics_of, update_tenant_metrics
+from src.services.pagination import (
+    NEXT_CURSOR_HEADER,
+    TOTAL_COUNT_HEADER,
+    PaginationError,
+    fetch_page,
+)
+from src.services.pii import ScanSourceError, check_source
+from src.services.tasks.dpdpa import process_pii_scan
 from src.schemas.dpdpa import (
     DataDiscoveryScanRequest,
     DataDiscoveryScanResponse,
@@ -34,110 +46,128 @@ from src.schemas.dpdpa import (
 logger = get_logger(__name__)
 router = APIRouter()
 
-PII_TYPES = [
-    "PERSON_NAME",
-    "PHONE_NUMBER",
-    "EMAIL_ADDRESS",
-    "AADHAAR_NUMBER",
-    "PAN_NUMBER",
-    "PASSPORT_NUMBER",
-    "CREDIT_CARD_NUMBER",
-    "BANK_ACCOUNT_NUMBER",
-    "DATE_OF_BIRTH",
-    "ADDRESS",
-    "PIN_CODE",
-]
-
-
-def simulate_pii_scan(source_type: str):
-    import random
-
-    pii_found = []
-    for pii_type in random.sample(PII_TYPES, k=random.randint(2, 6)):
-        pii_found.append(
-            {
-                "type": pii_type,
-                "count": random.randint(10, 10000),
-                "risk_level": random.choice(["low", "medium", "high"]),
-            }
-        )
-    risk_score = sum(
-        {"low": 10, "medium": 30, "high": 50}[p["risk_level"]] for p in pii_found
-    ) // max(len(pii_found), 1)
-    return pii_found, risk_score
-
 
-@router.post("/scan", response_model=DataDiscoveryScanResponse)
+@router.post("/scan", response_model=DataDiscoveryScanResponse, status_code=202)
 async def start_data_discovery_scan(
     scan_request: DataDiscoveryScanRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
+    try:
+        check_source(
+            scan_request.source_type,
+            scan_request.connection_string,
+            scan_request.scan_config,
+        )
+    except ScanSourceError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+
     scan = DataDiscoveryScan(
         id=str(uuid4()),
         tenant_id=current_user.tenant_id,
         source_name=scan_request.source_name,
         source_type=scan_request.source_type,
-        status="running",
+        status="queued",
         scan_config=scan_request.scan_config or {},
+        encrypted_location=encrypt_secret(scan_request.connection_string),
         created_by=current_user.id,
-        started_at=datetime.utcnow(),
     )
     db.add(scan)
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, {}, metrics_of(scan))
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.scan_started",
+        resource_type="data_discovery_scan",
+        resource_id=scan.id,
+        details={"source_name": scan.source_name, "source_type": scan.source_type},
+    )
+    await db.commit()
 
-    pii_found, risk_score = simulate_pii_scan(scan_request.source_type)
-    scan.pii_found = pii_found
-    scan.risk_score = risk_score
-    scan.status = "completed"
-    scan.completed_at = datetime.utcnow()
+    process_pii_scan.apply_async(args=[scan.id], task_id=scan.id)
 
-    await db.flush()
-    await db.refresh(scan)
-
-    return DataDiscoveryScanResponse(
-        id=scan.id,
-        source_name=scan.source_name,
-        source_type=scan.source_type,
-        status=scan.status,
-        pii_found=scan.pii_found,
-        risk_score=scan.risk_score,
-        data_flow=scan.data_flow,
-        started_at=scan.started_at,
-        completed_at=scan.completed_at,
-    )
+    return DataDiscoveryScanResponse.from_orm(scan)
 
 
 @router.get("/scans", response_model=list[DataDiscoveryScanResponse])
 async def list_discovery_scans(
+    response: Response,
     page: int = 1,
     page_size: int = 20,
+    cursor: str = None,
+    total: str = "none",
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    query = select(DataDiscoveryScan).where(DataDiscoveryScan.tenant_id == current_user.tenant_id)
+    try:
+        scans, next_cursor, count = await fetch_page(
+            db, query, DataDiscoveryScan, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(count)
+
+    return [DataDiscoveryScanResponse.from_orm(s) for s in scans]
+
+
+@router.get("/scans/{scan_id}", response_model=DataDiscoveryScanResponse)
+async def get_discovery_scan(
+    scan_id: str,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
     result = await db.execute(
-        select(DataDiscoveryScan)
-        .where(DataDiscoveryScan.tenant_id == current_user.tenant_id)
-        .order_by(DataDiscoveryScan.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
+        select(DataDiscoveryScan).where(
+            DataDiscoveryScan.id == scan_id,
+            DataDiscoveryScan.tenant_id == current_user.tenant_id,
+        )
     )
-    scans = result.scalars().all()
+    scan = result.scalar_one_or_none()
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
+    return DataDiscoveryScanResponse.from_orm(scan)
 
-    return [
-        DataDiscoveryScanResponse(
-            id=s.id,
-            source_name=s.source_name,
-            source_type=s.source_type,
-            status=s.status,
-            pii_found=s.pii_found,
-            risk_score=s.risk_score,
-            data_flow=s.data_flow,
-            started_at=s.started_at,
-            completed_at=s.completed_at,
+
+@router.post("/scans/{scan_id}/cancel", response_model=DataDiscoveryScanResponse)
+async def cancel_discovery_scan(
+    scan_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    result = await db.execute(
+        select(DataDiscoveryScan).where(
+            DataDiscoveryScan.id == scan_id,
+            DataDiscoveryScan.tenant_id == current_user.tenant_id,
         )
-        for s in scans
-    ]
+    )
+    scan = result.scalar_one_or_none()
+    if not scan:
+        raise HTTPException(status_code=404, detail="Scan not found")
+    if scan.status not in ["queued", "running"]:
+        raise HTTPException(status_code=400, detail=f"Scan already {scan.status}")
+
+    scan.cancel_requested = True
+    if scan.status == "queued":
+        celery_app.control.revoke(scan.id)
+        scan.status = "cancelled"
+        scan.completed_at = datetime.utcnow()
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.scan_cancelled",
+        resource_type="data_discovery_scan",
+        resource_id=scan.id,
+    )
+    await db.commit()
+
+    return DataDiscoveryScanResponse.from_orm(scan)
 
 
 @router.post("/consent/session", response_model=ConsentSessionResponse)
@@ -148,6 +178,15 @@ async def create_consent_session(
 ):
     session_id = str(uuid4())
     expires_at = datetime.utcnow() + timedelta(hours=24)
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.consent_session_created",
+        resource_type="consent_session",
+        resource_id=session_id,
+        details={"purposes": session_data.purposes},
+    )
 
     consent_url = f"/consent/{session_id}?purpose={','.join(session_data.purposes)}"
 
@@ -184,6 +223,18 @@ async def record_consent(
         user_agent=request.headers.get("user-agent"),
     )
     db.add(record)
+    await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, {}, metrics_of(record))
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.consent_recorded",
+        resource_type="consent_record",
+        resource_id=record.id,
+        details={"granted": consent_data.granted},
+        request=request,
+    )
     await db.commit()
 
     return {"message": "Consent recorded", "consent_proof": consent_proof}
@@ -191,9 +242,12 @@ async def record_consent(
 
 @router.get("/consent", response_model=list[ConsentRecordResponse])
 async def list_consent_records(
+    response: Response,
     data_subject_id: str = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str = None,
+    total: str = "none",
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -203,12 +257,16 @@ async def list_consent_records(
     if data_subject_id:
         query = query.where(ConsentRecord.data_subject_id == data_subject_id)
 
-    result = await db.execute(
-        query.order_by(ConsentRecord.created_at.desc())
-        .offset((page - 1) * page_size)
-        .limit(page_size)
-    )
-    records = result.scalars().all()
+    try:
+        records, next_cursor, count = await fetch_page(
+            db, query, ConsentRecord, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(count)
 
     return [
         ConsentRecordResponse(
@@ -246,6 +304,16 @@ async def create_dsr_request(
     )
     db.add(dsr)
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, {}, metrics_of(dsr))
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.dsr_created",
+        resource_type="dsr_request",
+        resource_id=dsr.id,
+        details={"request_type": dsr.request_type},
+    )
     await db.refresh(dsr)
 
     return DSRResponse(
@@ -263,9 +331,12 @@ async def create_dsr_request(
 
 @router.get("/dsr", response_model=list[DSRResponse])
 async def list_dsr_requests(
+    response: Response,
     status: str = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str = None,
+    total: str = "none",
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -275,10 +346,16 @@ async def list_dsr_requests(
     if status:
         query = query.where(DSRRequest.status == status)
 
-    result = await db.execute(
-        query.order_by(DSRRequest.created_at.desc()).offset((page - 1) * page_size).limit(page_size)
-    )
-    dsrs = result.scalars().all()
+    try:
+        dsrs, next_cursor, count = await fetch_page(
+            db, query, DSRRequest, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
+    if next_cursor:
+        response.headers[NEXT_CURSOR_HEADER] = next_cursor
+    if count is not None:
+        response.headers[TOTAL_COUNT_HEADER] = str(count)
 
     return [
         DSRResponse(
@@ -344,6 +421,15 @@ async def verify_dsr_identity(
 
     dsr.identity_verified = True
     dsr.verification_method = verification_data.get("method", "email")
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.dsr_identity_verified",
+        resource_type="dsr_request",
+        resource_id=dsr.id,
+        details={"method": dsr.verification_method},
+    )
     await db.flush()
 
     return {"message": "Identity verified", "dsr_id": dsr_id}
@@ -369,10 +455,20 @@ async def process_dsr_request(
     if not dsr.identity_verified:
         raise HTTPException(status_code=400, detail="Identity not verified")
 
+    before = metrics_of(dsr)
     dsr.status = "completed"
     dsr.completed_at = datetime.utcnow()
     dsr.notes = process_data.notes or ""
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="dpdpa.dsr_processed",
+        resource_type="dsr_request",
+        resource_id=dsr.id,
+    )
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, before, metrics_of(dsr))
 
     return {"message": "DSR request processed", "dsr_id": dsr_id}
 
@@ -382,57 +478,32 @@ async def get_dpdashboard(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    scans_result = await db.execute(
-        select(DataDiscoveryScan).where(
-            DataDiscoveryScan.tenant_id == current_user.tenant_id,
-        )
-    )
-    scans = scans_result.scalars().all()
+    tenant_id = current_user.tenant_id
+    metrics = await get_tenant_metrics(db, tenant_id)
 
-    consent_result = await db.execute(
-        select(ConsentRecord).where(
-            ConsentRecord.tenant_id == current_user.tenant_id,
-        )
-    )
-    consents = consent_result.scalars().all()
-
-    dsr_result = await db.execute(
-        select(DSRRequest).where(
-            DSRRequest.tenant_id == current_user.tenant_id,
-        )
+    recent_result = await db.execute(
+        select(DataDiscoveryScan)
+        .where(DataDiscoveryScan.tenant_id == tenant_id)
+        .order_by(DataDiscoveryScan.created_at.desc())
+        .limit(5)
     )
-    dsrs = dsr_result.scalars().all()
+    recent_scans = recent_result.scalars().all()
 
-    total_pii = sum(sum(p.get("count", 0) for p in s.pii_found or []) for s in scans)
-    avg_risk = sum(s.risk_score for s in scans) / len(scans) if scans else 0
-    consent_rate = len([c for c in consents if c.consent_given]) / max(len(consents), 1) * 100
-    pending_dsrs = len([d for d in dsrs if d.status in ["pending", "in_progress"]])
-    dsr_compliance = len([d for d in dsrs if d.status == "completed"]) / max(len(dsrs), 1) * 100
+    avg_risk = metrics.scans_risk_sum / metrics.scans_total if metrics.scans_total else 0
+    consent_rate = metrics.consents_granted / max(metrics.consents_total, 1) * 100
+    dsr_compliance = metrics.dsrs_completed / max(metrics.dsrs_total, 1) * 100
 
     return DPDPDashboardResponse(
-        total_data_sources=len(scans),
-        total_pii_records=total_pii,
+        total_data_sources=metrics.scans_total,
+        total_pii_records=metrics.scans_pii_total,
         risk_score=int(avg_risk),
         consent_rate=round(consent_rate, 2),
-        pending_dsrs=pending_dsrs,
+        pending_dsrs=metrics.dsrs_pending,
         dsr_compliance_rate=round(dsr_compliance, 2),
-        recent_scans=[
-            DataDiscoveryScanResponse(
-                id=s.id,
-                source_name=s.source_name,
-                source_type=s.source_type,
-                status=s.status,
-                pii_found=s.pii_found,
-                risk_score=s.risk_score,
-                data_flow=s.data_flow,
-                started_at=s.started_at,
-                completed_at=s.completed_at,
-            )
-            for s in scans[:5]
-        ],
+        recent_scans=[DataDiscoveryScanResponse.from_orm(s) for s in recent_scans],
         consent_summary={
-            "total": len(consents),
-            "granted": len([c for c in consents if c.consent_given]),
-            "withdrawn": len([c for c in consents if c.withdrawn_at]),
+            "total": metrics.consents_total,
+            "granted": metrics.consents_granted,
+            "withdrawn": metrics.consents_withdrawn,
         },
     )
@@ -10,6 +10,13 @@ from src.core.logging import get_logger
 from src.models.user import Tenant, User
 from src.models.assessment import Framework, Assessment
 from src.services.auth import get_current_user
+from src.services.metrics import (
+    count_upcoming_deadlines,
+    get_tenant_metrics,
+    metrics_of,
+    update_tenant_metrics,
+)
+from src.services.pagination import PaginationError, fetch_page
 from src.schemas.framework import (
     FrameworkCreate,
     FrameworkResponse,
@@ -23,6 +30,8 @@ from src.schemas.framework import (
 logger = get_logger(__name__)
 router = APIRouter()
 
+RECENT_FINDINGS_LIMIT = 10
+
 
 @router.post("/frameworks", response_model=FrameworkResponse, status_code=201)
 async def create_framework(
@@ -50,6 +59,8 @@ async def list_frameworks(
     framework_type: str = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str = None,
+    total: str = "exact",
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -60,16 +71,17 @@ async def list_frameworks(
     if framework_type:
         query = query.where(Framework.framework_type == framework_type)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar_one()
-
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    result = await db.execute(query)
-    frameworks = result.scalars().all()
+    try:
+        frameworks, next_cursor, count = await fetch_page(
+            db, query, Framework, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return FrameworkListResponse(
         frameworks=[FrameworkResponse.from_orm(f) for f in frameworks],
-        total=total,
+        total=count,
+        next_cursor=next_cursor,
     )
 
 
@@ -121,6 +133,7 @@ async def create_assessment(
     )
     db.add(assessment)
     await db.flush()
+    await update_tenant_metrics(db, current_user.tenant_id, {}, metrics_of(assessment))
     await db.refresh(assessment)
     return AssessmentResponse.from_orm(assessment)
 
@@ -131,6 +144,8 @@ async def list_assessments(
     framework_id: str = None,
     page: int = 1,
     page_size: int = 20,
+    cursor: str = None,
+    total: str = "exact",
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
@@ -142,19 +157,19 @@ async def list_assessments(
     if framework_id:
         query = query.where(Assessment.framework_id == framework_id)
 
-    count_query = select(func.count()).select_from(query.subquery())
-    total = (await db.execute(count_query)).scalar_one()
-
-    query = query.order_by(Assessment.created_at.desc())
-    query = query.offset((page - 1) * page_size).limit(page_size)
-    result = await db.execute(query)
-    assessments = result.scalars().all()
+    try:
+        assessments, next_cursor, count = await fetch_page(
+            db, query, Assessment, page, page_size, cursor, total
+        )
+    except PaginationError as e:
+        raise HTTPException(status_code=400, detail=str(e))
 
     return AssessmentListResponse(
         assessments=[AssessmentResponse.from_orm(a) for a in assessments],
-        total=total,
+        total=count,
         page=page,
         page_size=page_size,
+        next_cursor=next_cursor,
     )
 
 
@@ -181,34 +196,33 @@ async def get_dashboard(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    assessments_result = await db.execute(
-        select(Assessment).where(
+    metrics = await get_tenant_metrics(db, current_user.tenant_id)
+    total = metrics.assessments_total
+    avg_score = metrics.assessments_score_sum / total if total > 0 else 0
+    compliance_rate = (metrics.assessments_completed / total * 100) if total > 0 else 0
+
+    findings_result = await db.execute(
+        select(Assessment.id, Assessment.name, Assessment.findings)
+        .where(
             Assessment.tenant_id == current_user.tenant_id,
+            func.json_array_length(Assessment.findings) > 0,
         )
+        .order_by(Assessment.updated_at.desc())
+        .limit(RECENT_FINDINGS_LIMIT)
     )
-    assessments = assessments_result.scalars().all()
-
-    total = len(assessments)
-    completed = len([a for a in assessments if a.status == "completed"])
-    in_progress = len([a for a in assessments if a.status == "in_progress"])
-
-    avg_score = sum(a.score for a in assessments) / total if total > 0 else 0
-    compliance_rate = (completed / total * 100) if total > 0 else 0
-
-    upcoming_deadlines = len(
-        [
-            a
-            for a in assessments
-            if a.due_date and a.due_date > datetime.utcnow() and a.status != "completed"
-        ]
-    )
+    recent_findings = [
+        {**finding, "assessment_id": assessment_id, "assessment_name": name}
+        for assessment_id, name, findings in findings_result.all()
+        for finding in reversed(findings[-RECENT_FINDINGS_LIMIT:])
+        if isinstance(finding, dict)
+    ][:RECENT_FINDINGS_LIMIT]
 
     return DashboardMetrics(
         total_assessments=total,
-        completed_assessments=completed,
-        in_progress_assessments=in_progress,
+        completed_assessments=metrics.assessments_completed,
+        in_progress_assessments=metrics.assessments_in_progress,
         average_score=round(avg_score, 2),
         compliance_rate=round(compliance_rate, 2),
-        upcoming_deadlines=upcoming_deadlines,
-        recent_findings=[],
+        upcoming_deadlines=await count_upcoming_deadlines(db, current_user.tenant_id),
+        recent_findings=recent_findings,
     )
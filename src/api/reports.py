@@ -1,87 +1,137 @@
-from datetime import datetime
+from datetime import datetime, timedelta
 from uuid import uuid4
-import json
-import io
-from fastapi import APIRouter, Depends, HTTPException, status
+
+from fastapi import APIRouter, Depends, HTTPException, Request, Response
 from fastapi.responses import StreamingResponse
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
+from src.core.config import settings
 from src.core.database import get_db
 from src.core.logging import get_logger
 from src.models.user import User
 from src.models.assessment import Assessment, Framework
+from src.models.report import Report
+from src.services.audit import record_audit
 from src.services.auth import get_current_user
+from src.services.report_cache import find_cached_report
+from src.services.report_renderers import REPORT_MEDIA_TYPES
+from src.services.reports import REPORT_TEMPLATES
+from src.services.storage import get_storage
+from src.services.tasks.reports import generate_compliance_report
 from src.schemas.dpdpa import ComplianceReportRequest, ComplianceReportResponse
 
 logger = get_logger(__name__)
 router = APIRouter()
 
 
-@router.post("/generate", response_model=ComplianceReportResponse)
+async def get_report(db: AsyncSession, report_id: str, tenant_id: str) -> Report:
+    result = await db.execute(
+        select(Report).where(Report.id == report_id, Report.tenant_id == tenant_id)
+    )
+    report = result.scalar_one_or_none()
+    if not report:
+        raise HTTPException(status_code=404, detail="Report not found")
+    return report
+
+
+@router.post("/generate", response_model=ComplianceReportResponse, status_code=202)
 async def generate_report(
     report_data: ComplianceReportRequest,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    report_id = str(uuid4())
-    expires_at = datetime.utcnow()
-
-    if report_data.format == "pdf":
-        expires_at = expires_at
-    else:
-        expires_at = expires_at
-
-    return ComplianceReportResponse(
-        report_id=report_id,
-        download_url=f"/api/v1/reports/download/{report_id}",
-        expires_at=expires_at,
+    if report_data.report_type not in REPORT_TEMPLATES:
+        raise HTTPException(
+            status_code=400,
+            detail=f"report_type must be one of {', '.join(REPORT_TEMPLATES)}",
+        )
+    if report_data.format not in REPORT_MEDIA_TYPES:
+        raise HTTPException(
+            status_code=400, detail=f"format must be one of {', '.join(REPORT_MEDIA_TYPES)}"
+        )
+    for model, object_id in (
+        (Framework, report_data.framework_id),
+        (Assessment, report_data.assessment_id),
+    ):
+        if object_id and not await db.scalar(
+            select(model.id).where(model.id == object_id, model.tenant_id == current_user.tenant_id)
+        ):
+            raise HTTPException(status_code=404, detail=f"{model.__name__} not found")
+
+    now = datetime.utcnow()
+    report = Report(
+        id=str(uuid4()),
+        tenant_id=current_user.tenant_id,
+        report_type=report_data.report_type,
+        format=report_data.format,
+        framework_id=report_data.framework_id,
+        assessment_id=report_data.assessment_id,
+        start_date=report_data.start_date,
+        end_date=report_data.end_date,
+        status="queued",
+        created_by=current_user.id,
+        expires_at=now + timedelta(hours=settings.REPORT_TTL_HOURS),
     )
+    # An identical request since the tenant's data last changed reuses that report,
+    # whether it is still rendering or already stored.
+    report.cache_key, cached = await find_cached_report(db, report, now)
+    if cached is None:
+        db.add(report)
+    record_audit(
+        db,
+        tenant_id=current_user.tenant_id,
+        user_id=current_user.id,
+        action="report.requested",
+        resource_type="report",
+        resource_id=(cached or report).id,
+        details={
+            "report_type": report.report_type,
+            "format": report.format,
+            "cached": cached is not None,
+        },
+    )
+    await db.commit()
+
+    if cached is not None:
+        return ComplianceReportResponse.from_orm(cached, cached=True)
+    generate_compliance_report.apply_async(args=[report.id], task_id=report.id)
+    return ComplianceReportResponse.from_orm(report)
 
 
 @router.get("/download/{report_id}")
 async def download_report(
     report_id: str,
+    request: Request,
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
 ):
-    result = await db.execute(
-        select(Assessment).where(
-            Assessment.tenant_id == current_user.tenant_id,
-        )
-    )
-    assessments = result.scalars().all()
-
-    report_data = {
-        "report_id": report_id,
-        "generated_at": datetime.utcnow().isoformat(),
-        "tenant_id": current_user.tenant_id,
-        "summary": {
-            "total_assessments": len(assessments),
-            "completed": len([a for a in assessments if a.status == "completed"]),
-            "in_progress": len([a for a in assessments if a.status == "in_progress"]),
-            "average_score": sum(a.score for a in assessments) / max(len(assessments), 1),
-        },
-        "assessments": [
-            {
-                "name": a.name,
-                "status": a.status,
-                "score": a.score,
-                "progress": a.progress,
-                "completed_at": a.completed_at.isoformat() if a.completed_at else None,
-            }
-            for a in assessments
-        ],
-    }
+    report = await get_report(db, report_id, current_user.tenant_id)
+    if report.status == "expired" or report.expires_at <= datetime.utcnow():
+        raise HTTPException(status_code=410, detail="Report has expired")
+    if report.status != "completed":
+        raise HTTPException(status_code=409, detail=f"Report is {report.status}")
 
-    output = io.StringIO()
-    json.dump(report_data, output, indent=2)
-    output.seek(0)
+    # The artifact never changes once written, so it can be cached until it expires.
+    max_age = int((report.expires_at - datetime.utcnow()).total_seconds())
+    headers = {
+        "ETag": f'"{report.etag}"',
+        "Cache-Control": f"private, max-age={max_age}",
+    }
+    if request.headers.get("if-none-match") == headers["ETag"]:
+        return Response(status_code=304, headers=headers)
 
+    storage = get_storage()
+    if not storage.exists(report.storage_key):
+        raise HTTPException(status_code=410, detail="Report artifact is no longer available")
+    headers["Content-Length"] = str(report.size_bytes)
+    headers["Content-Disposition"] = (
+        f"attachment; filename=compliance_report_{report.id}.{report.format}"
+    )
     return StreamingResponse(
-        iter([output.getvalue()]),
-        media_type="application/json",
-        headers={"Content-Disposition": f"attachment; filename=compliance_report_{report_id}.json"},
+        storage.iter_chunks(report.storage_key),
+        media_type=REPORT_MEDIA_TYPES[report.format],
+        headers=headers,
     )
 
 
@@ -89,25 +139,15 @@ async def download_report(
 async def list_report_templates(
     current_user: User = Depends(get_current_user),
 ):
-    return [
-        {
-            "id": "executive_summary",
-            "name": "Executive Summary",
-            "description": "High-level compliance overview",
-        },
-        {
-            "id": "detailed_assessment",
-            "name": "Detailed Assessment",
-            "description": "Full assessment report with findings",
-        },
-        {
-            "id": "gap_analysis",
-            "name": "Gap Analysis",
-            "description": "Control gaps and remediation priorities",
-        },
-        {
-            "id": "sla_compliance",
-            "name": "SLA Compliance",
-            "description": "DSR and compliance deadline tracking",
-        },
-    ]
+    return [{"id": template_id, **template} for template_id, template in REPORT_TEMPLATES.items()]
+
+
+@router.get("/{report_id}", response_model=ComplianceReportResponse)
+async def get_report_status(
+    report_id: str,
+    current_user: User = Depends(get_current_user),
+    db: AsyncSession = Depends(get_db),
+):
+    return ComplianceReportResponse.from_orm(
+        await get_report(db, report_id, current_user.tenant_id)
+    )
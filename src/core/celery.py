@@ -1,5 +1,6 @@
 import os
 from celery import Celery
+from celery.signals import worker_process_init
 
 from src.core.config import settings
 
@@ -11,6 +12,8 @@ celery_app = Celery(
     backend=settings.CELERY_RESULT_URL,
     include=[
         "src.services.tasks.dpdpa",
+        "src.services.tasks.metrics",
+        "src.services.tasks.audit",
         "src.services.tasks.reports",
         "src.services.tasks.notifications",
     ],
@@ -29,6 +32,12 @@ celery_app.conf.update(
     task_acks_late=True,
     task_reject_on_worker_lost=True,
     result_expires=60 * 60 * 24,
+    task_routes={
+        "src.services.tasks.dpdpa.process_pii_scan": {"queue": settings.PII_SCAN_QUEUE},
+        "src.services.tasks.dpdpa.scan_pii_shard": {"queue": settings.PII_SCAN_QUEUE},
+        "src.services.tasks.dpdpa.merge_pii_scan_shards": {"queue": settings.PII_SCAN_QUEUE},
+        "src.services.tasks.dpdpa.fail_pii_scan": {"queue": settings.PII_SCAN_QUEUE},
+    },
     beat_schedule={
         "cleanup-expired-sessions": {
             "task": "src.services.tasks.cleanup_expired_sessions",
@@ -38,6 +47,22 @@ celery_app.conf.update(
             "task": "src.services.tasks.check_dsr_deadlines",
             "schedule": 60 * 60,
         },
+        "reconcile-tenant-metrics": {
+            "task": "src.services.tasks.metrics.reconcile_tenant_metrics",
+            "schedule": settings.TENANT_METRICS_RECONCILE_SECONDS,
+        },
+        "maintain-audit-partitions": {
+            "task": "src.services.tasks.audit.maintain_audit_partitions",
+            "schedule": settings.AUDIT_PARTITION_MAINTENANCE_SECONDS,
+        },
+        "verify-audit-chains": {
+            "task": "src.services.tasks.audit.verify_audit_log_chains",
+            "schedule": settings.AUDIT_VERIFY_SECONDS,
+        },
+        "purge-expired-reports": {
+            "task": "src.services.tasks.reports.purge_expired_reports",
+            "schedule": settings.REPORT_PURGE_SECONDS,
+        },
     },
 )
 
@@ -47,5 +72,13 @@ def setup_periodic_tasks(sender, **kwargs):
     pass
 
 
+@worker_process_init.connect
+def load_pii_models(**kwargs):
+    if settings.PII_NER_ENABLED:
+        from src.services.pii.ner import load_ner_model
+
+        load_ner_model()
+
+
 def get_celery_app() -> Celery:
     return celery_app
@@ -1,21 +1,29 @@
+from functools import lru_cache
 from typing import Any, AsyncGenerator
 
+from sqlalchemy import Engine, create_engine
 from sqlalchemy.ext.asyncio import (
     AsyncEngine,
     AsyncSession,
     async_sessionmaker,
     create_async_engine,
 )
-from sqlalchemy.orm import declarative_base
+from sqlalchemy.orm import Session, declarative_base, sessionmaker
 
 from src.core.config import settings
 
+
+def _pool_options(url: str, pool_size: int, max_overflow: int) -> dict:
+    if url.startswith("sqlite"):
+        return {}
+    return {"pool_size": pool_size, "max_overflow": max_overflow}
+
+
 engine: AsyncEngine = create_async_engine(
     settings.async_database_url,
     echo=settings.APP_DEBUG,
     pool_pre_ping=True,
-    pool_size=10,
-    max_overflow=20,
+    **_pool_options(settings.async_database_url, 10, 20),
 )
 
 async_session_maker = async_sessionmaker(
@@ -29,6 +37,19 @@ async_session_maker = async_sessionmaker(
 Base = declarative_base()
 
 
+@lru_cache()
+def get_sync_engine() -> Engine:
+    return create_engine(
+        settings.sync_database_url,
+        pool_pre_ping=True,
+        **_pool_options(settings.sync_database_url, 5, 10),
+    )
+
+
+def get_sync_session() -> Session:
+    return sessionmaker(get_sync_engine(), expire_on_commit=False, autoflush=False)()
+
+
 async def get_db() -> AsyncGenerator[AsyncSession, None]:
     async with async_session_maker() as session:
         try:
@@ -1,18 +1,31 @@
+import asyncio
+
 from fastapi import FastAPI, Request, status
 from fastapi.middleware.cors import CORSMiddleware
 from fastapi.middleware.trustedhost import TrustedHostMiddleware
 from fastapi.responses import JSONResponse
 from prometheus_fastapi_instrumentator import Instrumentator
-from contextlib import asynccontextmanager
+from contextlib import asynccontextmanager, suppress
 
 from src.core.config import settings
 from src.core.logging import get_logger
+from src.core.redis import close_redis
 from src.api.health import router as health_router
 from src.api.auth import router as auth_router
 from src.api.dpdpa import router as dpdpa_router
 from src.api.frameworks import router as frameworks_router
 from src.api.assessments import router as assessments_router
 from src.api.reports import router as reports_router
+from src.api.audit import router as audit_router
+from src.services.audit import drain_audit_log, run_audit_writer
+from src.services.hashing import (
+    HashPoolSaturated,
+    configure_password_hashing,
+    shutdown_hash_pool,
+)
+from src.services.pagination import NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER
+from src.services.principals import listen_for_principal_invalidations
+from src.services.revocation import sync_revocations
 
 logger = get_logger(__name__)
 
@@ -20,7 +33,20 @@ logger = get_logger(__name__)
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     logger.info("Starting Compliance Platform", env=settings.APP_ENV)
+    await configure_password_hashing()
+    background = [asyncio.create_task(run_audit_writer())]
+    if settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        background.append(asyncio.create_task(listen_for_principal_invalidations()))
+    if settings.AUTH_MODE == "claims":
+        background.append(asyncio.create_task(sync_revocations()))
     yield
+    for task in background:
+        task.cancel()
+        with suppress(asyncio.CancelledError):
+            await task
+    await drain_audit_log()
+    shutdown_hash_pool()
+    await close_redis()
     logger.info("Shutting down Compliance Platform")
 
 
@@ -46,6 +72,7 @@ app.add_middleware(
     allow_credentials=settings.CORS_ALLOW_CREDENTIALS,
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=[NEXT_CURSOR_HEADER, TOTAL_COUNT_HEADER],
 )
 
 Instrumentator().instrument(app).expose(app, endpoint="/api/metrics")
@@ -56,6 +83,16 @@ app.include_router(dpdpa_router, prefix="/api/v1/dpdpa")
 app.include_router(frameworks_router, prefix="/api/v1/frameworks")
 app.include_router(assessments_router, prefix="/api/v1/assessments")
 app.include_router(reports_router, prefix="/api/v1/reports")
+app.include_router(audit_router, prefix="/api/v1/audit")
+
+
+@app.exception_handler(HashPoolSaturated)
+async def hash_pool_saturated_handler(request: Request, exc: HashPoolSaturated):
+    return JSONResponse(
+        status_code=status.HTTP_429_TOO_MANY_REQUESTS,
+        content={"detail": "Too many authentication requests, retry later"},
+        headers={"Retry-After": str(exc.retry_after)},
+    )
 
 
 @app.exception_handler(Exception)
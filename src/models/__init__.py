@@ -7,7 +7,9 @@ from src.models.assessment import (
     DSRRequest,
     DataDiscoveryScan,
 )
-from src.models.audit import AuditLog
+from src.models.audit import AuditChainHead, AuditCheckpoint, AuditLog
+from src.models.metrics import TenantMetrics
+from src.models.report import Report, TenantDataVersion
 
 __all__ = [
     "Base",
@@ -20,4 +22,9 @@ __all__ = [
     "DSRRequest",
     "DataDiscoveryScan",
     "AuditLog",
+    "AuditChainHead",
+    "AuditCheckpoint",
+    "TenantMetrics",
+    "Report",
+    "TenantDataVersion",
 ]
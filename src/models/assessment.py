@@ -2,14 +2,26 @@ from datetime import datetime
 from typing import Optional
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, Boolean, Text, ForeignKey, JSON, Integer
-from sqlalchemy.orm import relationship
+from sqlalchemy import (
+    BigInteger,
+    Column,
+    String,
+    DateTime,
+    Boolean,
+    Text,
+    ForeignKey,
+    Index,
+    JSON,
+    Integer,
+)
+from sqlalchemy.orm import deferred, relationship
 
 from src.core.database import Base
 
 
 class Framework(Base):
     __tablename__ = "frameworks"
+    __table_args__ = (Index("ix_frameworks_tenant_type", "tenant_id", "framework_type"),)
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
@@ -32,6 +44,13 @@ class Framework(Base):
 
 class Assessment(Base):
     __tablename__ = "assessments"
+    __table_args__ = (
+        Index("ix_assessments_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index("ix_assessments_tenant_status_created_id", "tenant_id", "status", "created_at", "id"),
+        Index("ix_assessments_tenant_framework", "tenant_id", "framework_id"),
+        Index("ix_assessments_tenant_updated", "tenant_id", "updated_at"),
+        Index("ix_assessments_tenant_due", "tenant_id", "due_date"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
@@ -44,7 +63,10 @@ class Assessment(Base):
     findings = Column(JSON, default=list)
     evidence = Column(JSON, default=dict)
     controls_status = Column(JSON, default=dict)
-    metadata = Column(JSON, default=dict)
+    # Running counts over controls_status, adjusted by delta on each submission.
+    controls_total = Column(Integer, nullable=False, default=0)
+    controls_compliant = Column(Integer, nullable=False, default=0)
+    metadata_ = Column("metadata", JSON, default=dict)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     due_date = Column(DateTime)
@@ -64,6 +86,10 @@ class Assessment(Base):
 
 class ConsentRecord(Base):
     __tablename__ = "consent_records"
+    __table_args__ = (
+        Index("ix_consent_records_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index("ix_consent_records_tenant_subject", "tenant_id", "data_subject_id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
@@ -88,6 +114,13 @@ class ConsentRecord(Base):
 
 class DSRRequest(Base):
     __tablename__ = "dsr_requests"
+    __table_args__ = (
+        Index("ix_dsr_requests_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index(
+            "ix_dsr_requests_tenant_status_created_id", "tenant_id", "status", "created_at", "id"
+        ),
+        Index("ix_dsr_requests_tenant_subject", "tenant_id", "data_subject_id"),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
@@ -114,6 +147,16 @@ class DSRRequest(Base):
 
 class DataDiscoveryScan(Base):
     __tablename__ = "data_discovery_scans"
+    __table_args__ = (
+        Index("ix_data_discovery_scans_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index(
+            "ix_data_discovery_scans_tenant_source",
+            "tenant_id",
+            "source_name",
+            "source_type",
+            "completed_at",
+        ),
+    )
 
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
@@ -121,9 +164,20 @@ class DataDiscoveryScan(Base):
     source_type = Column(String(50), nullable=False)
     status = Column(String(50), default="pending")
     pii_found = Column(JSON, default=list)
+    total_pii = Column(BigInteger, default=0)
     risk_score = Column(Integer, default=0)
     data_flow = Column(JSON, default=dict)
     scan_config = Column(JSON, default=dict)
+    # Fernet-encrypted connection string or path; workers load it from here so that
+    # credentials never travel through the Celery broker.
+    encrypted_location = deferred(Column(Text))
+    rows_scanned = Column(BigInteger, default=0)
+    bytes_scanned = Column(BigInteger, default=0)
+    cancel_requested = Column(Boolean, default=False)
+    error_message = Column(Text)
+    manifest = deferred(Column(JSON))
+    base_scan_id = Column(String(36), ForeignKey("data_discovery_scans.id"))
+    bytes_reused = Column(BigInteger, default=0)
     started_at = Column(DateTime)
     completed_at = Column(DateTime)
     created_by = Column(String(36), ForeignKey("users.id"))
@@ -1,14 +1,23 @@
 from datetime import datetime
 from uuid import uuid4
 
-from sqlalchemy import Column, String, DateTime, Text, ForeignKey, JSON
+from sqlalchemy import BigInteger, Column, String, DateTime, Text, ForeignKey, Index, JSON
+from sqlalchemy.orm import relationship
 
 from src.core.database import Base
 
 
 class AuditLog(Base):
     __tablename__ = "audit_logs"
+    __table_args__ = (
+        Index("ix_audit_logs_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index("ix_audit_logs_tenant_resource", "tenant_id", "resource_type", "resource_id"),
+        Index("ix_audit_logs_tenant_user_created_id", "tenant_id", "user_id", "created_at", "id"),
+        Index("ix_audit_logs_tenant_seq", "tenant_id", "seq"),
+        {"postgresql_partition_by": "RANGE (created_at)"},
+    )
 
+    # created_at is part of the key because Postgres requires the partition column in it.
     id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
     tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
     user_id = Column(String(36), ForeignKey("users.id"), nullable=True)
@@ -20,7 +29,11 @@ class AuditLog(Base):
     user_agent = Column(String(500))
     status = Column(String(50), default="success")
     error_message = Column(Text)
-    created_at = Column(DateTime, default=datetime.utcnow)
+    created_at = Column(DateTime, primary_key=True, default=datetime.utcnow)
+    # Per-tenant hash chain, assigned by the audit writer when the entry is flushed.
+    seq = Column(BigInteger)
+    prev_hash = Column(String(64))
+    entry_hash = Column(String(64))
 
     user = relationship("User", back_populates="audit_logs")
 
@@ -53,3 +66,39 @@ class AuditLog(Base):
             status=status,
             error_message=error_message,
         )
+
+
+class AuditChainHead(Base):
+    __tablename__ = "audit_chain_heads"
+
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), primary_key=True)
+    seq = Column(BigInteger, nullable=False, default=0)
+    entry_hash = Column(String(64), nullable=False)
+    # Merkle frontier ([height, hash] pairs) of the entries since the last checkpoint.
+    checkpoint_seq = Column(BigInteger, nullable=False, default=0)
+    checkpoint_at = Column(DateTime, default=datetime.utcnow)
+    frontier = Column(JSON, default=list)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<AuditChainHead(tenant_id={self.tenant_id}, seq={self.seq})>"
+
+
+class AuditCheckpoint(Base):
+    __tablename__ = "audit_checkpoints"
+    __table_args__ = (Index("ix_audit_checkpoints_tenant_last_seq", "tenant_id", "last_seq"),)
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
+    first_seq = Column(BigInteger, nullable=False)
+    last_seq = Column(BigInteger, nullable=False)
+    last_hash = Column(String(64), nullable=False)
+    merkle_root = Column(String(64), nullable=False)
+    created_at = Column(DateTime, default=datetime.utcnow)
+    verified_at = Column(DateTime)
+
+    def __repr__(self):
+        return (
+            f"<AuditCheckpoint(tenant_id={self.tenant_id}, "
+            f"seq={self.first_seq}..{self.last_seq})>"
+        )
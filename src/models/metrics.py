@@ -0,0 +1,30 @@
+from datetime import datetime
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Integer, String
+
+from src.core.database import Base
+
+
+class TenantMetrics(Base):
+    __tablename__ = "tenant_metrics"
+
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), primary_key=True)
+    slot = Column(Integer, primary_key=True, default=0)
+    assessments_total = Column(BigInteger, nullable=False, default=0)
+    assessments_completed = Column(BigInteger, nullable=False, default=0)
+    assessments_in_progress = Column(BigInteger, nullable=False, default=0)
+    assessments_score_sum = Column(BigInteger, nullable=False, default=0)
+    scans_total = Column(BigInteger, nullable=False, default=0)
+    scans_pii_total = Column(BigInteger, nullable=False, default=0)
+    scans_risk_sum = Column(BigInteger, nullable=False, default=0)
+    consents_total = Column(BigInteger, nullable=False, default=0)
+    consents_granted = Column(BigInteger, nullable=False, default=0)
+    consents_withdrawn = Column(BigInteger, nullable=False, default=0)
+    dsrs_total = Column(BigInteger, nullable=False, default=0)
+    dsrs_pending = Column(BigInteger, nullable=False, default=0)
+    dsrs_completed = Column(BigInteger, nullable=False, default=0)
+    reconciled_at = Column(DateTime)
+    updated_at = Column(DateTime, default=datetime.utcnow, onupdate=datetime.utcnow)
+
+    def __repr__(self):
+        return f"<TenantMetrics(tenant_id={self.tenant_id}, slot={self.slot}, assessments={self.assessments_total})>"
@@ -0,0 +1,50 @@
+from datetime import datetime
+from uuid import uuid4
+
+from sqlalchemy import BigInteger, Column, DateTime, ForeignKey, Index, String, Text
+
+from src.core.database import Base
+
+
+class Report(Base):
+    __tablename__ = "reports"
+    __table_args__ = (
+        Index("ix_reports_tenant_created_id", "tenant_id", "created_at", "id"),
+        Index("ix_reports_status_expires", "status", "expires_at"),
+        Index("ix_reports_tenant_cache_key", "tenant_id", "cache_key"),
+    )
+
+    id = Column(String(36), primary_key=True, default=lambda: str(uuid4()))
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), nullable=False)
+    report_type = Column(String(50), nullable=False)
+    format = Column(String(10), nullable=False)
+    framework_id = Column(String(36), ForeignKey("frameworks.id"))
+    assessment_id = Column(String(36), ForeignKey("assessments.id"))
+    start_date = Column(DateTime)
+    end_date = Column(DateTime)
+    cache_key = Column(String(64))
+    status = Column(String(50), default="queued")
+    storage_key = Column(String(500))
+    size_bytes = Column(BigInteger)
+    etag = Column(String(64))
+    error_message = Column(Text)
+    created_by = Column(String(36), ForeignKey("users.id"))
+    created_at = Column(DateTime, default=datetime.utcnow)
+    started_at = Column(DateTime)
+    completed_at = Column(DateTime)
+    expires_at = Column(DateTime, nullable=False)
+
+    def __repr__(self):
+        return f"<Report(id={self.id}, type={self.report_type}, status={self.status})>"
+
+
+class TenantDataVersion(Base):
+    # Kept off the tenants row: bumped once per transaction that writes data reports are
+    # built from, and read to key the report cache.
+    __tablename__ = "tenant_data_versions"
+
+    tenant_id = Column(String(36), ForeignKey("tenants.id"), primary_key=True)
+    version = Column(BigInteger, nullable=False, default=0)
+
+    def __repr__(self):
+        return f"<TenantDataVersion(tenant_id={self.tenant_id}, version={self.version})>"
@@ -0,0 +1,55 @@
+from datetime import datetime
+from typing import Optional, List
+from pydantic import BaseModel
+
+from src.models.audit import AuditLog
+
+
+class AuditLogResponse(BaseModel):
+    id: str
+    user_id: Optional[str]
+    action: str
+    resource_type: Optional[str]
+    resource_id: Optional[str]
+    details: Optional[dict]
+    ip_address: Optional[str]
+    user_agent: Optional[str]
+    status: Optional[str]
+    error_message: Optional[str]
+    created_at: datetime
+    seq: Optional[int] = None
+    entry_hash: Optional[str] = None
+
+    @classmethod
+    def from_orm(cls, obj: AuditLog) -> "AuditLogResponse":
+        return cls(
+            id=obj.id,
+            user_id=obj.user_id,
+            action=obj.action,
+            resource_type=obj.resource_type,
+            resource_id=obj.resource_id,
+            details=obj.details,
+            ip_address=obj.ip_address,
+            user_agent=obj.user_agent,
+            status=obj.status,
+            error_message=obj.error_message,
+            created_at=obj.created_at,
+            seq=obj.seq,
+            entry_hash=obj.entry_hash,
+        )
+
+
+class AuditLogListResponse(BaseModel):
+    entries: List[AuditLogResponse]
+    total: Optional[int]
+    next_cursor: Optional[str] = None
+
+
+class AuditChainVerificationResponse(BaseModel):
+    valid: bool
+    entries: int
+    first_seq: Optional[int]
+    last_seq: Optional[int]
+    checkpoints: int
+    error: Optional[str] = None
+    error_seq: Optional[int] = None
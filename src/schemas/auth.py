@@ -15,10 +15,13 @@ class Token(BaseModel):
 
 class TokenPayload(BaseModel):
     sub: str
-    email: str
-    tenant_id: str
-    role: str
+    email: Optional[str] = None
+    tenant_id: Optional[str] = None
+    role: Optional[str] = None
     exp: datetime
+    iat: Optional[datetime] = None
+    jti: Optional[str] = None
+    type: str
 
 
 class LoginRequest(BaseModel):
@@ -3,6 +3,7 @@ from typing import Optional, List
 from pydantic import BaseModel, Field
 
 from src.models.assessment import ConsentRecord, DSRRequest, DataDiscoveryScan
+from src.models.report import Report
 
 
 class DataSourceCreate(BaseModel):
@@ -18,6 +19,7 @@ class DataSourceResponse(BaseModel):
     source_type: str
     status: str
     pii_found: Optional[List[dict]]
+    total_pii: int = 0
     risk_score: int
     created_at: datetime
 
@@ -37,9 +39,34 @@ class DataDiscoveryScanResponse(BaseModel):
     pii_found: Optional[List[dict]]
     risk_score: int
     data_flow: Optional[dict]
+    rows_scanned: int = 0
+    bytes_scanned: int = 0
+    bytes_reused: int = 0
+    base_scan_id: Optional[str] = None
+    error_message: Optional[str] = None
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
 
+    @classmethod
+    def from_orm(cls, obj: DataDiscoveryScan) -> "DataDiscoveryScanResponse":
+        return cls(
+            id=obj.id,
+            source_name=obj.source_name,
+            source_type=obj.source_type,
+            status=obj.status,
+            pii_found=obj.pii_found,
+            total_pii=obj.total_pii or 0,
+            risk_score=obj.risk_score or 0,
+            data_flow=obj.data_flow,
+            rows_scanned=obj.rows_scanned or 0,
+            bytes_scanned=obj.bytes_scanned or 0,
+            bytes_reused=obj.bytes_reused or 0,
+            base_scan_id=obj.base_scan_id,
+            error_message=obj.error_message,
+            started_at=obj.started_at,
+            completed_at=obj.completed_at,
+        )
+
 
 class ConsentSessionCreate(BaseModel):
     data_subject_identifier: str
@@ -109,8 +136,30 @@ class ComplianceReportRequest(BaseModel):
 
 class ComplianceReportResponse(BaseModel):
     report_id: str
+    report_type: str
+    format: str
+    status: str
     download_url: str
     expires_at: datetime
+    size_bytes: Optional[int] = None
+    error_message: Optional[str] = None
+    completed_at: Optional[datetime] = None
+    cached: bool = False
+
+    @classmethod
+    def from_orm(cls, obj: Report, cached: bool = False) -> "ComplianceReportResponse":
+        return cls(
+            report_id=obj.id,
+            report_type=obj.report_type,
+            format=obj.format,
+            status=obj.status,
+            download_url=f"/api/v1/reports/download/{obj.id}",
+            expires_at=obj.expires_at,
+            size_bytes=obj.size_bytes,
+            error_message=obj.error_message,
+            completed_at=obj.completed_at,
+            cached=cached,
+        )
 
 
 class DPDPDashboardResponse(BaseModel):
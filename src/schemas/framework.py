@@ -46,7 +46,8 @@ class FrameworkResponse(BaseModel):
 
 class FrameworkListResponse(BaseModel):
     frameworks: List[FrameworkResponse]
-    total: int
+    total: Optional[int]
+    next_cursor: Optional[str] = None
 
 
 class AssessmentCreate(BaseModel):
@@ -65,7 +66,8 @@ class AssessmentUpdate(BaseModel):
 
 class ControlStatus(BaseModel):
     control_id: str
-    status: str
+    # Computed from evidence for catalog frameworks; required for custom frameworks.
+    status: Optional[str] = None
     evidence: Optional[List[str]] = None
     notes: Optional[str] = None
 
@@ -83,6 +85,8 @@ class AssessmentResponse(BaseModel):
     score: int
     findings: Optional[List[dict]]
     controls_status: Optional[dict]
+    controls_total: int = 0
+    controls_compliant: int = 0
     started_at: Optional[datetime]
     completed_at: Optional[datetime]
     due_date: Optional[datetime]
@@ -107,6 +111,8 @@ class AssessmentResponse(BaseModel):
             score=obj.score,
             findings=obj.findings,
             controls_status=obj.controls_status,
+            controls_total=obj.controls_total or 0,
+            controls_compliant=obj.controls_compliant or 0,
             started_at=obj.started_at,
             completed_at=obj.completed_at,
             due_date=obj.due_date,
@@ -118,9 +124,10 @@ class AssessmentResponse(BaseModel):
 
 class AssessmentListResponse(BaseModel):
     assessments: List[AssessmentResponse]
-    total: int
+    total: Optional[int]
     page: int
     page_size: int
+    next_cursor: Optional[str] = None
 
 
 class DashboardMetrics(BaseModel):
@@ -0,0 +1,213 @@
+import asyncio
+import csv
+import io
+import json
+import time
+from contextlib import suppress
+from datetime import datetime
+from typing import AsyncIterator, Optional
+from uuid import uuid4
+
+from fastapi import Request
+from prometheus_client import Counter, Gauge, Histogram
+from sqlalchemy import Select, event, insert, select
+from sqlalchemy.exc import SQLAlchemyError
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import async_session_maker
+from src.core.logging import get_logger
+from src.models.audit import AuditLog
+from src.services.audit_chain import chain_entries
+
+logger = get_logger(__name__)
+
+PENDING_AUDIT_KEY = "pending_audit_entries"
+EXPORT_BATCH_SIZE = 1000
+EXPORT_FIELDS = [c.key for c in AuditLog.__table__.columns if c.key != "tenant_id"]
+EXPORT_MEDIA_TYPES = {"ndjson": "application/x-ndjson", "csv": "text/csv"}
+
+AUDIT_BACKLOG = Gauge(
+    "audit_log_backlog",
+    "Audit entries buffered in-process and not yet written",
+)
+AUDIT_WRITTEN = Counter(
+    "audit_log_entries_written_total",
+    "Audit entries written to the database by the batch writer",
+)
+AUDIT_DROPPED = Counter(
+    "audit_log_entries_dropped_total",
+    "Audit entries discarded before reaching the database",
+    ["reason"],
+)
+AUDIT_FLUSH_SECONDS = Histogram(
+    "audit_log_flush_seconds",
+    "Time to write one batch of audit entries",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5),
+)
+
+_buffer: list[dict] = []
+_wakeup: Optional[asyncio.Event] = None
+_inflight: Optional[asyncio.Task] = None
+
+AUDIT_BACKLOG.set_function(lambda: len(_buffer))
+
+
+def audit_values(entry: AuditLog) -> dict:
+    values = {column.key: getattr(entry, column.key) for column in AuditLog.__table__.columns}
+    values["id"] = values["id"] or str(uuid4())
+    values["created_at"] = values["created_at"] or datetime.utcnow()
+    return values
+
+
+def record_audit(
+    db: AsyncSession,
+    tenant_id: str,
+    user_id: Optional[str],
+    action: str,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    details: Optional[dict] = None,
+    request: Optional[Request] = None,
+) -> None:
+    # Held on the session and only buffered once its transaction commits, so the
+    # request path never waits on an audit INSERT and rolled-back work is not audited.
+    entry = AuditLog.create_entry(
+        tenant_id=tenant_id,
+        user_id=user_id,
+        action=action,
+        resource_type=resource_type,
+        resource_id=resource_id,
+        details=details,
+        ip_address=request.client.host if request and request.client else None,
+        user_agent=request.headers.get("user-agent") if request else None,
+    )
+    db.info.setdefault(PENDING_AUDIT_KEY, []).append(audit_values(entry))
+
+
+def enqueue_audit(entries: list[dict]) -> None:
+    room = max(0, settings.AUDIT_BUFFER_SIZE - len(_buffer))
+    if len(entries) > room:
+        AUDIT_DROPPED.labels("buffer_full").inc(len(entries) - room)
+        logger.warning("Audit buffer full", dropped=len(entries) - room)
+    _buffer.extend(entries[:room])
+    if _wakeup is not None and len(_buffer) >= settings.AUDIT_FLUSH_BATCH_SIZE:
+        _wakeup.set()
+
+
+@event.listens_for(Session, "after_commit")
+def enqueue_committed_audit(session: Session) -> None:
+    entries = session.info.pop(PENDING_AUDIT_KEY, None)
+    if entries:
+        enqueue_audit(entries)
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_audit(session: Session) -> None:
+    session.info.pop(PENDING_AUDIT_KEY, None)
+
+
+async def flush_audit_log() -> int:
+    global _buffer
+    if not _buffer:
+        return 0
+    batch, _buffer = _buffer, []
+    start = time.perf_counter()
+    try:
+        async with async_session_maker() as session:
+            # The chain heads stay locked until commit, so each tenant's entries are linked and
+            # inserted in one transaction; a failed batch is re-chained on retry.
+            await chain_entries(session, batch)
+            # executemany on an INSERT is sent as multi-row VALUES statements.
+            await session.execute(insert(AuditLog), batch)
+            await session.commit()
+    except (SQLAlchemyError, OSError) as e:
+        room = max(0, settings.AUDIT_BUFFER_SIZE - len(_buffer))
+        if len(batch) > room:
+            AUDIT_DROPPED.labels("flush_failed").inc(len(batch) - room)
+        _buffer = batch[:room] + _buffer
+        logger.warning("Audit flush failed", error=str(e), entries=len(batch))
+        return 0
+    AUDIT_FLUSH_SECONDS.observe(time.perf_counter() - start)
+    AUDIT_WRITTEN.inc(len(batch))
+    return len(batch)
+
+
+async def run_audit_writer() -> None:
+    global _wakeup, _inflight
+    _wakeup = asyncio.Event()
+    while True:
+        with suppress(asyncio.TimeoutError):
+            await asyncio.wait_for(_wakeup.wait(), settings.AUDIT_FLUSH_INTERVAL_MS / 1000)
+        _wakeup.clear()
+        # Shielded so cancelling the writer at shutdown never abandons a batch mid-write.
+        _inflight = asyncio.create_task(flush_audit_log())
+        await asyncio.shield(_inflight)
+
+
+async def drain_audit_log() -> None:
+    if _inflight is not None and not _inflight.done():
+        await _inflight
+    while _buffer:
+        if not await flush_audit_log():
+            AUDIT_DROPPED.labels("shutdown").inc(len(_buffer))
+            logger.error("Audit entries lost at shutdown", entries=len(_buffer))
+            _buffer.clear()
+            return
+
+
+def audit_log_query(
+    tenant_id: str,
+    user_id: Optional[str] = None,
+    action: Optional[str] = None,
+    resource_type: Optional[str] = None,
+    resource_id: Optional[str] = None,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> Select:
+    query = select(AuditLog).where(AuditLog.tenant_id == tenant_id)
+    if user_id:
+        query = query.where(AuditLog.user_id == user_id)
+    if action:
+        query = query.where(AuditLog.action == action)
+    if resource_type:
+        query = query.where(AuditLog.resource_type == resource_type)
+    if resource_id:
+        query = query.where(AuditLog.resource_id == resource_id)
+    # Bounds on created_at also let Postgres prune whole monthly partitions.
+    if since:
+        query = query.where(AuditLog.created_at >= since)
+    if until:
+        query = query.where(AuditLog.created_at < until)
+    return query
+
+
+def export_row(entry: AuditLog) -> dict:
+    row = {field: getattr(entry, field) for field in EXPORT_FIELDS}
+    row["created_at"] = entry.created_at.isoformat()
+    return row
+
+
+def _format_batch(rows: list[dict], export_format: str) -> str:
+    if export_format == "ndjson":
+        return "".join(json.dumps(row) + "\n" for row in rows)
+    output = io.StringIO()
+    writer = csv.DictWriter(output, fieldnames=EXPORT_FIELDS)
+    for row in rows:
+        writer.writerow({**row, "details": json.dumps(row["details"] or {})})
+    return output.getvalue()
+
+
+async def stream_audit_export(query: Select, export_format: str) -> AsyncIterator[str]:
+    # Runs after the request's session has closed, so it reads on its own session, through
+    # a server-side cursor, one batch at a time.
+    if export_format == "csv":
+        yield ",".join(EXPORT_FIELDS) + "\r\n"
+    query = query.order_by(AuditLog.created_at, AuditLog.id).execution_options(
+        yield_per=EXPORT_BATCH_SIZE
+    )
+    async with async_session_maker() as session:
+        result = await session.stream_scalars(query)
+        async for batch in result.partitions():
+            yield _format_batch([export_row(entry) for entry in batch], export_format)
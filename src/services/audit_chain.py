@@ -0,0 +1,391 @@
+import asyncio
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Iterable, Optional
+
+from prometheus_client import Counter
+from sqlalchemy import Select, func, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.models.audit import AuditChainHead, AuditCheckpoint, AuditLog
+
+logger = get_logger(__name__)
+
+GENESIS_HASH = "0" * 64
+CHAINED_FIELDS = sorted(c.key for c in AuditLog.__table__.columns if c.key != "entry_hash")
+
+AUDIT_CHAIN_VERIFICATIONS = Counter(
+    "audit_chain_verifications_total",
+    "Audit hash chain verifications by outcome",
+    ["result"],
+)
+
+
+class AuditWindowTooLarge(ValueError):
+    pass
+
+
+_encoder = json.JSONEncoder(sort_keys=True, separators=(",", ":"), default=str)
+
+
+def canonical_entry(values) -> bytes:
+    content = {field: values[field] for field in CHAINED_FIELDS}
+    content["created_at"] = values["created_at"].isoformat()
+    return _encoder.encode(content).encode()
+
+
+def chain_hash(values) -> str:
+    return hashlib.sha256(canonical_entry(values)).hexdigest()
+
+
+def _node(left: str, right: str) -> str:
+    return hashlib.sha256(bytes.fromhex(left) + bytes.fromhex(right)).hexdigest()
+
+
+def merkle_push(frontier: list, leaf: str) -> None:
+    # Keeps only the roots of the complete subtrees seen so far, so a checkpoint of any
+    # size needs O(log n) state on the chain head rather than every leaf.
+    height, digest = 0, leaf
+    while frontier and frontier[-1][0] == height:
+        digest = _node(frontier.pop()[1], digest)
+        height += 1
+    frontier.append([height, digest])
+
+
+def merkle_root(frontier: list) -> str:
+    if not frontier:
+        return GENESIS_HASH
+    digest = frontier[-1][1]
+    for _, left in reversed(frontier[:-1]):
+        digest = _node(left, digest)
+    return digest
+
+
+async def chain_entries(session: AsyncSession, batch: list[dict]) -> list[AuditCheckpoint]:
+    tenant_ids = sorted({entry["tenant_id"] for entry in batch})
+    # Locked in tenant order so concurrent writers serialise per tenant without deadlocking.
+    heads = {
+        head.tenant_id: head
+        for head in await session.scalars(
+            select(AuditChainHead)
+            .where(AuditChainHead.tenant_id.in_(tenant_ids))
+            .order_by(AuditChainHead.tenant_id)
+            .with_for_update()
+        )
+    }
+    now = datetime.utcnow()
+    for tenant_id in tenant_ids:
+        if tenant_id not in heads:
+            heads[tenant_id] = AuditChainHead(
+                tenant_id=tenant_id,
+                seq=0,
+                entry_hash=GENESIS_HASH,
+                checkpoint_seq=0,
+                checkpoint_at=now,
+                frontier=[],
+            )
+            session.add(heads[tenant_id])
+
+    max_age = timedelta(seconds=settings.AUDIT_CHECKPOINT_SECONDS)
+    checkpoints = []
+    # Copied so reassigning the JSON column below registers as a change.
+    frontiers = {
+        tenant_id: [list(node) for node in head.frontier or []] for tenant_id, head in heads.items()
+    }
+    for entry in sorted(batch, key=lambda e: (e["created_at"], e["id"])):
+        head = heads[entry["tenant_id"]]
+        entry["seq"] = head.seq + 1
+        entry["prev_hash"] = head.entry_hash
+        entry["entry_hash"] = chain_hash(entry)
+        head.seq, head.entry_hash = entry["seq"], entry["entry_hash"]
+        frontier = frontiers[head.tenant_id]
+        merkle_push(frontier, head.entry_hash)
+        if (
+            head.seq - head.checkpoint_seq >= settings.AUDIT_CHECKPOINT_ENTRIES
+            or now - head.checkpoint_at >= max_age
+        ):
+            checkpoints.append(seal_checkpoint(head, frontier, now))
+            frontiers[head.tenant_id] = []
+
+    for tenant_id, head in heads.items():
+        head.frontier = frontiers[tenant_id]
+    session.add_all(checkpoints)
+    return checkpoints
+
+
+def seal_checkpoint(head: AuditChainHead, frontier: list, now: datetime) -> AuditCheckpoint:
+    checkpoint = AuditCheckpoint(
+        tenant_id=head.tenant_id,
+        first_seq=head.checkpoint_seq + 1,
+        last_seq=head.seq,
+        last_hash=head.entry_hash,
+        merkle_root=merkle_root(frontier),
+        created_at=now,
+    )
+    head.checkpoint_seq, head.checkpoint_at = head.seq, now
+    return checkpoint
+
+
+class ChainVerifier:
+    def __init__(
+        self,
+        after_seq: int,
+        prev_hash: Optional[str],
+        checkpoints: Iterable[AuditCheckpoint] = (),
+    ):
+        # prev_hash=None anchors on whatever the first row links to, for windows that start
+        # mid-chain; the links and checkpoints inside the window are still checked.
+        self.seq = after_seq
+        self.first_seq = after_seq + 1
+        self.prev_hash = prev_hash
+        self.entries = 0
+        self.error: Optional[str] = None
+        self.error_seq: Optional[int] = None
+        self.checkpoints = []
+        self._ends = {c.last_seq: c for c in checkpoints}
+        self._starts = {c.first_seq for c in self._ends.values()}
+        self._frontier = [] if self.first_seq in self._starts else None
+
+    @property
+    def valid(self) -> bool:
+        return self.error is None
+
+    def _fail(self, error: str, seq: int) -> bool:
+        self.error, self.error_seq = error, seq
+        return False
+
+    def feed(self, rows) -> bool:
+        for row in rows:
+            seq = row["seq"]
+            if seq != self.seq + 1:
+                return self._fail("gap", self.seq + 1)
+            if self.prev_hash is not None and row["prev_hash"] != self.prev_hash:
+                return self._fail("broken_link", seq)
+            if chain_hash(row) != row["entry_hash"]:
+                return self._fail("hash_mismatch", seq)
+            self.seq, self.prev_hash = seq, row["entry_hash"]
+            self.entries += 1
+
+            if seq in self._starts:
+                self._frontier = []
+            if self._frontier is not None:
+                merkle_push(self._frontier, self.prev_hash)
+            checkpoint = self._ends.get(seq)
+            if checkpoint is not None and self._frontier is not None:
+                if (
+                    merkle_root(self._frontier) != checkpoint.merkle_root
+                    or checkpoint.last_hash != self.prev_hash
+                ):
+                    return self._fail("checkpoint_mismatch", seq)
+                self.checkpoints.append(checkpoint)
+                self._frontier = None
+        return True
+
+    def finish(self, head_seq: int, head_hash: str) -> bool:
+        if self.error is not None:
+            return False
+        if self.seq != head_seq:
+            return self._fail("gap", self.seq + 1)
+        if self.prev_hash != head_hash:
+            return self._fail("head_mismatch", self.seq)
+        return True
+
+    def result(self) -> dict:
+        return {
+            "valid": self.valid,
+            "entries": self.entries,
+            "first_seq": self.first_seq if self.entries else None,
+            "last_seq": self.seq if self.entries else None,
+            "checkpoints": len(self.checkpoints),
+            "error": self.error,
+            "error_seq": self.error_seq,
+        }
+
+
+def chain_query(tenant_id: str, after_seq: int, through_seq: int) -> Select:
+    # Plain column rows rather than ORM entities; verification only needs the values.
+    return (
+        select(AuditLog.__table__)
+        .where(
+            AuditLog.tenant_id == tenant_id,
+            AuditLog.seq > after_seq,
+            AuditLog.seq <= through_seq,
+        )
+        .order_by(AuditLog.seq)
+        .execution_options(yield_per=settings.AUDIT_VERIFY_BATCH_SIZE)
+    )
+
+
+def checkpoint_query(tenant_id: str, after_seq: int, through_seq: int) -> Select:
+    return (
+        select(AuditCheckpoint)
+        .where(
+            AuditCheckpoint.tenant_id == tenant_id,
+            AuditCheckpoint.first_seq > after_seq,
+            AuditCheckpoint.last_seq <= through_seq,
+        )
+        .order_by(AuditCheckpoint.first_seq)
+    )
+
+
+def verify_tenant_chain(db: Session, tenant_id: str, head_seq: int, head_hash: str) -> dict:
+    # Resumes from the newest checkpoint an earlier run verified, so each run only reads
+    # entries written since.
+    anchor = db.scalars(
+        select(AuditCheckpoint)
+        .where(AuditCheckpoint.tenant_id == tenant_id, AuditCheckpoint.verified_at.is_not(None))
+        .order_by(AuditCheckpoint.last_seq.desc())
+        .limit(1)
+    ).first()
+    after_seq, prev_hash = (anchor.last_seq, anchor.last_hash) if anchor else (0, GENESIS_HASH)
+
+    checkpoints = db.scalars(checkpoint_query(tenant_id, after_seq, head_seq)).all()
+    verifier = ChainVerifier(after_seq, prev_hash, checkpoints)
+    for rows in db.execute(chain_query(tenant_id, after_seq, head_seq)).mappings().partitions():
+        if not verifier.feed(rows):
+            break
+    verifier.finish(head_seq, head_hash)
+    result = verifier.result()
+    if verifier.valid and verifier.checkpoints:
+        now = datetime.utcnow()
+        for checkpoint in verifier.checkpoints:
+            checkpoint.verified_at = now
+        latest = verifier.checkpoints[-1]
+        result["latest"] = {"last_seq": latest.last_seq, "merkle_root": latest.merkle_root}
+        db.commit()
+    return result
+
+
+def verify_audit_chains(db: Session) -> dict:
+    heads = db.execute(
+        select(AuditChainHead.tenant_id, AuditChainHead.seq, AuditChainHead.entry_hash)
+    ).all()
+    summary = {"tenants": len(heads), "entries": 0, "failed": []}
+    for tenant_id, head_seq, head_hash in heads:
+        result = verify_tenant_chain(db, tenant_id, head_seq, head_hash)
+        summary["entries"] += result["entries"]
+        if result["valid"]:
+            AUDIT_CHAIN_VERIFICATIONS.labels("valid").inc()
+            if result["checkpoints"]:
+                # Logged so the root can be anchored outside the database.
+                logger.info("Audit checkpoint verified", tenant_id=tenant_id, **result["latest"])
+        else:
+            AUDIT_CHAIN_VERIFICATIONS.labels(result["error"]).inc()
+            summary["failed"].append(tenant_id)
+            logger.error(
+                "Audit chain verification failed",
+                tenant_id=tenant_id,
+                error=result["error"],
+                seq=result["error_seq"],
+            )
+    return summary
+
+
+async def _feed_window(
+    db: AsyncSession, verifier: ChainVerifier, tenant_id: str, after_seq: int, last_seq: int
+) -> None:
+    # Hashing is CPU-bound, so each batch is checked on a worker thread and the event loop
+    # keeps serving other requests while a window is verified.
+    result = await db.stream(chain_query(tenant_id, after_seq, last_seq))
+    async for rows in result.mappings().partitions():
+        if not await asyncio.to_thread(verifier.feed, rows):
+            break
+
+
+async def first_missing_seq(
+    db: AsyncSession, tenant_id: str, first_seq: int, through_seq: int
+) -> Optional[int]:
+    seqs = (
+        select(
+            AuditLog.seq.label("seq"),
+            func.lead(AuditLog.seq).over(order_by=AuditLog.seq).label("next_seq"),
+        )
+        .where(
+            AuditLog.tenant_id == tenant_id,
+            AuditLog.seq >= first_seq,
+            AuditLog.seq <= through_seq,
+        )
+        .subquery()
+    )
+    return await db.scalar(
+        select(func.min(seqs.c.seq + 1)).where(
+            func.coalesce(seqs.c.next_seq, through_seq + 1) != seqs.c.seq + 1
+        )
+    )
+
+
+async def verify_audit_window(
+    db: AsyncSession,
+    tenant_id: str,
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+) -> dict:
+    bounds = select(func.min(AuditLog.seq), func.max(AuditLog.seq)).where(
+        AuditLog.tenant_id == tenant_id, AuditLog.seq.is_not(None)
+    )
+    if since:
+        bounds = bounds.where(AuditLog.created_at >= since)
+    if until:
+        bounds = bounds.where(AuditLog.created_at < until)
+    first_seq, last_seq = (await db.execute(bounds)).one()
+    if first_seq is None:
+        return ChainVerifier(0, None).result()
+
+    # verify_audit_chains has already hashed everything up to its newest verified
+    # checkpoint. That part of the window is only counted, which still catches deleted
+    # entries, and only the unverified tail is hashed here.
+    anchor = (
+        await db.scalars(
+            select(AuditCheckpoint)
+            .where(
+                AuditCheckpoint.tenant_id == tenant_id,
+                AuditCheckpoint.verified_at.is_not(None),
+                AuditCheckpoint.last_seq >= first_seq,
+            )
+            .order_by(AuditCheckpoint.last_seq.desc())
+            .limit(1)
+        )
+    ).first()
+    after_seq = first_seq - 1
+    prev_hash = GENESIS_HASH if after_seq == 0 else None
+    verified = []
+    if anchor is not None:
+        through = min(anchor.last_seq, last_seq)
+        present = await db.scalar(
+            select(func.count()).where(
+                AuditLog.tenant_id == tenant_id,
+                AuditLog.seq >= first_seq,
+                AuditLog.seq <= through,
+            )
+        )
+        if present != through - after_seq:
+            verifier = ChainVerifier(after_seq, prev_hash)
+            verifier._fail("gap", await first_missing_seq(db, tenant_id, first_seq, through))
+            return verifier.result()
+        verified = (await db.scalars(checkpoint_query(tenant_id, after_seq, through))).all()
+        after_seq = through
+        prev_hash = anchor.last_hash if through == anchor.last_seq else None
+
+    if last_seq - after_seq > settings.AUDIT_VERIFY_WINDOW_MAX_ENTRIES:
+        raise AuditWindowTooLarge(
+            f"Window has {last_seq - after_seq} unverified entries; "
+            f"narrow it to at most {settings.AUDIT_VERIFY_WINDOW_MAX_ENTRIES}"
+        )
+    checkpoints = (await db.scalars(checkpoint_query(tenant_id, after_seq, last_seq))).all()
+    verifier = ChainVerifier(after_seq, prev_hash, checkpoints)
+    await _feed_window(db, verifier, tenant_id, after_seq, last_seq)
+    head = await db.get(AuditChainHead, tenant_id)
+    if verifier.valid and head is not None and head.seq == last_seq:
+        verifier.finish(head.seq, head.entry_hash)
+
+    result = verifier.result()
+    if verified:
+        result["entries"] += after_seq - first_seq + 1
+        result["checkpoints"] += len(verified)
+        result["first_seq"] = first_seq
+        result["last_seq"] = result["last_seq"] or after_seq
+    return result
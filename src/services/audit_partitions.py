@@ -0,0 +1,349 @@
+import gzip
+import json
+import os
+from datetime import datetime
+from pathlib import Path
+from typing import Iterable, Optional
+
+from sqlalchemy import column, delete, func, select, table, text, tuple_
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.models.audit import AuditLog
+from src.models.user import Tenant
+
+logger = get_logger(__name__)
+
+PARTITION_PREFIX = "audit_logs_y"
+DEFAULT_PARTITION = "audit_logs_default"
+ARCHIVE_DIR = "audit_archive"
+EXPORT_BATCH_SIZE = 5000
+PURGE_BATCH_SIZE = 5000
+
+
+def month_start(value: datetime) -> datetime:
+    return value.replace(day=1, hour=0, minute=0, second=0, microsecond=0)
+
+
+def add_months(month: datetime, months: int) -> datetime:
+    index = month.year * 12 + month.month - 1 + months
+    return month.replace(year=index // 12, month=index % 12 + 1)
+
+
+def partition_name(month: datetime) -> str:
+    return f"{PARTITION_PREFIX}{month.year}m{month.month:02d}"
+
+
+def partition_month(name: str) -> Optional[datetime]:
+    if not name.startswith(PARTITION_PREFIX):
+        return None
+    try:
+        year, month = name[len(PARTITION_PREFIX) :].split("m")
+        return datetime(int(year), int(month), 1)
+    except ValueError:
+        return None
+
+
+def create_partition_sql(month: datetime) -> str:
+    return (
+        f"CREATE TABLE IF NOT EXISTS {partition_name(month)} PARTITION OF audit_logs "
+        f"FOR VALUES FROM ('{month:%Y-%m-%d}') TO ('{add_months(month, 1):%Y-%m-%d}')"
+    )
+
+
+def create_default_partition_sql() -> str:
+    # Catches rows outside every monthly partition, e.g. clock skew or a missed premake, so
+    # the insert succeeds instead of failing the audit writer's whole batch.
+    return f"CREATE TABLE IF NOT EXISTS {DEFAULT_PARTITION} PARTITION OF audit_logs DEFAULT"
+
+
+def partition_table(name: str):
+    return table(name, *[column(c.name, c.type) for c in AuditLog.__table__.columns])
+
+
+def archive_path(tenant_id: str, month: datetime) -> Path:
+    return settings.get_upload_dir() / ARCHIVE_DIR / tenant_id / f"{month:%Y-%m}.jsonl.gz"
+
+
+def tenant_retention(raw_settings: Optional[str]) -> tuple[int, bool]:
+    try:
+        data = json.loads(raw_settings or "{}")
+    except ValueError:
+        data = {}
+    return (
+        int(data.get("audit_retention_months", settings.AUDIT_RETENTION_MONTHS)),
+        bool(data.get("audit_archive", True)),
+    )
+
+
+def retention_policies(db: Session) -> dict[str, tuple[int, bool]]:
+    return {
+        tenant_id: tenant_retention(raw)
+        for tenant_id, raw in db.execute(select(Tenant.id, Tenant.settings))
+    }
+
+
+def retention_cutoff(policies: dict[str, tuple[int, bool]], now: datetime) -> datetime:
+    # A partition holds every tenant's rows for its month, so it can only be dropped once
+    # the longest retention has passed. Shorter policies are applied by tenant_purges.
+    months = max(
+        (months for months, _ in policies.values()), default=settings.AUDIT_RETENTION_MONTHS
+    )
+    return add_months(month_start(now), -months)
+
+
+def tenant_cutoff(policy: tuple[int, bool], now: datetime) -> datetime:
+    return add_months(month_start(now), -policy[0])
+
+
+def tenant_purges(
+    names: Iterable[str], policies: dict[str, tuple[int, bool]], now: datetime
+) -> dict[str, list[str]]:
+    # Partitions that are still attached but hold months some tenants no longer keep,
+    # mapped to those tenants.
+    cutoff = retention_cutoff(policies, now)
+    purges = {}
+    for name in sorted(names):
+        month = partition_month(name)
+        if month is None or add_months(month, 1) <= cutoff:
+            continue
+        tenant_ids = sorted(
+            tenant_id
+            for tenant_id, policy in policies.items()
+            if add_months(month, 1) <= tenant_cutoff(policy, now)
+        )
+        if tenant_ids:
+            purges[name] = tenant_ids
+    return purges
+
+
+def expired_partitions(names: Iterable[str], cutoff: datetime) -> list[str]:
+    expired = []
+    for name in names:
+        month = partition_month(name)
+        if month is not None and add_months(month, 1) <= cutoff:
+            expired.append(name)
+    return sorted(expired)
+
+
+def attached_partitions(db: Session) -> list[str]:
+    return list(
+        db.scalars(
+            text(
+                "SELECT c.relname FROM pg_inherits i JOIN pg_class c ON c.oid = i.inhrelid "
+                "WHERE i.inhparent = 'audit_logs'::regclass"
+            )
+        )
+    )
+
+
+def detached_partitions(db: Session) -> list[str]:
+    # Tables left detached by an interrupted run are exported and dropped on the next one.
+    attached = set(attached_partitions(db))
+    tables = db.scalars(text("SELECT tablename FROM pg_tables WHERE schemaname = current_schema()"))
+    return sorted(t for t in tables if partition_month(t) and t not in attached)
+
+
+def ensure_partitions(db: Session, now: datetime) -> list[str]:
+    db.execute(text(create_default_partition_sql()))
+    attached = set(attached_partitions(db))
+    current = month_start(now)
+    months = [add_months(current, i) for i in range(settings.AUDIT_PARTITION_PREMAKE_MONTHS + 1)]
+    for month in months:
+        if partition_name(month) not in attached:
+            create_partition(db, month)
+    return [partition_name(month) for month in months]
+
+
+def create_partition(db: Session, month: datetime) -> None:
+    # Postgres refuses to create a partition while the default partition holds rows in its
+    # range, so those rows are moved into the new partition with the default detached.
+    source = partition_table(DEFAULT_PARTITION)
+    in_month = (source.c.created_at >= month) & (source.c.created_at < add_months(month, 1))
+    if not db.scalar(select(func.count()).select_from(source).where(in_month)):
+        db.execute(text(create_partition_sql(month)))
+        return
+    db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {DEFAULT_PARTITION}"))
+    db.execute(text(create_partition_sql(month)))
+    moved = db.execute(
+        text(
+            f"WITH moved AS (DELETE FROM {DEFAULT_PARTITION} "
+            "WHERE created_at >= :start AND created_at < :stop RETURNING *) "
+            f"INSERT INTO {partition_name(month)} SELECT * FROM moved"
+        ),
+        {"start": month, "stop": add_months(month, 1)},
+    ).rowcount
+    db.execute(text(f"ALTER TABLE audit_logs ATTACH PARTITION {DEFAULT_PARTITION} DEFAULT"))
+    logger.warning(
+        "Moved audit rows out of the default partition",
+        partition=partition_name(month),
+        rows=moved,
+    )
+
+
+def check_default_partition(db: Session) -> int:
+    source = partition_table(DEFAULT_PARTITION)
+    rows, oldest, newest = db.execute(
+        select(func.count(), func.min(source.c.created_at), func.max(source.c.created_at))
+    ).one()
+    if rows:
+        # Nothing should land here while partitions are premade; alert on this event.
+        logger.error(
+            "Audit rows in default partition",
+            partition=DEFAULT_PARTITION,
+            rows=rows,
+            oldest=str(oldest),
+            newest=str(newest),
+        )
+    return rows
+
+
+def _close_archive(fh, part: Path, path: Path) -> None:
+    fh.close()
+    os.replace(part, path)
+
+
+def export_partition(
+    db: Session,
+    name: str,
+    policies: dict[str, tuple[int, bool]],
+    tenant_ids: Optional[list[str]] = None,
+) -> dict[str, int]:
+    month = partition_month(name)
+    source = partition_table(name)
+    query = (
+        select(source)
+        .order_by(source.c.tenant_id, source.c.created_at, source.c.id)
+        .execution_options(yield_per=EXPORT_BATCH_SIZE)
+    )
+    if tenant_ids is not None:
+        query = query.where(source.c.tenant_id.in_(tenant_ids))
+    default_policy = (settings.AUDIT_RETENTION_MONTHS, True)
+    exported: dict[str, int] = {}
+    fh = part = path = None
+    tenant_id = None
+    try:
+        for row in db.execute(query).mappings():
+            if row["tenant_id"] != tenant_id:
+                if fh is not None:
+                    _close_archive(fh, part, path)
+                    fh = None
+                tenant_id = row["tenant_id"]
+                if not policies.get(tenant_id, default_policy)[1]:
+                    continue
+                path = archive_path(tenant_id, month)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                part = path.with_name(path.name + ".part")
+                fh = gzip.open(part, "wt", encoding="utf-8")
+                exported[tenant_id] = 0
+            if fh is None:
+                continue
+            fh.write(json.dumps(dict(row), default=str) + "\n")
+            exported[tenant_id] += 1
+        if fh is not None:
+            _close_archive(fh, part, path)
+            fh = None
+    finally:
+        if fh is not None:
+            fh.close()
+    return exported
+
+
+def purge_tenant_rows(
+    db: Session, name: str, tenant_ids: list[str], policies: dict[str, tuple[int, bool]]
+) -> tuple[dict[str, int], int]:
+    # Deletes the rows of tenants whose own retention has passed for a partition other
+    # tenants still keep, PURGE_BATCH_SIZE rows per transaction. Each batch is appended to
+    # the tenant's archive before its delete commits, so an interrupted run archives at
+    # most that batch twice and never loses rows already exported.
+    month = partition_month(name)
+    source = partition_table(name)
+    key = tuple_(source.c.created_at, source.c.id)
+    default_policy = (settings.AUDIT_RETENTION_MONTHS, True)
+    exported: dict[str, int] = {}
+    deleted = 0
+    for tenant_id in tenant_ids:
+        archive = policies.get(tenant_id, default_policy)[1]
+        last = None
+        while True:
+            batch = (
+                select(source.c.created_at, source.c.id)
+                .where(source.c.tenant_id == tenant_id)
+                .order_by(source.c.created_at, source.c.id)
+                .limit(PURGE_BATCH_SIZE)
+            )
+            if last is not None:
+                batch = batch.where(key > tuple_(*last))
+            rows = (
+                db.execute(
+                    delete(source)
+                    .where(source.c.tenant_id == tenant_id, key.in_(batch))
+                    .returning(*source.c)
+                )
+                .mappings()
+                .all()
+            )
+            if not rows:
+                break
+            if archive:
+                path = archive_path(tenant_id, month)
+                path.parent.mkdir(parents=True, exist_ok=True)
+                # Every batch is its own gzip member; readers see one continuous stream.
+                with gzip.open(path, "at", encoding="utf-8") as fh:
+                    for row in sorted(rows, key=lambda r: (r["created_at"], r["id"])):
+                        fh.write(json.dumps(dict(row), default=str) + "\n")
+                exported[tenant_id] = exported.get(tenant_id, 0) + len(rows)
+            db.commit()
+            deleted += len(rows)
+            last = max((row["created_at"], row["id"]) for row in rows)
+    return exported, deleted
+
+
+def maintain_partitions(db: Session, now: datetime) -> dict:
+    if db.get_bind().dialect.name != "postgresql":
+        return {"skipped": db.get_bind().dialect.name}
+
+    ensured = ensure_partitions(db, now)
+    db.commit()
+    default_rows = check_default_partition(db)
+
+    policies = retention_policies(db)
+    purged = 0
+    for name, tenant_ids in tenant_purges(attached_partitions(db), policies, now).items():
+        exported, deleted = purge_tenant_rows(db, name, tenant_ids, policies)
+        purged += deleted
+        if deleted:
+            logger.info(
+                "Purged expired tenant audit rows",
+                partition=name,
+                tenants=len(tenant_ids),
+                archived=sum(exported.values()),
+                rows=deleted,
+            )
+
+    # Once every tenant's retention has passed, the partition goes as DETACH + DROP, a
+    # catalog change rather than a DELETE over its rows.
+    for name in expired_partitions(attached_partitions(db), retention_cutoff(policies, now)):
+        db.execute(text(f"ALTER TABLE audit_logs DETACH PARTITION {name}"))
+        db.commit()
+        logger.info("Detached audit partition", partition=name)
+
+    retired = []
+    for name in detached_partitions(db):
+        exported = export_partition(db, name, policies)
+        db.execute(text(f"DROP TABLE {name}"))
+        db.commit()
+        retired.append(name)
+        logger.info(
+            "Archived audit partition",
+            partition=name,
+            tenants=len(exported),
+            rows=sum(exported.values()),
+        )
+    return {
+        "partitions": len(ensured),
+        "purged_rows": purged,
+        "retired": retired,
+        "default_rows": default_rows,
+    }
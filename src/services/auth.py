@@ -5,17 +5,19 @@ from uuid import uuid4
 from fastapi import Depends, HTTPException, status
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from jose import jwt, JWTError
-from passlib.context import CryptContext
 from sqlalchemy import select
 from sqlalchemy.ext.asyncio import AsyncSession
 
 from src.core.config import settings
+from src.core.database import get_db
 from src.core.logging import get_logger
 from src.models.user import User, Tenant, RefreshToken
 from src.schemas.auth import Token, TokenPayload
+from src.services.hashing import HashPoolSaturated, pwd_context, run_hash
+from src.services.principals import get_principal, principal_from_data
+from src.services.revocation import filter_is_fresh, is_revoked
 
 logger = get_logger(__name__)
-pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 security = HTTPBearer()
 
 
@@ -32,7 +34,9 @@ def create_access_token(data: dict, expires_delta: Optional[timedelta] = None) -
     expire = datetime.utcnow() + (
         expires_delta or timedelta(minutes=settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES)
     )
-    to_encode.update({"exp": expire, "type": "access"})
+    to_encode.update(
+        {"exp": expire, "iat": datetime.utcnow(), "jti": str(uuid4()), "type": "access"}
+    )
     encoded_jwt = jwt.encode(to_encode, settings.JWT_SECRET_KEY, algorithm=settings.JWT_ALGORITHM)
     return encoded_jwt
 
@@ -89,7 +93,7 @@ async def create_user(
         id=str(uuid4()),
         tenant_id=tenant_id,
         email=email,
-        password_hash=hash_password(password),
+        password_hash=await run_hash("hash", hash_password, password),
         first_name=first_name,
         last_name=last_name,
         role=role,
@@ -110,13 +114,24 @@ async def authenticate_user(
     user = await get_user_by_email(db, email)
     if not user:
         return None
-    if not verify_password(password, user.password_hash):
+    if not await run_hash("verify", verify_password, password, user.password_hash):
         return None
     if not user.is_active:
         return None
+    if pwd_context.needs_update(user.password_hash):
+        await rehash_password(user, password)
     return user
 
 
+async def rehash_password(user: User, password: str) -> None:
+    try:
+        user.password_hash = await run_hash("rehash", hash_password, password)
+    except HashPoolSaturated:
+        # The login already succeeded; the hash is upgraded on a quieter attempt.
+        return
+    logger.info("Rehashed password", user_id=user.id)
+
+
 async def create_refresh_token_record(
     db: AsyncSession,
     user_id: str,
@@ -162,19 +177,36 @@ async def revoke_refresh_token(db: AsyncSession, token: str) -> bool:
     return False
 
 
-async def get_current_user(
+async def get_token_payload(
     credentials: HTTPAuthorizationCredentials = Depends(security),
-    db: AsyncSession = Depends(get_db),
-) -> User:
-    token = credentials.credentials
-    payload = decode_token(token)
+) -> TokenPayload:
+    payload = decode_token(credentials.credentials)
     if not payload or payload.type != "access":
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
             detail="Invalid authentication credentials",
             headers={"WWW-Authenticate": "Bearer"},
         )
-    user = await get_user_by_id(db, payload.sub)
+    return payload
+
+
+def principal_from_claims(payload: TokenPayload) -> User:
+    return principal_from_data(
+        {
+            "id": payload.sub,
+            "tenant_id": payload.tenant_id,
+            "email": payload.email,
+            "role": payload.role,
+            "is_active": True,
+        }
+    )
+
+
+async def get_current_user_record(
+    payload: TokenPayload = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    user = await get_principal(db, payload.sub)
     if not user:
         raise HTTPException(
             status_code=status.HTTP_401_UNAUTHORIZED,
@@ -190,6 +222,23 @@ async def get_current_user(
     return user
 
 
+async def get_current_user(
+    payload: TokenPayload = Depends(get_token_payload),
+    db: AsyncSession = Depends(get_db),
+) -> User:
+    # In claims mode the principal comes from the verified token alone, as long as the
+    # revocation filter is current; otherwise fall back to the user record.
+    if settings.AUTH_MODE == "claims" and payload.tenant_id and filter_is_fresh():
+        if await is_revoked(payload):
+            raise HTTPException(
+                status_code=status.HTTP_401_UNAUTHORIZED,
+                detail="Token revoked",
+                headers={"WWW-Authenticate": "Bearer"},
+            )
+        return principal_from_claims(payload)
+    return await get_current_user_record(payload, db)
+
+
 async def get_current_tenant(
     current_user: User = Depends(get_current_user),
     db: AsyncSession = Depends(get_db),
@@ -0,0 +1,32 @@
+import base64
+import hashlib
+from typing import Optional
+
+from cryptography.fernet import Fernet, InvalidToken
+
+from src.core.config import settings
+
+
+class SecretError(ValueError):
+    pass
+
+
+def _fernet() -> Fernet:
+    # Fernet needs a 32-byte key; ENCRYPTION_KEY may be any passphrase.
+    key = hashlib.sha256(settings.ENCRYPTION_KEY.encode()).digest()
+    return Fernet(base64.urlsafe_b64encode(key))
+
+
+def encrypt_secret(value: Optional[str]) -> Optional[str]:
+    if value is None:
+        return None
+    return _fernet().encrypt(value.encode()).decode()
+
+
+def decrypt_secret(token: Optional[str]) -> Optional[str]:
+    if token is None:
+        return None
+    try:
+        return _fernet().decrypt(token.encode()).decode()
+    except InvalidToken as exc:
+        raise SecretError("Stored secret cannot be decrypted with ENCRYPTION_KEY") from exc
@@ -2,6 +2,19 @@ from src.services.frameworks.soc2 import get_soc2_controls, assess_soc2_control
 from src.services.frameworks.gdpr import get_gdpr_controls, assess_gdpr_control
 from src.services.frameworks.hipaa import get_hipaa_controls, assess_hipaa_control
 from src.services.frameworks.iso27001 import get_iso27001_controls, assess_iso27001_control
+from src.services.frameworks.registry import (
+    FRAMEWORK_REGISTRY,
+    assess_bulk,
+    build_evidence_matrix,
+    catalog_name,
+    get_framework,
+)
+from src.services.frameworks.crosswalk import (
+    control_index,
+    crosswalk_support,
+    equivalent_controls,
+    framework_coverage,
+)
 
 __all__ = [
     "get_soc2_controls",
@@ -12,4 +25,13 @@ __all__ = [
     "assess_hipaa_control",
     "get_iso27001_controls",
     "assess_iso27001_control",
+    "FRAMEWORK_REGISTRY",
+    "assess_bulk",
+    "build_evidence_matrix",
+    "get_framework",
+    "catalog_name",
+    "control_index",
+    "crosswalk_support",
+    "equivalent_controls",
+    "framework_coverage",
 ]
@@ -0,0 +1,155 @@
+from typing import Optional
+
+import numpy as np
+
+from src.services.frameworks.registry import FRAMEWORK_CATALOGS, catalog_name
+
+# Controls in the same group satisfy each other across frameworks. A control may sit in
+# several groups; controls of the same framework are never linked to each other.
+CROSSWALK_GROUPS = {
+    "access_control": {
+        "soc2": ("CC6.1", "CC6.2"),
+        "iso27001": ("A.9",),
+        "hipaa": ("164.308.A.2", "164.312.A.1"),
+        "gdpr": ("ART32",),
+    },
+    "physical_security": {
+        "soc2": ("CC6.4",),
+        "iso27001": ("A.11",),
+        "hipaa": ("164.310.A.1", "164.310.B", "164.310.C"),
+    },
+    "encryption_and_transmission": {
+        "iso27001": ("A.10", "A.13"),
+        "hipaa": ("164.312.C.1",),
+        "gdpr": ("ART5.1.F", "ART32"),
+    },
+    "integrity_and_logging": {
+        "soc2": ("CC7.1",),
+        "iso27001": ("A.12",),
+        "hipaa": ("164.312.A.2", "164.312.B"),
+        "gdpr": ("ART5.1.F",),
+    },
+    "change_management": {
+        "soc2": ("CC7.2",),
+        "iso27001": ("A.12", "A.14"),
+    },
+    "incident_response": {
+        "iso27001": ("A.16",),
+        "hipaa": ("164.308.A.4",),
+        "gdpr": ("ART33",),
+    },
+    "business_continuity": {
+        "soc2": ("CC8.1",),
+        "iso27001": ("A.17",),
+        "hipaa": ("164.308.A.5",),
+    },
+    "risk_management": {
+        "soc2": ("CC3.1", "CC9.1"),
+        "hipaa": ("164.308.A.1",),
+        "gdpr": ("ART32",),
+    },
+    "policies": {
+        "soc2": ("CC1.1", "CC3.2"),
+        "iso27001": ("A.5",),
+        "hipaa": ("164.308.A.1", "164.316"),
+        "gdpr": ("ART24",),
+    },
+    "roles_and_governance": {
+        "soc2": ("CC1.2", "CC1.3"),
+        "iso27001": ("A.6",),
+    },
+    "awareness_training": {
+        "soc2": ("CC2.2",),
+        "iso27001": ("A.7",),
+        "hipaa": ("164.308.A.3",),
+    },
+    "asset_inventory": {
+        "soc2": ("CC2.1",),
+        "iso27001": ("A.8",),
+        "hipaa": ("164.310.D.1",),
+        "gdpr": ("ART30",),
+    },
+    "privacy_by_design": {
+        "iso27001": ("A.14",),
+        "gdpr": ("ART24", "ART5.1.C"),
+    },
+    "suppliers": {
+        "soc2": ("CC9.1",),
+        "iso27001": ("A.15",),
+        "hipaa": ("164.308.A.7", "164.314.A", "164.314.B.1"),
+        "gdpr": ("ART28",),
+    },
+    "monitoring_and_compliance": {
+        "soc2": ("CC4.1",),
+        "iso27001": ("A.18",),
+        "hipaa": ("164.308.A.6",),
+        "gdpr": ("ART5.1.A",),
+    },
+}
+
+CONTROL_KEYS = [
+    (framework, control_id)
+    for framework, controls in FRAMEWORK_CATALOGS.items()
+    for control_id in controls
+]
+CONTROL_INDEX = {key: i for i, key in enumerate(CONTROL_KEYS)}
+_bounds = np.cumsum([0] + [len(controls) for controls in FRAMEWORK_CATALOGS.values()])
+FRAMEWORK_SLICES = {
+    framework: slice(int(start), int(stop))
+    for framework, start, stop in zip(FRAMEWORK_CATALOGS, _bounds, _bounds[1:])
+}
+
+
+def _build_adjacency() -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    edges = set()
+    for group in CROSSWALK_GROUPS.values():
+        members = [
+            CONTROL_INDEX[(framework, control_id)]
+            for framework, control_ids in group.items()
+            for control_id in control_ids
+        ]
+        edges.update(
+            (a, b) for a in members for b in members if CONTROL_KEYS[a][0] != CONTROL_KEYS[b][0]
+        )
+    pairs = np.array(sorted(edges), dtype=np.int32).reshape(-1, 2)
+    indptr = np.zeros(len(CONTROL_KEYS) + 1, dtype=np.int32)
+    np.cumsum(np.bincount(pairs[:, 0], minlength=len(CONTROL_KEYS)), out=indptr[1:])
+    return indptr, pairs[:, 0].copy(), pairs[:, 1].copy()
+
+
+# CSR adjacency over integer control ids: the equivalents of control i are
+# CROSSWALK_INDICES[CROSSWALK_INDPTR[i]:CROSSWALK_INDPTR[i + 1]]. CROSSWALK_ROWS repeats
+# each row id per edge so coverage is a single bincount over all edges.
+CROSSWALK_INDPTR, CROSSWALK_ROWS, CROSSWALK_INDICES = _build_adjacency()
+
+
+def control_index(framework: str, control_id: str) -> Optional[int]:
+    return CONTROL_INDEX.get((framework, control_id))
+
+
+def equivalent_controls(index: int) -> np.ndarray:
+    return CROSSWALK_INDICES[CROSSWALK_INDPTR[index] : CROSSWALK_INDPTR[index + 1]]
+
+
+def crosswalk_support(satisfied: np.ndarray) -> np.ndarray:
+    # Number of equivalent controls in other frameworks with evidence, for every control.
+    return np.bincount(
+        CROSSWALK_ROWS,
+        weights=satisfied[CROSSWALK_INDICES],
+        minlength=len(CONTROL_KEYS),
+    ).astype(np.int32)
+
+
+def framework_coverage(satisfied: np.ndarray, framework: str) -> dict:
+    window = FRAMEWORK_SLICES[framework]
+    compliant = satisfied[window]
+    covered = ~compliant & (crosswalk_support(satisfied)[window] > 0)
+    total = compliant.size
+    return {
+        "framework": framework,
+        "controls": total,
+        "compliant": int(compliant.sum()),
+        "covered": int(covered.sum()),
+        "gaps": int(total - compliant.sum() - covered.sum()),
+        "coverage": round(100 * float((compliant | covered).sum()) / total, 1),
+    }
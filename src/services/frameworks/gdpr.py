@@ -102,6 +102,16 @@ GDPR_CONTROLS = {
 }
 
 
+GDPR_EVIDENCE_WEIGHTS = {
+    "policy_documented": 25,
+    "process_implemented": 25,
+    "evidence_collected": 25,
+    "training_completed": 15,
+    "audit_trail": 10,
+}
+GDPR_STATUS_THRESHOLDS = (75, 40)
+
+
 def get_gdpr_controls():
     return GDPR_CONTROLS
 
@@ -115,21 +125,14 @@ def assess_gdpr_control(control_id: str, evidence: dict) -> dict:
         return {"error": "Unknown control"}
 
     control = GDPR_CONTROLS[control_id]
-    score = 0
-    max_score = 100
-
-    if evidence.get("policy_documented"):
-        score += 25
-    if evidence.get("process_implemented"):
-        score += 25
-    if evidence.get("evidence_collected"):
-        score += 25
-    if evidence.get("training_completed"):
-        score += 15
-    if evidence.get("audit_trail"):
-        score += 10
-
-    status = "compliant" if score >= 75 else "partial" if score >= 40 else "non_compliant"
+    score = sum(weight for field, weight in GDPR_EVIDENCE_WEIGHTS.items() if evidence.get(field))
+    max_score = sum(GDPR_EVIDENCE_WEIGHTS.values())
+    compliant_score, partial_score = GDPR_STATUS_THRESHOLDS
+    status = (
+        "compliant"
+        if score >= compliant_score
+        else "partial" if score >= partial_score else "non_compliant"
+    )
 
     return {
         "control_id": control_id,
@@ -92,6 +92,17 @@ HIPAA_CONTROLS = {
 }
 
 
+HIPAA_EVIDENCE_WEIGHTS = {
+    "policy_documented": 20,
+    "procedure_implemented": 25,
+    "training_completed": 15,
+    "audit_trail": 15,
+    "testing_performed": 15,
+    "incident_response": 10,
+}
+HIPAA_STATUS_THRESHOLDS = (75, 40)
+
+
 def get_hipaa_controls():
     return HIPAA_CONTROLS
 
@@ -105,23 +116,14 @@ def assess_hipaa_control(control_id: str, evidence: dict) -> dict:
         return {"error": "Unknown control"}
 
     control = HIPAA_CONTROLS[control_id]
-    score = 0
-    max_score = 100
-
-    if evidence.get("policy_documented"):
-        score += 20
-    if evidence.get("procedure_implemented"):
-        score += 25
-    if evidence.get("training_completed"):
-        score += 15
-    if evidence.get("audit_trail"):
-        score += 15
-    if evidence.get("testing_performed"):
-        score += 15
-    if evidence.get("incident_response"):
-        score += 10
-
-    status = "compliant" if score >= 75 else "partial" if score >= 40 else "non_compliant"
+    score = sum(weight for field, weight in HIPAA_EVIDENCE_WEIGHTS.items() if evidence.get(field))
+    max_score = sum(HIPAA_EVIDENCE_WEIGHTS.values())
+    compliant_score, partial_score = HIPAA_STATUS_THRESHOLDS
+    status = (
+        "compliant"
+        if score >= compliant_score
+        else "partial" if score >= partial_score else "non_compliant"
+    )
 
     return {
         "control_id": control_id,
@@ -72,6 +72,17 @@ ISO27001_CONTROLS = {
 }
 
 
+ISO27001_EVIDENCE_WEIGHTS = {
+    "policy_implemented": 20,
+    "procedure_documented": 20,
+    "evidence_collected": 20,
+    "training_completed": 15,
+    "audit_completed": 15,
+    "continuous_improvement": 10,
+}
+ISO27001_STATUS_THRESHOLDS = (75, 40)
+
+
 def get_iso27001_controls():
     return ISO27001_CONTROLS
 
@@ -85,23 +96,16 @@ def assess_iso27001_control(control_id: str, evidence: dict) -> dict:
         return {"error": "Unknown control"}
 
     control = ISO27001_CONTROLS[control_id]
-    score = 0
-    max_score = 100
-
-    if evidence.get("policy_implemented"):
-        score += 20
-    if evidence.get("procedure_documented"):
-        score += 20
-    if evidence.get("evidence_collected"):
-        score += 20
-    if evidence.get("training_completed"):
-        score += 15
-    if evidence.get("audit_completed"):
-        score += 15
-    if evidence.get("continuous_improvement"):
-        score += 10
-
-    status = "compliant" if score >= 75 else "partial" if score >= 40 else "non_compliant"
+    score = sum(
+        weight for field, weight in ISO27001_EVIDENCE_WEIGHTS.items() if evidence.get(field)
+    )
+    max_score = sum(ISO27001_EVIDENCE_WEIGHTS.values())
+    compliant_score, partial_score = ISO27001_STATUS_THRESHOLDS
+    status = (
+        "compliant"
+        if score >= compliant_score
+        else "partial" if score >= partial_score else "non_compliant"
+    )
 
     return {
         "control_id": control_id,
@@ -0,0 +1,139 @@
+import re
+from typing import Callable, Iterable, NamedTuple, Optional
+
+import numpy as np
+
+from src.services.frameworks.gdpr import (
+    GDPR_CONTROLS,
+    GDPR_EVIDENCE_WEIGHTS,
+    GDPR_STATUS_THRESHOLDS,
+    assess_gdpr_control,
+)
+from src.services.frameworks.hipaa import (
+    HIPAA_CONTROLS,
+    HIPAA_EVIDENCE_WEIGHTS,
+    HIPAA_STATUS_THRESHOLDS,
+    assess_hipaa_control,
+)
+from src.services.frameworks.iso27001 import (
+    ISO27001_CONTROLS,
+    ISO27001_EVIDENCE_WEIGHTS,
+    ISO27001_STATUS_THRESHOLDS,
+    assess_iso27001_control,
+)
+from src.services.frameworks.soc2 import (
+    SOC2_CONTROLS,
+    SOC2_EVIDENCE_WEIGHTS,
+    SOC2_STATUS_THRESHOLDS,
+    assess_soc2_control,
+)
+
+# Indexed by the number of thresholds a score reaches.
+STATUS_LABELS = np.array(["non_compliant", "partial", "compliant"])
+
+
+class FrameworkColumns(NamedTuple):
+    name: str
+    control_ids: np.ndarray
+    categories: np.ndarray
+    evidence_fields: tuple[str, ...]
+    weights: np.ndarray
+    compliant_score: int
+    partial_score: int
+    index: dict[str, int]
+    assess: Callable[[str, dict], dict]
+
+
+class BulkAssessment(NamedTuple):
+    scores: np.ndarray
+    statuses: np.ndarray
+
+
+def _columns(name, controls, category_field, weights, thresholds, assess) -> FrameworkColumns:
+    control_ids = list(controls)
+    return FrameworkColumns(
+        name=name,
+        control_ids=np.array(control_ids),
+        categories=np.array([control[category_field] for control in controls.values()]),
+        evidence_fields=tuple(weights),
+        weights=np.array(list(weights.values()), dtype=np.int32),
+        compliant_score=thresholds[0],
+        partial_score=thresholds[1],
+        index={control_id: i for i, control_id in enumerate(control_ids)},
+        assess=assess,
+    )
+
+
+FRAMEWORK_REGISTRY = {
+    "soc2": _columns(
+        "soc2",
+        SOC2_CONTROLS,
+        "category",
+        SOC2_EVIDENCE_WEIGHTS,
+        SOC2_STATUS_THRESHOLDS,
+        assess_soc2_control,
+    ),
+    "iso27001": _columns(
+        "iso27001",
+        ISO27001_CONTROLS,
+        "domain",
+        ISO27001_EVIDENCE_WEIGHTS,
+        ISO27001_STATUS_THRESHOLDS,
+        assess_iso27001_control,
+    ),
+    "hipaa": _columns(
+        "hipaa",
+        HIPAA_CONTROLS,
+        "safeguard",
+        HIPAA_EVIDENCE_WEIGHTS,
+        HIPAA_STATUS_THRESHOLDS,
+        assess_hipaa_control,
+    ),
+    "gdpr": _columns(
+        "gdpr",
+        GDPR_CONTROLS,
+        "article",
+        GDPR_EVIDENCE_WEIGHTS,
+        GDPR_STATUS_THRESHOLDS,
+        assess_gdpr_control,
+    ),
+}
+FRAMEWORK_CATALOGS = {
+    "soc2": SOC2_CONTROLS,
+    "iso27001": ISO27001_CONTROLS,
+    "hipaa": HIPAA_CONTROLS,
+    "gdpr": GDPR_CONTROLS,
+}
+
+
+def catalog_name(framework_type: Optional[str]) -> Optional[str]:
+    name = re.sub(r"[^a-z0-9]", "", (framework_type or "").lower())
+    return name if name in FRAMEWORK_REGISTRY else None
+
+
+def get_framework(framework: str) -> FrameworkColumns:
+    name = catalog_name(framework)
+    if name is None:
+        raise ValueError(f"Unknown framework: {framework}")
+    return FRAMEWORK_REGISTRY[name]
+
+
+def build_evidence_matrix(framework: str, evidence: Iterable[dict]) -> np.ndarray:
+    fields = get_framework(framework).evidence_fields
+    rows = [[bool(item.get(field)) for field in fields] for item in evidence]
+    return np.array(rows, dtype=bool).reshape(-1, len(fields))
+
+
+def assess_bulk(framework: str, evidence_matrix: np.ndarray) -> BulkAssessment:
+    # evidence_matrix has evidence fields on its last axis, in evidence_fields order; any
+    # leading axes (e.g. tenants x controls) are scored together in one matrix product.
+    columns = get_framework(framework)
+    evidence = np.asarray(evidence_matrix, dtype=bool)
+    if evidence.shape[-1] != len(columns.evidence_fields):
+        raise ValueError(
+            f"{columns.name} evidence needs {len(columns.evidence_fields)} fields, "
+            f"got {evidence.shape[-1]}"
+        )
+    scores = evidence @ columns.weights
+    levels = (scores >= columns.partial_score).astype(np.int8) + (scores >= columns.compliant_score)
+    return BulkAssessment(scores, STATUS_LABELS[levels])
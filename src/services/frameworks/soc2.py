@@ -45,7 +45,7 @@ SOC2_CONTROLS = {
         "category": "Risk Assessment",
     },
     "CC6.1": {
-        "name": "Logical & Physical Access",
+        "name": "Logical Access Security",
         "description": "Entity implements logical access controls",
         "category": "Logical Access",
     },
@@ -54,6 +54,11 @@ SOC2_CONTROLS = {
         "description": "Entity implements multi-factor authentication",
         "category": "Logical Access",
     },
+    "CC6.4": {
+        "name": "Physical Access",
+        "description": "Entity restricts physical access to facilities and protected assets",
+        "category": "Physical Access",
+    },
     "CC7.1": {
         "name": "System Operations",
         "description": "Entity defines security operating parameters",
@@ -77,6 +82,17 @@ SOC2_CONTROLS = {
 }
 
 
+SOC2_EVIDENCE_WEIGHTS = {
+    "policy_exists": 20,
+    "policy_reviewed": 10,
+    "procedure_documented": 20,
+    "training_completed": 15,
+    "testing_performed": 20,
+    "audit_passed": 15,
+}
+SOC2_STATUS_THRESHOLDS = (70, 40)
+
+
 def get_soc2_controls():
     return SOC2_CONTROLS
 
@@ -90,23 +106,14 @@ def assess_soc2_control(control_id: str, evidence: dict) -> dict:
         return {"error": "Unknown control"}
 
     control = SOC2_CONTROLS[control_id]
-    score = 0
-    max_score = 100
-
-    if evidence.get("policy_exists"):
-        score += 20
-    if evidence.get("policy_reviewed"):
-        score += 10
-    if evidence.get("procedure_documented"):
-        score += 20
-    if evidence.get("training_completed"):
-        score += 15
-    if evidence.get("testing_performed"):
-        score += 20
-    if evidence.get("audit_passed"):
-        score += 15
-
-    status = "compliant" if score >= 70 else "partial" if score >= 40 else "non_compliant"
+    score = sum(weight for field, weight in SOC2_EVIDENCE_WEIGHTS.items() if evidence.get(field))
+    max_score = sum(SOC2_EVIDENCE_WEIGHTS.values())
+    compliant_score, partial_score = SOC2_STATUS_THRESHOLDS
+    status = (
+        "compliant"
+        if score >= compliant_score
+        else "partial" if score >= partial_score else "non_compliant"
+    )
 
     return {
         "control_id": control_id,
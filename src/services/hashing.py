@@ -0,0 +1,170 @@
+import asyncio
+import math
+import statistics
+import threading
+import time
+from concurrent.futures import Future, ThreadPoolExecutor
+from typing import Callable, Optional, TypeVar
+
+from passlib.context import CryptContext
+from passlib.hash import bcrypt
+from prometheus_client import Counter, Gauge, Histogram
+
+from src.core.config import settings
+from src.core.logging import get_logger
+
+logger = get_logger(__name__)
+
+T = TypeVar("T")
+
+pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
+
+HASH_SECONDS = Histogram(
+    "password_hash_seconds",
+    "Time spent computing password hashes on the hashing pool",
+    ["operation"],
+    buckets=(0.01, 0.025, 0.05, 0.1, 0.175, 0.25, 0.35, 0.5, 0.75, 1.0, 2.5),
+)
+HASH_ROUNDS = Gauge(
+    "password_hash_bcrypt_rounds",
+    "bcrypt cost new password hashes are created with",
+)
+
+HASH_QUEUE_DEPTH = Gauge(
+    "password_hash_queue_depth",
+    "Password hash jobs waiting for a hashing pool thread",
+)
+HASH_IN_FLIGHT = Gauge(
+    "password_hash_in_flight",
+    "Password hash jobs admitted to the hashing pool, running or queued",
+)
+HASH_QUEUE_WAIT = Histogram(
+    "password_hash_queue_wait_seconds",
+    "Time password hash jobs spend queued before a pool thread picks them up",
+    buckets=(0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0),
+)
+HASH_REJECTIONS = Counter(
+    "password_hash_rejections_total",
+    "Password hash jobs shed because the hashing pool was saturated",
+    ["operation"],
+)
+
+
+class HashPoolSaturated(Exception):
+    def __init__(self, retry_after: int):
+        super().__init__("Password hashing pool is saturated")
+        self.retry_after = retry_after
+
+
+_executor: Optional[ThreadPoolExecutor] = None
+_lock = threading.Lock()
+_admitted = 0
+_running = 0
+# Moving average of one hash, seeded with bcrypt's cost at 12 rounds.
+_hash_seconds = 0.25
+
+
+def set_bcrypt_rounds(rounds: int, min_rounds: int) -> None:
+    # Every pod hashes with the same configured cost. needs_update only flags hashes below
+    # the floor, so logins never move a stored hash down or back and forth between costs.
+    if min_rounds > rounds:
+        raise ValueError(f"BCRYPT_MIN_ROUNDS ({min_rounds}) exceeds BCRYPT_ROUNDS ({rounds})")
+    pwd_context.update(bcrypt__default_rounds=rounds, bcrypt__min_rounds=min_rounds)
+    HASH_ROUNDS.set(rounds)
+
+
+set_bcrypt_rounds(settings.BCRYPT_ROUNDS, settings.BCRYPT_MIN_ROUNDS)
+
+
+def time_bcrypt(rounds: int, samples: int = 3) -> float:
+    handler = bcrypt.using(rounds=rounds)
+    timings = []
+    for _ in range(samples):
+        start = time.perf_counter()
+        handler.hash("calibration")
+        timings.append(time.perf_counter() - start)
+    return statistics.median(timings)
+
+
+def get_executor() -> ThreadPoolExecutor:
+    global _executor
+    if _executor is None:
+        _executor = ThreadPoolExecutor(
+            max_workers=settings.PASSWORD_HASH_WORKERS, thread_name_prefix="password-hash"
+        )
+    return _executor
+
+
+def shutdown_hash_pool() -> None:
+    global _executor
+    if _executor is not None:
+        _executor.shutdown(wait=False, cancel_futures=True)
+        _executor = None
+
+
+def queue_depth() -> int:
+    return max(0, _admitted - _running)
+
+
+HASH_QUEUE_DEPTH.set_function(queue_depth)
+HASH_IN_FLIGHT.set_function(lambda: _admitted)
+
+
+def retry_after_seconds() -> int:
+    waves = queue_depth() / settings.PASSWORD_HASH_WORKERS + 1
+    return max(1, math.ceil(waves * _hash_seconds))
+
+
+def _release(future: Future) -> None:
+    global _admitted
+    with _lock:
+        _admitted -= 1
+
+
+def _timed(operation: str, fn: Callable[..., T], args: tuple, queued_at: float) -> T:
+    global _running, _hash_seconds
+    started = time.perf_counter()
+    HASH_QUEUE_WAIT.observe(started - queued_at)
+    with _lock:
+        _running += 1
+    try:
+        return fn(*args)
+    finally:
+        elapsed = time.perf_counter() - started
+        HASH_SECONDS.labels(operation).observe(elapsed)
+        with _lock:
+            _running -= 1
+            _hash_seconds = 0.9 * _hash_seconds + 0.1 * elapsed
+
+
+async def run_hash(operation: str, fn: Callable[..., T], *args) -> T:
+    # bcrypt releases the GIL, so a small thread pool keeps hashing off the event loop.
+    # Jobs beyond the pool and its queue are shed rather than left to pile up.
+    global _admitted
+    with _lock:
+        saturated = _admitted >= settings.PASSWORD_HASH_WORKERS + settings.PASSWORD_HASH_MAX_QUEUE
+        if not saturated:
+            _admitted += 1
+    if saturated:
+        HASH_REJECTIONS.labels(operation).inc()
+        raise HashPoolSaturated(retry_after_seconds())
+
+    future = get_executor().submit(_timed, operation, fn, args, time.perf_counter())
+    future.add_done_callback(_release)
+    return await asyncio.wrap_future(future)
+
+
+async def configure_password_hashing() -> None:
+    # Times the configured cost to seed the Retry-After estimate; the cost itself is a
+    # fleet-wide setting and is never derived from this pod's hardware.
+    global _hash_seconds
+    rounds = settings.BCRYPT_ROUNDS
+    elapsed = await asyncio.wrap_future(get_executor().submit(time_bcrypt, rounds))
+    _hash_seconds = elapsed
+    log = logger.warning if elapsed * 1000 > settings.PASSWORD_HASH_TARGET_MS else logger.info
+    log(
+        "Timed password hashing",
+        bcrypt_rounds=rounds,
+        estimated_ms=round(elapsed * 1000),
+        target_ms=settings.PASSWORD_HASH_TARGET_MS,
+    )
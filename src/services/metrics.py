@@ -0,0 +1,232 @@
+import random
+from datetime import datetime
+from typing import Iterable, Optional
+
+from sqlalchemy import BigInteger, cast, func, select, update
+from sqlalchemy.dialects.postgresql import insert
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.models.assessment import Assessment, ConsentRecord, DataDiscoveryScan, DSRRequest
+from src.models.metrics import TenantMetrics
+
+METRIC_COLUMNS = [
+    "assessments_total",
+    "assessments_completed",
+    "assessments_in_progress",
+    "assessments_score_sum",
+    "scans_total",
+    "scans_pii_total",
+    "scans_risk_sum",
+    "consents_total",
+    "consents_granted",
+    "consents_withdrawn",
+    "dsrs_total",
+    "dsrs_pending",
+    "dsrs_completed",
+]
+
+PENDING_DSR_STATUSES = ["pending", "in_progress"]
+
+
+def _assessment_metrics(assessment: Assessment) -> dict[str, int]:
+    return {
+        "assessments_total": 1,
+        "assessments_completed": int(assessment.status == "completed"),
+        "assessments_in_progress": int(assessment.status == "in_progress"),
+        "assessments_score_sum": assessment.score or 0,
+    }
+
+
+def _scan_metrics(scan: DataDiscoveryScan) -> dict[str, int]:
+    return {
+        "scans_total": 1,
+        "scans_pii_total": scan.total_pii or 0,
+        "scans_risk_sum": scan.risk_score or 0,
+    }
+
+
+def _consent_metrics(record: ConsentRecord) -> dict[str, int]:
+    return {
+        "consents_total": 1,
+        "consents_granted": int(bool(record.consent_given)),
+        "consents_withdrawn": int(record.withdrawn_at is not None),
+    }
+
+
+def _dsr_metrics(dsr: DSRRequest) -> dict[str, int]:
+    return {
+        "dsrs_total": 1,
+        "dsrs_pending": int(dsr.status in PENDING_DSR_STATUSES),
+        "dsrs_completed": int(dsr.status == "completed"),
+    }
+
+
+_METRICS_BY_MODEL = {
+    Assessment: _assessment_metrics,
+    DataDiscoveryScan: _scan_metrics,
+    ConsentRecord: _consent_metrics,
+    DSRRequest: _dsr_metrics,
+}
+
+
+def metrics_of(obj) -> dict[str, int]:
+    return _METRICS_BY_MODEL[type(obj)](obj)
+
+
+def metrics_slot(session: Session) -> int:
+    # Each tenant's counters are spread over TENANT_METRICS_SLOTS rows so concurrent writers
+    # rarely queue on the same row lock. A session keeps one slot, so a transaction never
+    # holds more than one counter row per tenant.
+    return session.info.setdefault(
+        "tenant_metrics_slot", random.randrange(settings.TENANT_METRICS_SLOTS)
+    )
+
+
+def tenant_metrics_update(
+    tenant_id: str, before: dict[str, int], after: dict[str, int], slot: int = 0
+):
+    delta = {
+        name: after.get(name, 0) - before.get(name, 0)
+        for name in before.keys() | after.keys()
+        if after.get(name, 0) != before.get(name, 0)
+    }
+    if not delta:
+        return None
+    return (
+        update(TenantMetrics)
+        .where(TenantMetrics.tenant_id == tenant_id, TenantMetrics.slot == slot)
+        .values({name: getattr(TenantMetrics, name) + n for name, n in delta.items()})
+    )
+
+
+def apply_tenant_metrics(db: Session, tenant_id: str, before: dict, after: dict) -> None:
+    slot = metrics_slot(db)
+    statement = tenant_metrics_update(tenant_id, before, after, slot)
+    # Slot rows other than 0 only exist once the tenant has been reconciled.
+    if statement is not None and db.execute(statement).rowcount == 0 and slot:
+        db.execute(tenant_metrics_update(tenant_id, before, after))
+
+
+async def update_tenant_metrics(
+    db: AsyncSession,
+    tenant_id: str,
+    before: dict[str, int],
+    after: dict[str, int],
+) -> None:
+    slot = metrics_slot(db)
+    statement = tenant_metrics_update(tenant_id, before, after, slot)
+    if statement is not None and (await db.execute(statement)).rowcount == 0 and slot:
+        await db.execute(tenant_metrics_update(tenant_id, before, after))
+
+
+def tenant_metrics_queries(tenant_ids: Optional[list[str]] = None) -> list:
+    aggregates = {
+        Assessment: [
+            func.count().label("assessments_total"),
+            func.count().filter(Assessment.status == "completed").label("assessments_completed"),
+            func.count()
+            .filter(Assessment.status == "in_progress")
+            .label("assessments_in_progress"),
+            func.coalesce(func.sum(Assessment.score), 0).label("assessments_score_sum"),
+        ],
+        DataDiscoveryScan: [
+            func.count().label("scans_total"),
+            func.coalesce(func.sum(DataDiscoveryScan.total_pii), 0).label("scans_pii_total"),
+            func.coalesce(func.sum(DataDiscoveryScan.risk_score), 0).label("scans_risk_sum"),
+        ],
+        ConsentRecord: [
+            func.count().label("consents_total"),
+            func.count().filter(ConsentRecord.consent_given == True).label("consents_granted"),
+            func.count().filter(ConsentRecord.withdrawn_at.isnot(None)).label("consents_withdrawn"),
+        ],
+        DSRRequest: [
+            func.count().label("dsrs_total"),
+            func.count().filter(DSRRequest.status.in_(PENDING_DSR_STATUSES)).label("dsrs_pending"),
+            func.count().filter(DSRRequest.status == "completed").label("dsrs_completed"),
+        ],
+    }
+    queries = []
+    for model, columns in aggregates.items():
+        query = select(model.tenant_id.label("tenant_id"), *columns).group_by(model.tenant_id)
+        if tenant_ids is not None:
+            query = query.where(model.tenant_id.in_(tenant_ids))
+        queries.append(query)
+    return queries
+
+
+def collect_tenant_metrics(rows: Iterable[dict]) -> dict[str, dict]:
+    metrics: dict[str, dict] = {}
+    for row in rows:
+        values = metrics.setdefault(row["tenant_id"], dict.fromkeys(METRIC_COLUMNS, 0))
+        values.update({name: int(value) for name, value in row.items() if name != "tenant_id"})
+    return metrics
+
+
+def tenant_metrics_upsert(metrics: dict[str, dict], overwrite: bool = True):
+    # Slot 0 carries the recounted totals and the other slots start again from zero.
+    now = datetime.utcnow()
+    zero = dict.fromkeys(METRIC_COLUMNS, 0)
+    statement = insert(TenantMetrics).values(
+        [
+            {
+                "tenant_id": tenant_id,
+                "slot": slot,
+                **(zero if slot else values),
+                "reconciled_at": now,
+                "updated_at": now,
+            }
+            for tenant_id, values in metrics.items()
+            for slot in range(settings.TENANT_METRICS_SLOTS)
+        ]
+    )
+    index_elements = [TenantMetrics.tenant_id, TenantMetrics.slot]
+    if not overwrite:
+        return statement.on_conflict_do_nothing(index_elements=index_elements)
+    return statement.on_conflict_do_update(
+        index_elements=index_elements,
+        set_={
+            name: statement.excluded[name]
+            for name in METRIC_COLUMNS + ["reconciled_at", "updated_at"]
+        },
+    )
+
+
+def tenant_metrics_select(tenant_id: str):
+    return (
+        select(
+            *[
+                cast(func.sum(getattr(TenantMetrics, name)), BigInteger).label(name)
+                for name in METRIC_COLUMNS
+            ]
+        )
+        .where(TenantMetrics.tenant_id == tenant_id)
+        .having(func.count() > 0)
+    )
+
+
+async def get_tenant_metrics(db: AsyncSession, tenant_id: str):
+    metrics = (await db.execute(tenant_metrics_select(tenant_id))).first()
+    if metrics is not None:
+        return metrics
+
+    rows = []
+    for query in tenant_metrics_queries([tenant_id]):
+        rows.extend((await db.execute(query)).mappings().all())
+    values = collect_tenant_metrics(rows).get(tenant_id, dict.fromkeys(METRIC_COLUMNS, 0))
+    await db.execute(tenant_metrics_upsert({tenant_id: values}, overwrite=False))
+    return (await db.execute(tenant_metrics_select(tenant_id))).one()
+
+
+async def count_upcoming_deadlines(db: AsyncSession, tenant_id: str) -> int:
+    # Depends on the current time, so it is counted on read rather than kept as a counter.
+    return await db.scalar(
+        select(func.count())
+        .select_from(Assessment)
+        .where(
+            Assessment.tenant_id == tenant_id,
+            Assessment.due_date > datetime.utcnow(),
+            Assessment.status != "completed",
+        )
+    )
@@ -0,0 +1,116 @@
+import base64
+import json
+from datetime import datetime
+from typing import Optional, Sequence
+
+from sqlalchemy import Select, func, or_, select
+from sqlalchemy.ext.asyncio import AsyncSession
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+
+NEXT_CURSOR_HEADER = "X-Next-Cursor"
+TOTAL_COUNT_HEADER = "X-Total-Count"
+TOTAL_MODES = ("exact", "estimated", "none")
+
+_count_cache = TTLCache(
+    settings.PAGINATION_COUNT_CACHE_SIZE, settings.PAGINATION_COUNT_CACHE_SECONDS
+)
+
+
+class PaginationError(ValueError):
+    pass
+
+
+def encode_cursor(created_at: datetime, row_id: str) -> str:
+    raw = json.dumps([created_at.isoformat(), row_id], separators=(",", ":")).encode()
+    return base64.urlsafe_b64encode(raw).decode().rstrip("=")
+
+
+def decode_cursor(cursor: str) -> tuple[datetime, str]:
+    try:
+        raw = base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4))
+        created_at, row_id = json.loads(raw)
+        return datetime.fromisoformat(created_at), str(row_id)
+    except (ValueError, TypeError) as e:
+        raise PaginationError("Invalid cursor") from e
+
+
+def paginate(
+    query: Select,
+    model,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+) -> Select:
+    if not 1 <= page_size <= settings.PAGINATION_MAX_PAGE_SIZE:
+        raise PaginationError(
+            f"page_size must be between 1 and {settings.PAGINATION_MAX_PAGE_SIZE}"
+        )
+
+    query = query.order_by(model.created_at.desc(), model.id.desc()).limit(page_size + 1)
+    if cursor:
+        created_at, row_id = decode_cursor(cursor)
+        return query.where(
+            model.created_at <= created_at,
+            or_(model.created_at < created_at, model.id < row_id),
+        )
+
+    offset = (page - 1) * page_size
+    if page < 1 or offset > settings.PAGINATION_MAX_OFFSET:
+        raise PaginationError(
+            f"page is limited to the first {settings.PAGINATION_MAX_OFFSET} rows; "
+            "use cursor to read further"
+        )
+    return query.offset(offset)
+
+
+def page_items(rows: Sequence, page_size: int) -> tuple[list, Optional[str]]:
+    items = list(rows[:page_size])
+    if len(rows) <= page_size:
+        return items, None
+    return items, encode_cursor(items[-1].created_at, items[-1].id)
+
+
+def count_cache_key(query: Select) -> tuple:
+    compiled = query.compile()
+    return str(compiled), tuple(sorted((k, str(v)) for k, v in compiled.params.items()))
+
+
+async def fetch_page(
+    db: AsyncSession,
+    query: Select,
+    model,
+    page: int = 1,
+    page_size: int = 20,
+    cursor: Optional[str] = None,
+    total: str = "none",
+) -> tuple[list, Optional[str], Optional[int]]:
+    if total not in TOTAL_MODES:
+        raise PaginationError(f"total must be one of {', '.join(TOTAL_MODES)}")
+
+    page_query = paginate(query, model, page, page_size, cursor)
+    cache_key = count_cache_key(query) if total == "estimated" else None
+    count = _count_cache.get(cache_key) if cache_key else None
+    if total == "none" or count is not None:
+        items, next_cursor = page_items((await db.execute(page_query)).scalars().all(), page_size)
+        return items, next_cursor, count
+
+    # The count rides along with the page: a window over the filtered rows for offset
+    # pages, and an uncorrelated subquery (evaluated once) when a cursor narrows the rows.
+    if cursor:
+        count_column = select(func.count()).select_from(query.subquery()).scalar_subquery()
+    else:
+        count_column = func.count().over()
+    rows = (await db.execute(page_query.add_columns(count_column.label("total")))).all()
+    items, next_cursor = page_items([row[0] for row in rows], page_size)
+    if rows:
+        count = rows[0].total
+    elif cursor or page > 1:
+        count = (await db.execute(select(func.count()).select_from(query.subquery()))).scalar_one()
+    else:
+        count = 0
+
+    if cache_key:
+        _count_cache.set(cache_key, count)
+    return items, next_cursor, count
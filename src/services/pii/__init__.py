@@ -0,0 +1,55 @@
+from src.services.pii.detectors import (
+    PII_TYPES,
+    PII_RISK_LEVELS,
+    detect_pii,
+    luhn_check,
+    ner_candidates,
+    verhoeff_check,
+)
+from src.services.pii.ner import detect_ner_pii, load_ner_model, ner_enabled
+from src.services.pii.sources import (
+    ScanChunk,
+    ScanSourceError,
+    check_source,
+    default_shard_count,
+    iter_shard_chunks,
+)
+from src.services.pii.scanner import ScanStats, iter_scan, run_scan
+from src.services.pii.manifest import (
+    IncrementalPlan,
+    build_manifest,
+    group_units,
+    iter_unit_scan,
+    manifest_stats,
+    plan_incremental,
+    scan_unit_group,
+    unit_entry,
+)
+
+__all__ = [
+    "PII_TYPES",
+    "PII_RISK_LEVELS",
+    "detect_pii",
+    "luhn_check",
+    "ner_candidates",
+    "verhoeff_check",
+    "detect_ner_pii",
+    "load_ner_model",
+    "ner_enabled",
+    "ScanChunk",
+    "ScanSourceError",
+    "check_source",
+    "default_shard_count",
+    "iter_shard_chunks",
+    "ScanStats",
+    "iter_scan",
+    "run_scan",
+    "IncrementalPlan",
+    "build_manifest",
+    "group_units",
+    "iter_unit_scan",
+    "manifest_stats",
+    "plan_incremental",
+    "scan_unit_group",
+    "unit_entry",
+]
@@ -0,0 +1,261 @@
+import re
+from bisect import bisect_right
+
+PII_TYPES = [
+    "PERSON_NAME",
+    "PHONE_NUMBER",
+    "EMAIL_ADDRESS",
+    "AADHAAR_NUMBER",
+    "PAN_NUMBER",
+    "PASSPORT_NUMBER",
+    "CREDIT_CARD_NUMBER",
+    "BANK_ACCOUNT_NUMBER",
+    "DATE_OF_BIRTH",
+    "ADDRESS",
+    "PIN_CODE",
+]
+
+PII_RISK_LEVELS = {
+    "PERSON_NAME": "low",
+    "PHONE_NUMBER": "medium",
+    "EMAIL_ADDRESS": "medium",
+    "AADHAAR_NUMBER": "high",
+    "PAN_NUMBER": "high",
+    "PASSPORT_NUMBER": "high",
+    "CREDIT_CARD_NUMBER": "high",
+    "BANK_ACCOUNT_NUMBER": "high",
+    "DATE_OF_BIRTH": "medium",
+    "ADDRESS": "medium",
+    "PIN_CODE": "low",
+}
+
+RISK_WEIGHTS = {"low": 10, "medium": 30, "high": 50}
+
+_VERHOEFF_D = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 2, 3, 4, 0, 6, 7, 8, 9, 5),
+    (2, 3, 4, 0, 1, 7, 8, 9, 5, 6),
+    (3, 4, 0, 1, 2, 8, 9, 5, 6, 7),
+    (4, 0, 1, 2, 3, 9, 5, 6, 7, 8),
+    (5, 9, 8, 7, 6, 0, 4, 3, 2, 1),
+    (6, 5, 9, 8, 7, 1, 0, 4, 3, 2),
+    (7, 6, 5, 9, 8, 2, 1, 0, 4, 3),
+    (8, 7, 6, 5, 9, 3, 2, 1, 0, 4),
+    (9, 8, 7, 6, 5, 4, 3, 2, 1, 0),
+)
+
+_VERHOEFF_P = (
+    (0, 1, 2, 3, 4, 5, 6, 7, 8, 9),
+    (1, 5, 7, 6, 2, 8, 3, 0, 9, 4),
+    (5, 8, 0, 3, 7, 9, 6, 1, 4, 2),
+    (8, 9, 1, 6, 0, 4, 3, 5, 2, 7),
+    (9, 4, 5, 3, 1, 2, 8, 7, 0, 6),
+    (4, 2, 8, 6, 5, 7, 3, 9, 1, 0),
+    (2, 7, 9, 3, 8, 0, 6, 4, 1, 5),
+    (7, 0, 4, 6, 9, 1, 3, 2, 5, 8),
+)
+
+_SEPARATORS = str.maketrans("", "", " -+")
+_ASCII_LOWER = str.maketrans(
+    "ABCDEFGHIJKLMNOPQRSTUVWXYZ",
+    "abcdefghijklmnopqrstuvwxyz",
+)
+
+
+def verhoeff_check(number: str) -> bool:
+    digits = number.translate(_SEPARATORS)
+    if not digits.isdigit():
+        return False
+    checksum = 0
+    for i, digit in enumerate(reversed(digits)):
+        checksum = _VERHOEFF_D[checksum][_VERHOEFF_P[i % 8][int(digit)]]
+    return checksum == 0
+
+
+def luhn_check(number: str) -> bool:
+    digits = number.translate(_SEPARATORS)
+    if not digits.isdigit() or not 13 <= len(digits) <= 19:
+        return False
+    total = 0
+    for i, digit in enumerate(reversed(digits)):
+        value = int(digit)
+        if i % 2 == 1:
+            value *= 2
+            if value > 9:
+                value -= 9
+        total += value
+    return total % 10 == 0
+
+
+# Python's regex engine only skips ahead quickly when a pattern starts with a
+# literal or a simple character class, so every detector is driven by one of a
+# handful of cheap candidate passes over the chunk and validated per candidate:
+# runs of digits, uppercase tokens, "@", context keywords, honorifics and street
+# suffixes. This keeps a chunk at six linear passes no matter how many detectors
+# share a pass.
+_NUMBER_RUN = re.compile(r"[+\d][\d -]{9,}")
+_UPPER_TOKEN = re.compile(r"[A-Z][A-Z0-9]{7,10}")
+_EMAIL_DOMAIN = re.compile(r"@[A-Za-z0-9-]+(?:\.[A-Za-z0-9-]+)*\.[A-Za-z]{2,}")
+_EMAIL_LOCAL_CHARS = frozenset("abcdefghijklmnopqrstuvwxyzABCDEFGHIJKLMNOPQRSTUVWXYZ0123456789._%+-")
+_HONORIFIC_NAME = re.compile(
+    r"(?:M(?:rs?|s|iss)|Dr|S(?:hri|mt|ri)|Kumari)\.? [A-Z][a-z]+(?: [A-Z][a-z]+){0,3}"
+)
+_STREET_SUFFIX = re.compile(r"(?:road|street|marg|nagar|colony|lane|sector|layout|avenue|apartment)")
+_HOUSE_NUMBER_BEFORE = re.compile(r"(?:^|[^a-z0-9])\d{1,5}[a-z]?(?:/\d+)?,? (?:[a-z0-9.'-]+ ){0,5}$")
+
+_PAN = re.compile(r"[A-Z]{3}[ABCFGHLJPT][A-Z]\d{4}[A-Z]")
+_IFSC = re.compile(r"[A-Z]{4}0[A-Z0-9]{6}")
+_PASSPORT = re.compile(r"[A-PR-WY][1-9]\d{6}")
+
+_CONTEXT_KEYWORDS = {
+    "name": "PERSON_NAME",
+    "date of birth": "DATE_OF_BIRTH",
+    "date_of_birth": "DATE_OF_BIRTH",
+    "birth_date": "DATE_OF_BIRTH",
+    "birthdate": "DATE_OF_BIRTH",
+    "birth date": "DATE_OF_BIRTH",
+    "born on": "DATE_OF_BIRTH",
+    "born": "DATE_OF_BIRTH",
+    "d.o.b": "DATE_OF_BIRTH",
+    "dob": "DATE_OF_BIRTH",
+    "address": "ADDRESS",
+    "addr": "ADDRESS",
+    "pincode": "PIN_CODE",
+    "pin code": "PIN_CODE",
+    "pin_code": "PIN_CODE",
+    "pin": "PIN_CODE",
+    "postal code": "PIN_CODE",
+    "postal_code": "PIN_CODE",
+    "zipcode": "PIN_CODE",
+    "zip code": "PIN_CODE",
+    "zip": "PIN_CODE",
+    "account": "BANK_ACCOUNT_NUMBER",
+    "acct": "BANK_ACCOUNT_NUMBER",
+    "a/c": "BANK_ACCOUNT_NUMBER",
+}
+_CONTEXT_KEYWORD = re.compile("|".join(re.escape(keyword) for keyword in _CONTEXT_KEYWORDS))
+_NAME_KEY_PREFIXES = ("first_", "last_", "full_", "middle_", "given_", "customer_", "contact_")
+
+_PIN_VALUE = r"[1-9]\d{2} ?\d{3}(?![ -]?\d)"
+_CONTEXT_VALUES = {
+    "PERSON_NAME": re.compile(r"\W{1,5}[A-Z][a-z]+(?: [A-Z][a-z]+){0,3}"),
+    "DATE_OF_BIRTH": re.compile(
+        r"\.?\W{0,5}(?:\d{1,2}[/.-]\d{1,2}[/.-](?:19|20)\d{2}|(?:19|20)\d{2}-\d{2}-\d{2})"
+    ),
+    "ADDRESS": re.compile(r"\W{1,5}([^\n]{10,})"),
+    "PIN_CODE": re.compile(r"\W{0,5}" + _PIN_VALUE),
+    "BANK_ACCOUNT_NUMBER": re.compile(
+        r"(?i:[ _.]?(?:number|num|no))?\.?\W{0,5}\d{9,18}(?![ -]?\d)"
+    ),
+}
+_PIN_IN_ADDRESS = re.compile(r"[A-Za-z],? ?[ ,-] ?" + _PIN_VALUE)
+_TITLE_CASE_PAIR = re.compile(r"[A-Z][a-z]+ [A-Z][a-z]+")
+
+
+def _classify_number(run: str) -> str | None:
+    digits = run.translate(_SEPARATORS)
+    length = len(digits)
+    if 13 <= length <= 19 and luhn_check(digits):
+        return "CREDIT_CARD_NUMBER"
+    if length == 12 and run[0] != "+" and digits[0] >= "2" and verhoeff_check(digits):
+        return "AADHAAR_NUMBER"
+    if run[0] == "+" and length == 12 and digits.startswith("91"):
+        digits = digits[2:]
+    elif length == 11 and digits[0] == "0":
+        digits = digits[1:]
+    if len(digits) == 10 and digits[0] >= "6":
+        return "PHONE_NUMBER"
+    return None
+
+
+def _classify_token(token: str) -> str | None:
+    if len(token) == 10 and _PAN.fullmatch(token):
+        return "PAN_NUMBER"
+    if len(token) == 11 and _IFSC.fullmatch(token):
+        return "BANK_ACCOUNT_NUMBER"
+    if len(token) == 8 and _PASSPORT.fullmatch(token):
+        return "PASSPORT_NUMBER"
+    return None
+
+
+def _increment(counts: dict[str, int], pii_type: str) -> None:
+    counts[pii_type] = counts.get(pii_type, 0) + 1
+
+
+def detect_pii(text: str) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    lowered = text.translate(_ASCII_LOWER)
+
+    for match in _NUMBER_RUN.finditer(text):
+        start = match.start()
+        if start and text[start - 1].isalnum():
+            continue
+        pii_type = _classify_number(match.group().rstrip(" -"))
+        if pii_type:
+            _increment(counts, pii_type)
+
+    for match in _UPPER_TOKEN.finditer(text):
+        start, end = match.span()
+        if (start and text[start - 1].isalnum()) or (end < len(text) and text[end].isalnum()):
+            continue
+        pii_type = _classify_token(match.group())
+        if pii_type:
+            _increment(counts, pii_type)
+
+    for match in _EMAIL_DOMAIN.finditer(text):
+        start = match.start()
+        if start and text[start - 1] in _EMAIL_LOCAL_CHARS:
+            _increment(counts, "EMAIL_ADDRESS")
+
+    address_spans: list[int] = [0, 0]
+    for match in _CONTEXT_KEYWORD.finditer(lowered):
+        start, end = match.span()
+        keyword = match.group()
+        if start < address_spans[-1] or (start and lowered[start - 1].isalpha()):
+            continue
+        if keyword == "name" and start and lowered[start - 1] == "_":
+            if not lowered.endswith(_NAME_KEY_PREFIXES, 0, start):
+                continue
+        pii_type = _CONTEXT_KEYWORDS[keyword]
+        value = _CONTEXT_VALUES[pii_type].match(text, end)
+        if not value:
+            continue
+        _increment(counts, pii_type)
+        if pii_type == "ADDRESS":
+            address_spans.extend(value.span())
+            if _PIN_IN_ADDRESS.search(value.group(1)):
+                _increment(counts, "PIN_CODE")
+
+    for match in _HONORIFIC_NAME.finditer(text):
+        start = match.start()
+        if not start or not text[start - 1].isalpha():
+            _increment(counts, "PERSON_NAME")
+
+    for match in _STREET_SUFFIX.finditer(lowered):
+        start = match.start()
+        if bisect_right(address_spans, start) % 2:
+            continue
+        if _HOUSE_NUMBER_BEFORE.search(lowered, max(start - 60, 0), start):
+            _increment(counts, "ADDRESS")
+
+    return counts
+
+
+def ner_candidates(text: str) -> list[str]:
+    # Lines that look like they carry a name or an address but that the detectors
+    # above could not confirm; only these are worth sending through NER.
+    lowered = text.translate(_ASCII_LOWER)
+    starts = {text.rfind("\n", 0, m.start()) + 1 for m in _TITLE_CASE_PAIR.finditer(text)}
+    for match in _STREET_SUFFIX.finditer(lowered):
+        start, end = match.span()
+        if (start and lowered[start - 1].isalpha()) or (end < len(lowered) and lowered[end].isalpha()):
+            continue
+        starts.add(lowered.rfind("\n", 0, start) + 1)
+    candidates = []
+    for start in sorted(starts):
+        end = text.find("\n", start)
+        line = text[start : end if end != -1 else len(text)]
+        counts = detect_pii(line)
+        if "PERSON_NAME" not in counts and "ADDRESS" not in counts:
+            candidates.append(line)
+    return candidates
@@ -0,0 +1,276 @@
+import csv
+import hashlib
+import json
+from pathlib import Path
+from typing import Iterator, NamedTuple, Optional
+
+from src.core.config import settings
+from src.services.pii.ner import ner_enabled
+from src.services.pii.scanner import ScanStats, scan_chunk
+from src.services.pii.sources import (
+    _is_integer_column,
+    _reflect_table,
+    _relative,
+    check_source,
+    database_engine,
+    iter_shard_chunks,
+    list_source_files,
+    scan_limit,
+)
+
+MANIFEST_VERSION = 1
+
+
+class IncrementalPlan(NamedTuple):
+    units: list[dict]
+    carried: dict[str, dict]
+    files: dict[str, str]
+    source: str
+    block_bytes: int
+
+
+def source_fingerprint(source_type: str, location: Optional[str], config: dict) -> str:
+    identity = {
+        "source_type": source_type,
+        "location": location,
+        "table": config.get("table"),
+        "columns": config.get("columns"),
+        "updated_at_column": config.get("updated_at_column"),
+        "ner": ner_enabled(config),
+        "block_bytes": scan_limit(
+            config, "block_bytes", settings.PII_SCAN_BLOCK_BYTES, settings.PII_SCAN_MAX_BLOCK_BYTES
+        ),
+        "bucket_rows": scan_limit(
+            config, "bucket_rows", settings.PII_SCAN_BUCKET_ROWS, settings.PII_SCAN_MAX_BUCKET_ROWS
+        ),
+    }
+    return hashlib.blake2b(
+        json.dumps(identity, sort_keys=True).encode(), digest_size=16
+    ).hexdigest()
+
+
+def _stat_fingerprint(path: Path) -> str:
+    stat = path.stat()
+    return f"{stat.st_size}:{stat.st_mtime_ns}"
+
+
+def _block_units(source_type: str, path: Path, block_bytes: int) -> Iterator[dict]:
+    # Blocks sit at fixed byte offsets and a line belongs to the block it starts in,
+    # the same rule the byte-range readers use, so appending to a file only changes
+    # the last block. CSV blocks also hash the header, which gives their rows meaning.
+    rel = _relative(path)
+    with open(path, "rb") as fh:
+        header_line = fh.readline() if source_type == "csv" else b""
+        header = next(csv.reader([header_line.decode("utf-8", errors="replace")]), None)
+        position = fh.tell()
+        index = None
+        digest = None
+        size = 0
+
+        def unit() -> dict:
+            shard = {
+                "source_type": source_type,
+                "files": [
+                    {
+                        "path": rel,
+                        "start": max(index * block_bytes, len(header_line)),
+                        "end": (index + 1) * block_bytes,
+                    }
+                ],
+            }
+            if source_type == "csv":
+                shard["header"] = header
+            return {
+                "key": f"{rel}#{index}",
+                "file": rel,
+                "fingerprint": digest.hexdigest(),
+                "weight": size,
+                "shard": shard,
+            }
+
+        for line in fh:
+            block = position // block_bytes
+            if block != index:
+                if digest is not None:
+                    yield unit()
+                index, digest, size = block, hashlib.blake2b(header_line, digest_size=16), 0
+            digest.update(line)
+            size += len(line)
+            position += len(line)
+        if digest is not None:
+            yield unit()
+
+
+def _file_units(source_type: str, path: Path, block_bytes: int) -> list[dict]:
+    if source_type in ("csv", "jsonl"):
+        return list(_block_units(source_type, path, block_bytes))
+    rel = _relative(path)
+    return [
+        {
+            "key": rel,
+            "file": rel,
+            "fingerprint": _stat_fingerprint(path),
+            "weight": path.stat().st_size,
+            "shard": {
+                "source_type": source_type,
+                "files": [{"path": rel, "start": 0, "end": None}],
+            },
+        }
+    ]
+
+
+def _database_units(connection_string: str, config: dict) -> list[dict]:
+    from sqlalchemy import func, null, select
+
+    table_name = config["table"]
+    bucket_rows = scan_limit(
+        config, "bucket_rows", settings.PII_SCAN_BUCKET_ROWS, settings.PII_SCAN_MAX_BUCKET_ROWS
+    )
+    base = {"source_type": "database", "table": table_name, "columns": config.get("columns")}
+    engine = database_engine(connection_string)
+    try:
+        table = _reflect_table(engine, table_name)
+        updated = table.c.get(config.get("updated_at_column", "updated_at"))
+        primary_key = list(table.primary_key.columns)
+        with engine.connect() as conn:
+            if len(primary_key) == 1 and _is_integer_column(primary_key[0]):
+                key = primary_key[0]
+                bucket = (key // bucket_rows).label("bucket")
+                changed_at = func.max(updated) if updated is not None else null()
+                rows = conn.execute(
+                    select(bucket, func.count(), changed_at).group_by(bucket).order_by(bucket)
+                ).all()
+                return [
+                    {
+                        "key": f"{table_name}#{index}",
+                        "fingerprint": f"{count}:{latest}" if updated is not None else None,
+                        "weight": count,
+                        "shard": {
+                            **base,
+                            "key": key.name,
+                            "lower": index * bucket_rows,
+                            "upper": (index + 1) * bucket_rows,
+                        },
+                    }
+                    for index, count, latest in rows
+                ]
+            fingerprint = None
+            count = conn.execute(select(func.count()).select_from(table)).scalar_one()
+            if updated is not None:
+                latest = conn.execute(select(func.max(updated))).scalar()
+                fingerprint = f"{count}:{latest}"
+    finally:
+        engine.dispose()
+    return [{"key": table_name, "fingerprint": fingerprint, "weight": count, "shard": base}]
+
+
+def plan_incremental(
+    source_type: str,
+    location: Optional[str],
+    config: Optional[dict] = None,
+    previous: Optional[dict] = None,
+) -> IncrementalPlan:
+    check_source(source_type, location, config)
+    config = config or {}
+    source = source_fingerprint(source_type, location, config)
+    block_bytes = scan_limit(
+        config, "block_bytes", settings.PII_SCAN_BLOCK_BYTES, settings.PII_SCAN_MAX_BLOCK_BYTES
+    )
+    if (
+        not previous
+        or previous.get("version") != MANIFEST_VERSION
+        or previous.get("source") != source
+    ):
+        previous = {}
+    previous_units = previous.get("units", {})
+    previous_files = previous.get("files", {})
+
+    units: list[dict] = []
+    carried: dict[str, dict] = {}
+    files: dict[str, str] = {}
+    if source_type == "database":
+        candidates = _database_units(location, config)
+    else:
+        candidates = []
+        for path in list_source_files(source_type, location):
+            rel = _relative(path)
+            files[rel] = _stat_fingerprint(path)
+            if previous_files.get(rel) == files[rel]:
+                carried.update({k: v for k, v in previous_units.items() if v.get("file") == rel})
+                continue
+            candidates.extend(_file_units(source_type, path, block_bytes))
+
+    for unit in candidates:
+        entry = previous_units.get(unit["key"])
+        if (
+            unit["fingerprint"] is not None
+            and entry
+            and entry["fingerprint"] == unit["fingerprint"]
+        ):
+            carried[unit["key"]] = entry
+        else:
+            units.append(unit)
+    return IncrementalPlan(units, carried, files, source, block_bytes)
+
+
+def unit_entry(unit: dict, stats: ScanStats) -> dict:
+    entry = {"fingerprint": unit["fingerprint"], **stats.to_dict()}
+    if "file" in unit:
+        entry["file"] = unit["file"]
+    return entry
+
+
+def iter_unit_scan(
+    units: list[dict],
+    location: Optional[str],
+    config: Optional[dict],
+    stats: ScanStats,
+    entries: dict[str, dict],
+) -> Iterator[ScanStats]:
+    ner = ner_enabled(config)
+    for unit in units:
+        unit_stats = ScanStats()
+        for chunk in iter_shard_chunks(unit["shard"], location, config):
+            counts = scan_chunk(chunk, ner)
+            unit_stats.add(chunk, counts)
+            stats.add(chunk, counts)
+            yield stats
+        entries[unit["key"]] = unit_entry(unit, unit_stats)
+
+
+def scan_unit_group(
+    units: list[dict],
+    location: Optional[str] = None,
+    config: Optional[dict] = None,
+) -> dict[str, dict]:
+    entries: dict[str, dict] = {}
+    for _ in iter_unit_scan(units, location, config, ScanStats(), entries):
+        pass
+    return entries
+
+
+def group_units(units: list[dict], groups: int) -> list[list[dict]]:
+    buckets: list[list[dict]] = [[] for _ in range(max(min(groups, len(units)), 1))]
+    weights = [0] * len(buckets)
+    for unit in sorted(units, key=lambda u: u["weight"], reverse=True):
+        lightest = weights.index(min(weights))
+        buckets[lightest].append(unit)
+        weights[lightest] += unit["weight"]
+    return [bucket for bucket in buckets if bucket]
+
+
+def manifest_stats(entries: dict[str, dict]) -> ScanStats:
+    stats = ScanStats()
+    for entry in entries.values():
+        stats.merge(ScanStats.from_dict(entry))
+    return stats
+
+
+def build_manifest(plan: IncrementalPlan, entries: dict[str, dict]) -> dict:
+    return {
+        "version": MANIFEST_VERSION,
+        "source": plan.source,
+        "block_bytes": plan.block_bytes,
+        "files": plan.files,
+        "units": entries,
+    }
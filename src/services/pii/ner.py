@@ -0,0 +1,66 @@
+from typing import Optional
+
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.services.pii.sources import ScanSourceError
+
+logger = get_logger(__name__)
+
+_NER_COMPONENTS = ("transformer", "tok2vec", "ner")
+_LOCATION_LABELS = frozenset({"GPE", "LOC"})
+
+_nlp = None
+
+
+def ner_enabled(config: Optional[dict] = None) -> bool:
+    return bool((config or {}).get("ner", settings.PII_NER_ENABLED))
+
+
+def _load(model: str):
+    import spacy
+
+    nlp = spacy.load(model)
+    nlp.select_pipes(enable=[name for name in _NER_COMPONENTS if name in nlp.pipe_names])
+    return nlp
+
+
+def load_ner_model():
+    global _nlp
+    if _nlp is None:
+        try:
+            _nlp = _load(settings.SPACY_MODEL)
+        except (ImportError, OSError) as exc:
+            fallback = settings.PII_NER_FALLBACK_MODEL
+            if not fallback or fallback == settings.SPACY_MODEL:
+                raise ScanSourceError(f"NER model {settings.SPACY_MODEL} could not be loaded: {exc}") from exc
+            logger.warning(
+                "NER model unavailable, using fallback",
+                model=settings.SPACY_MODEL,
+                fallback=fallback,
+                error=str(exc),
+            )
+            _nlp = _load(fallback)
+        logger.info("NER model loaded", components=_nlp.pipe_names)
+    return _nlp
+
+
+def detect_ner_pii(texts: list[str]) -> dict[str, int]:
+    counts: dict[str, int] = {}
+    if not texts:
+        return counts
+    nlp = load_ner_model()
+    docs = nlp.pipe(
+        texts,
+        batch_size=settings.PII_NER_BATCH_SIZE,
+        n_process=settings.PII_NER_N_PROCESS,
+    )
+    for doc in docs:
+        labels = [ent.label_ for ent in doc.ents]
+        people = labels.count("PERSON")
+        if people:
+            counts["PERSON_NAME"] = counts.get("PERSON_NAME", 0) + people
+        if "FAC" in labels or (
+            _LOCATION_LABELS.intersection(labels) and any(c.isdigit() for c in doc.text)
+        ):
+            counts["ADDRESS"] = counts.get("ADDRESS", 0) + 1
+    return counts
@@ -0,0 +1,92 @@
+from typing import Iterable, Iterator, Optional
+
+from src.services.pii.detectors import (
+    PII_RISK_LEVELS,
+    PII_TYPES,
+    RISK_WEIGHTS,
+    detect_pii,
+    ner_candidates,
+)
+from src.services.pii.ner import detect_ner_pii
+from src.services.pii.sources import ScanChunk
+
+
+class ScanStats:
+    def __init__(self, counts: Optional[dict[str, int]] = None):
+        self.rows = 0
+        self.bytes = 0
+        self.chunks = 0
+        self.counts = dict.fromkeys(PII_TYPES, 0)
+        for pii_type, count in (counts or {}).items():
+            self.counts[pii_type] = self.counts.get(pii_type, 0) + count
+
+    def add(self, chunk: ScanChunk, counts: dict[str, int]) -> None:
+        self.rows += chunk.rows
+        self.bytes += chunk.nbytes
+        self.chunks += 1
+        for pii_type, count in counts.items():
+            self.counts[pii_type] += count
+
+    def merge(self, other: "ScanStats") -> None:
+        self.rows += other.rows
+        self.bytes += other.bytes
+        self.chunks += other.chunks
+        for pii_type, count in other.counts.items():
+            self.counts[pii_type] = self.counts.get(pii_type, 0) + count
+
+    def to_dict(self) -> dict:
+        return {
+            "rows": self.rows,
+            "bytes": self.bytes,
+            "chunks": self.chunks,
+            "counts": {pii_type: count for pii_type, count in self.counts.items() if count},
+        }
+
+    @classmethod
+    def from_dict(cls, data: dict) -> "ScanStats":
+        stats = cls(data.get("counts"))
+        stats.rows = data.get("rows", 0)
+        stats.bytes = data.get("bytes", 0)
+        stats.chunks = data.get("chunks", 0)
+        return stats
+
+    @property
+    def total_pii(self) -> int:
+        return sum(self.counts.values())
+
+    def pii_found(self) -> list[dict]:
+        return [
+            {"type": pii_type, "count": count, "risk_level": PII_RISK_LEVELS[pii_type]}
+            for pii_type, count in self.counts.items()
+            if count
+        ]
+
+    def risk_score(self) -> int:
+        pii_found = self.pii_found()
+        return sum(RISK_WEIGHTS[p["risk_level"]] for p in pii_found) // max(len(pii_found), 1)
+
+
+def scan_chunk(chunk: ScanChunk, ner: bool = False) -> dict[str, int]:
+    counts = detect_pii(chunk.text)
+    if ner:
+        for pii_type, count in detect_ner_pii(ner_candidates(chunk.text)).items():
+            counts[pii_type] = counts.get(pii_type, 0) + count
+    return counts
+
+
+def iter_scan(
+    chunks: Iterable[ScanChunk],
+    stats: Optional[ScanStats] = None,
+    ner: bool = False,
+) -> Iterator[ScanStats]:
+    stats = stats or ScanStats()
+    for chunk in chunks:
+        stats.add(chunk, scan_chunk(chunk, ner))
+        yield stats
+
+
+def run_scan(chunks: Iterable[ScanChunk], ner: bool = False) -> ScanStats:
+    stats = ScanStats()
+    for stats in iter_scan(chunks, stats, ner):
+        pass
+    return stats
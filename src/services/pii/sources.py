@@ -0,0 +1,292 @@
+import csv
+import os
+from fnmatch import fnmatch
+from pathlib import Path
+from typing import Iterable, Iterator, NamedTuple, Optional
+
+from src.core.config import settings
+
+SOURCE_TYPES = ["csv", "jsonl", "parquet", "database"]
+# Driver options that could redirect a connection (unix sockets, service files) are refused.
+DATABASE_QUERY_OPTIONS = {"sslmode", "connect_timeout", "application_name", "charset"}
+
+
+class ScanSourceError(ValueError):
+    pass
+
+
+class ScanChunk(NamedTuple):
+    text: str
+    rows: int
+    nbytes: int
+
+
+def format_row(row: dict) -> str:
+    return "\n".join(f"{key}: {value}" for key, value in row.items() if value not in (None, ""))
+
+
+def _formatted_rows(rows: Iterable[dict]) -> Iterator[tuple[str, int]]:
+    for row in rows:
+        text = format_row(row)
+        yield text, len(text)
+
+
+def scan_limit(config: Optional[dict], name: str, default: int, maximum: int) -> int:
+    return min(max(int((config or {}).get(name, default)), 1), maximum)
+
+
+def resolve_source_path(location: Optional[str]) -> Path:
+    if not location:
+        raise ScanSourceError("A file path relative to the upload directory is required")
+    upload_dir = settings.get_upload_dir().resolve()
+    path = (upload_dir / location.removeprefix("file://")).resolve()
+    if not path.is_relative_to(upload_dir):
+        raise ScanSourceError("Source path must be inside the upload directory")
+    if not path.exists():
+        raise ScanSourceError(f"Source not found: {location}")
+    return path
+
+
+def list_source_files(source_type: str, location: Optional[str]) -> list[Path]:
+    path = resolve_source_path(location)
+    if path.is_file():
+        return [path]
+    return sorted(p for p in path.rglob(f"*.{source_type}") if p.is_file())
+
+
+def _relative(path: Path) -> str:
+    return str(path.relative_to(settings.get_upload_dir().resolve()))
+
+
+def _chunk_lines(lines: Iterable[tuple[str, int]], chunk_bytes: int) -> Iterator[ScanChunk]:
+    buffer: list[str] = []
+    rows = 0
+    nbytes = 0
+    for text, size in lines:
+        buffer.append(text)
+        rows += 1
+        nbytes += size
+        if nbytes >= chunk_bytes:
+            yield ScanChunk("\n".join(buffer), rows, nbytes)
+            buffer, rows, nbytes = [], 0, 0
+    if buffer:
+        yield ScanChunk("\n".join(buffer), rows, nbytes)
+
+
+def _read_lines(fh, start: int = 0, end: Optional[int] = None) -> Iterator[bytes]:
+    # A line belongs to the byte range it starts in, so a reader starting mid-file
+    # skips the partial line that the previous range finishes. CSV files with
+    # quoted newlines should be sharded by file rather than by byte range.
+    if start:
+        fh.seek(start - 1)
+        fh.readline()
+    position = fh.tell()
+    for line in fh:
+        if end is not None and position >= end:
+            break
+        position += len(line)
+        yield line
+
+
+def _counted_lines(lines: Iterable[bytes], sizes: list[int]) -> Iterator[str]:
+    for line in lines:
+        sizes.append(len(line))
+        yield line.decode("utf-8", errors="replace")
+
+
+def iter_csv_chunks(
+    path: Path,
+    chunk_bytes: int,
+    start: int = 0,
+    end: Optional[int] = None,
+    header: Optional[list[str]] = None,
+) -> Iterator[ScanChunk]:
+    with open(path, "rb") as fh:
+        sizes: list[int] = []
+        reader = csv.reader(_counted_lines(_read_lines(fh, start, end), sizes))
+        if header is None:
+            header = next(reader, None)
+            if header is None:
+                return
+
+        def rows() -> Iterator[tuple[str, int]]:
+            for values in reader:
+                size = sum(sizes)
+                sizes.clear()
+                yield format_row(dict(zip(header, values))), size
+
+        yield from _chunk_lines(rows(), chunk_bytes)
+
+
+def iter_jsonl_chunks(
+    path: Path,
+    chunk_bytes: int,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[ScanChunk]:
+    # JSON lines are scanned as raw text: keys stay next to their values, which is
+    # all the contextual detectors need, and no time is spent parsing.
+    with open(path, "rb") as fh:
+        lines = (
+            (line.decode("utf-8", errors="replace"), len(line))
+            for line in _read_lines(fh, start, end)
+            if line.strip()
+        )
+        yield from _chunk_lines(lines, chunk_bytes)
+
+
+def _parquet_file(path: Path):
+    try:
+        import pyarrow.parquet as pq
+    except ImportError as exc:
+        raise ScanSourceError("Parquet sources require pyarrow to be installed") from exc
+    return pq.ParquetFile(path)
+
+
+def iter_parquet_chunks(
+    path: Path,
+    chunk_bytes: int,
+    batch_rows: int,
+    start: int = 0,
+    end: Optional[int] = None,
+) -> Iterator[ScanChunk]:
+    parquet_file = _parquet_file(path)
+    row_groups = list(range(start, end if end is not None else parquet_file.num_row_groups))
+    if not row_groups:
+        return
+    for batch in parquet_file.iter_batches(batch_size=batch_rows, row_groups=row_groups):
+        yield from _chunk_lines(_formatted_rows(batch.to_pylist()), chunk_bytes)
+
+
+def _reflect_table(engine, table_name: str):
+    from sqlalchemy import MetaData, Table
+
+    return Table(table_name, MetaData(), autoload_with=engine)
+
+
+def check_database_url(connection_string: Optional[str]):
+    from sqlalchemy.engine import make_url
+    from sqlalchemy.exc import ArgumentError
+
+    if not connection_string:
+        raise ScanSourceError("Database sources require a connection string")
+    try:
+        url = make_url(connection_string)
+    except ArgumentError as exc:
+        raise ScanSourceError("Invalid database connection string") from exc
+    if url.get_backend_name() not in settings.PII_SCAN_DATABASE_DIALECTS:
+        raise ScanSourceError(
+            f"Database sources must use one of: {', '.join(settings.PII_SCAN_DATABASE_DIALECTS)}"
+        )
+    host = (url.host or "").lower()
+    if not host or not any(
+        fnmatch(host, pattern.lower()) for pattern in settings.PII_SCAN_DATABASE_HOSTS
+    ):
+        raise ScanSourceError(f"Database host is not an allowed scan target: {host or '(none)'}")
+    unsupported = sorted(set(url.query) - DATABASE_QUERY_OPTIONS)
+    if unsupported:
+        raise ScanSourceError(f"Unsupported connection options: {', '.join(unsupported)}")
+    return url
+
+
+def database_engine(connection_string: Optional[str]):
+    from sqlalchemy import create_engine
+
+    return create_engine(check_database_url(connection_string))
+
+
+def iter_database_chunks(
+    connection_string: str,
+    table_name: str,
+    chunk_bytes: int,
+    batch_rows: int,
+    columns: Optional[list[str]] = None,
+    key: Optional[str] = None,
+    lower=None,
+    upper=None,
+) -> Iterator[ScanChunk]:
+    from sqlalchemy import select
+
+    engine = database_engine(connection_string)
+    try:
+        table = _reflect_table(engine, table_name)
+        selected = [table.c[name] for name in columns] if columns else [table]
+        query = select(*selected)
+        if key is not None and lower is not None:
+            query = query.where(table.c[key] >= lower)
+        if key is not None and upper is not None:
+            query = query.where(table.c[key] < upper)
+        with engine.connect() as conn:
+            result = conn.execution_options(stream_results=True, yield_per=batch_rows).execute(
+                query
+            )
+            for partition in result.mappings().partitions():
+                yield from _chunk_lines(_formatted_rows(partition), chunk_bytes)
+    finally:
+        engine.dispose()
+
+
+def check_source(source_type: str, location: Optional[str], config: Optional[dict] = None) -> None:
+    config = config or {}
+    if source_type == "database":
+        if not config.get("table"):
+            raise ScanSourceError("Database sources require a table")
+        check_database_url(location)
+        return
+    if source_type not in SOURCE_TYPES:
+        raise ScanSourceError(f"Unsupported source type: {source_type}")
+    if not list_source_files(source_type, location):
+        raise ScanSourceError(f"No {source_type} files found at {location}")
+
+
+def _is_integer_column(column) -> bool:
+    try:
+        return column.type.python_type is int
+    except NotImplementedError:
+        return False
+
+
+def default_shard_count() -> int:
+    return settings.PII_SCAN_SHARDS or os.cpu_count() or 1
+
+
+def iter_shard_chunks(
+    shard: dict,
+    location: Optional[str] = None,
+    config: Optional[dict] = None,
+) -> Iterator[ScanChunk]:
+    config = config or {}
+    chunk_bytes = scan_limit(
+        config, "chunk_bytes", settings.PII_SCAN_CHUNK_BYTES, settings.PII_SCAN_MAX_CHUNK_BYTES
+    )
+    batch_rows = scan_limit(
+        config, "batch_rows", settings.PII_SCAN_BATCH_ROWS, settings.PII_SCAN_MAX_BATCH_ROWS
+    )
+    source_type = shard["source_type"]
+
+    if source_type == "database":
+        yield from iter_database_chunks(
+            location,
+            shard["table"],
+            chunk_bytes,
+            batch_rows,
+            shard.get("columns"),
+            shard.get("key"),
+            shard.get("lower"),
+            shard.get("upper"),
+        )
+        return
+
+    for entry in shard["files"]:
+        path = resolve_source_path(entry["path"])
+        if source_type == "csv":
+            yield from iter_csv_chunks(
+                path, chunk_bytes, entry["start"], entry["end"], shard.get("header")
+            )
+        elif source_type == "jsonl":
+            yield from iter_jsonl_chunks(path, chunk_bytes, entry["start"], entry["end"])
+        else:
+            yield from iter_parquet_chunks(
+                path, chunk_bytes, batch_rows, entry["start"], entry["end"]
+            )
+
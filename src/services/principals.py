@@ -0,0 +1,221 @@
+import asyncio
+import json
+from datetime import datetime
+from typing import Iterable, Optional
+
+import redis.asyncio
+from prometheus_client import Counter
+from redis.exceptions import RedisError
+from sqlalchemy import event, inspect, select
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session, make_transient_to_detached
+
+from src.core.cache import TTLCache
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.redis import get_redis, get_sync_redis
+from src.models.user import User
+from src.services.revocation import revoke, revoke_sync, subject_member
+
+logger = get_logger(__name__)
+
+PRINCIPAL_FIELDS = [
+    "id",
+    "tenant_id",
+    "email",
+    "first_name",
+    "last_name",
+    "role",
+    "is_active",
+    "email_verified",
+    "last_login",
+    "created_at",
+    "updated_at",
+]
+DATETIME_FIELDS = ["last_login", "created_at", "updated_at"]
+CLAIM_FIELDS = {"tenant_id", "email", "role", "is_active"}
+PRINCIPAL_CHANNEL = "principal-invalidations"
+INVALIDATIONS_KEY = "principal_invalidations"
+REVOKED_SUBJECTS_KEY = "revoked_subjects"
+
+PRINCIPAL_CACHE_LOOKUPS = Counter(
+    "principal_cache_lookups_total",
+    "Authenticated principal lookups by cache layer and result",
+    ["layer", "result"],
+)
+PRINCIPAL_CACHE_INVALIDATIONS = Counter(
+    "principal_cache_invalidations_total",
+    "Cached principals dropped because the user changed",
+)
+
+_principals = TTLCache(settings.PRINCIPAL_CACHE_SIZE, settings.PRINCIPAL_CACHE_TTL_SECONDS)
+_pending: set[asyncio.Task] = set()
+
+
+def principal_key(user_id: str) -> str:
+    return f"principal:{user_id}"
+
+
+def principal_data(user: User) -> dict:
+    return {field: getattr(user, field) for field in PRINCIPAL_FIELDS}
+
+
+def principal_from_data(data: dict) -> User:
+    # Detached rather than transient: password_hash and relationships stay unloaded and
+    # raise on access instead of silently reading as None.
+    user = User(**data)
+    make_transient_to_detached(user)
+    return user
+
+
+def dump_principal(data: dict) -> str:
+    return json.dumps(data, default=lambda value: value.isoformat())
+
+
+def load_principal(raw: str) -> dict:
+    data = json.loads(raw)
+    for field in DATETIME_FIELDS:
+        if data.get(field):
+            data[field] = datetime.fromisoformat(data[field])
+    return data
+
+
+async def get_principal(db: AsyncSession, user_id: str) -> Optional[User]:
+    data = _principals.get(user_id)
+    if data is not None:
+        PRINCIPAL_CACHE_LOOKUPS.labels("local", "hit").inc()
+        return principal_from_data(data)
+    PRINCIPAL_CACHE_LOOKUPS.labels("local", "miss").inc()
+
+    if settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        try:
+            raw = await get_redis().get(principal_key(user_id))
+        except RedisError as e:
+            logger.warning("Principal cache read failed", error=str(e))
+            raw = None
+        PRINCIPAL_CACHE_LOOKUPS.labels("redis", "hit" if raw else "miss").inc()
+        if raw:
+            data = load_principal(raw)
+            _principals.set(user_id, data)
+            return principal_from_data(data)
+
+    result = await db.execute(select(User).where(User.id == user_id))
+    user = result.scalar_one_or_none()
+    if not user:
+        return None
+
+    data = principal_data(user)
+    _principals.set(user_id, data)
+    if settings.PRINCIPAL_CACHE_REDIS_ENABLED:
+        try:
+            await get_redis().set(
+                principal_key(user_id),
+                dump_principal(data),
+                ex=settings.PRINCIPAL_CACHE_REDIS_TTL_SECONDS,
+            )
+        except RedisError as e:
+            logger.warning("Principal cache write failed", error=str(e))
+    return user
+
+
+def evict_local_principals(user_ids: Iterable[str]) -> None:
+    for user_id in user_ids:
+        _principals.pop(user_id)
+
+
+async def invalidate_principals(user_ids: Iterable[str]) -> None:
+    user_ids = list(user_ids)
+    evict_local_principals(user_ids)
+    PRINCIPAL_CACHE_INVALIDATIONS.inc(len(user_ids))
+    if not settings.PRINCIPAL_CACHE_REDIS_ENABLED or not user_ids:
+        return
+    try:
+        client = get_redis()
+        await client.delete(*[principal_key(user_id) for user_id in user_ids])
+        await client.publish(PRINCIPAL_CHANNEL, json.dumps(user_ids))
+    except RedisError as e:
+        logger.warning("Principal cache invalidation failed", error=str(e), users=len(user_ids))
+
+
+def invalidate_principals_sync(user_ids: Iterable[str]) -> None:
+    user_ids = list(user_ids)
+    evict_local_principals(user_ids)
+    PRINCIPAL_CACHE_INVALIDATIONS.inc(len(user_ids))
+    if not settings.PRINCIPAL_CACHE_REDIS_ENABLED or not user_ids:
+        return
+    try:
+        client = get_sync_redis()
+        client.delete(*[principal_key(user_id) for user_id in user_ids])
+        client.publish(PRINCIPAL_CHANNEL, json.dumps(user_ids))
+    except RedisError as e:
+        logger.warning("Principal cache invalidation failed", error=str(e), users=len(user_ids))
+
+
+def _spawn(coro) -> None:
+    task = asyncio.get_running_loop().create_task(coro)
+    _pending.add(task)
+    task.add_done_callback(_pending.discard)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_principal_changes(session: Session, flush_context) -> None:
+    changed, revoked = set(), set()
+    for obj in session.dirty:
+        if isinstance(obj, User):
+            state = inspect(obj)
+            fields = {f for f in PRINCIPAL_FIELDS if state.attrs[f].history.has_changes()}
+            if fields:
+                changed.add(obj.id)
+            if fields & CLAIM_FIELDS:
+                revoked.add(obj.id)
+    deleted = {obj.id for obj in session.deleted if isinstance(obj, User)}
+    if changed or deleted:
+        session.info.setdefault(INVALIDATIONS_KEY, set()).update(changed | deleted)
+    if revoked or deleted:
+        session.info.setdefault(REVOKED_SUBJECTS_KEY, set()).update(revoked | deleted)
+
+
+@event.listens_for(Session, "after_commit")
+def invalidate_committed_principals(session: Session) -> None:
+    user_ids = session.info.pop(INVALIDATIONS_KEY, None)
+    members = [subject_member(u) for u in session.info.pop(REVOKED_SUBJECTS_KEY, ())]
+    if not user_ids:
+        return
+    try:
+        asyncio.get_running_loop()
+    except RuntimeError:
+        invalidate_principals_sync(user_ids)
+        revoke_sync(members)
+        return
+    evict_local_principals(user_ids)
+    _spawn(invalidate_principals(user_ids))
+    if members:
+        _spawn(revoke(members))
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_principal_changes(session: Session) -> None:
+    session.info.pop(INVALIDATIONS_KEY, None)
+    session.info.pop(REVOKED_SUBJECTS_KEY, None)
+
+
+async def listen_for_principal_invalidations() -> None:
+    # A dedicated connection without the short socket timeout: the subscription sits idle.
+    client = redis.asyncio.from_url(
+        settings.REDIS_URL, decode_responses=True, health_check_interval=30
+    )
+    try:
+        while True:
+            try:
+                async with client.pubsub() as pubsub:
+                    await pubsub.subscribe(PRINCIPAL_CHANNEL)
+                    async for message in pubsub.listen():
+                        if message["type"] == "message":
+                            evict_local_principals(json.loads(message["data"]))
+            except (RedisError, OSError) as e:
+                # Invalidations may have been missed while disconnected.
+                _principals.clear()
+                logger.warning("Principal invalidation listener disconnected", error=str(e))
+                await asyncio.sleep(5)
+    finally:
+        await client.aclose()
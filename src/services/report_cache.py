@@ -0,0 +1,109 @@
+import hashlib
+import json
+from datetime import datetime, timedelta
+from typing import Optional
+
+from prometheus_client import Counter
+from sqlalchemy import event, select
+from sqlalchemy.dialects import postgresql, sqlite
+from sqlalchemy.ext.asyncio import AsyncSession
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.models.assessment import Assessment, ConsentRecord, DSRRequest, Framework
+from src.models.report import Report, TenantDataVersion
+
+VERSIONED_MODELS = (Assessment, ConsentRecord, DSRRequest, Framework)
+# Templates whose output depends on the clock as well as the data, e.g. overdue DSRs.
+TIME_SENSITIVE_TEMPLATES = {"sla_compliance"}
+REUSABLE_STATUSES = ["queued", "running", "completed"]
+PENDING_VERSION_BUMPS = "report_cache_tenant_ids"
+
+REPORT_CACHE_REQUESTS = Counter(
+    "report_cache_requests_total",
+    "Report requests by whether an existing artifact was reused",
+    ["result"],
+)
+
+
+@event.listens_for(Session, "after_flush")
+def collect_versioned_tenants(session: Session, flush_context) -> None:
+    tenant_ids = session.info.setdefault(PENDING_VERSION_BUMPS, set())
+    tenant_ids.update(
+        obj.tenant_id
+        for obj in (*session.new, *session.deleted)
+        if isinstance(obj, VERSIONED_MODELS)
+    )
+    tenant_ids.update(
+        obj.tenant_id
+        for obj in session.dirty
+        if isinstance(obj, VERSIONED_MODELS) and session.is_modified(obj)
+    )
+
+
+@event.listens_for(Session, "before_commit")
+def bump_tenant_data_versions(session: Session) -> None:
+    # One bump per tenant per transaction, taken just before commit, so the version row
+    # is locked only for the commit itself rather than from the first flush onwards.
+    session.flush()
+    tenant_ids = session.info.pop(PENDING_VERSION_BUMPS, None)
+    if not tenant_ids:
+        return
+    dialect = postgresql if session.get_bind().dialect.name == "postgresql" else sqlite
+    statement = dialect.insert(TenantDataVersion).values(
+        [{"tenant_id": tenant_id, "version": 1} for tenant_id in sorted(tenant_ids)]
+    )
+    session.connection().execute(
+        statement.on_conflict_do_update(
+            index_elements=[TenantDataVersion.tenant_id],
+            set_={"version": TenantDataVersion.version + 1},
+        )
+    )
+
+
+@event.listens_for(Session, "after_rollback")
+def discard_versioned_tenants(session: Session) -> None:
+    session.info.pop(PENDING_VERSION_BUMPS, None)
+
+
+def report_cache_key(report: Report, data_version: int, now: datetime) -> str:
+    parts = {
+        "tenant_id": report.tenant_id,
+        "report_type": report.report_type,
+        "framework_id": report.framework_id,
+        "assessment_id": report.assessment_id,
+        "start_date": report.start_date.isoformat() if report.start_date else None,
+        "end_date": report.end_date.isoformat() if report.end_date else None,
+        "format": report.format,
+        "data_version": data_version,
+    }
+    if report.report_type in TIME_SENSITIVE_TEMPLATES:
+        parts["as_of"] = int(now.timestamp()) // settings.REPORT_CACHE_TIME_BUCKET_SECONDS
+    return hashlib.sha256(json.dumps(parts, sort_keys=True).encode()).hexdigest()
+
+
+async def find_cached_report(
+    db: AsyncSession, report: Report, now: datetime
+) -> tuple[str, Optional[Report]]:
+    data_version = await db.scalar(
+        select(TenantDataVersion.version).where(TenantDataVersion.tenant_id == report.tenant_id)
+    )
+    cache_key = report_cache_key(report, data_version or 0, now)
+    cached = (
+        await db.scalars(
+            select(Report)
+            .where(
+                Report.tenant_id == report.tenant_id,
+                Report.cache_key == cache_key,
+                Report.status.in_(REUSABLE_STATUSES),
+                Report.expires_at > now,
+            )
+            .order_by(Report.created_at.desc())
+            .limit(1)
+        )
+    ).first()
+    REPORT_CACHE_REQUESTS.labels("hit" if cached else "miss").inc()
+    if cached is not None:
+        # A reused artifact stays downloadable for a full TTL from this request.
+        cached.expires_at = max(cached.expires_at, now + timedelta(hours=settings.REPORT_TTL_HOURS))
+    return cache_key, cached
@@ -0,0 +1,150 @@
+import csv
+import io
+import json
+from datetime import date, datetime
+from itertools import islice
+from typing import BinaryIO, Iterator, NamedTuple
+
+from openpyxl import Workbook
+from reportlab.lib import colors
+from reportlab.lib.pagesizes import A4, landscape
+from reportlab.lib.styles import getSampleStyleSheet
+from reportlab.platypus import Paragraph, SimpleDocTemplate, Spacer, Table, TableStyle
+
+REPORT_MEDIA_TYPES = {
+    "json": "application/json",
+    "csv": "text/csv",
+    "xlsx": "application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
+    "pdf": "application/pdf",
+}
+PDF_TABLE_ROWS = 40
+PDF_CELL_CHARS = 60
+
+PDF_TABLE_STYLE = TableStyle(
+    [
+        ("FONTNAME", (0, 0), (-1, 0), "Helvetica-Bold"),
+        ("FONTSIZE", (0, 0), (-1, -1), 7),
+        ("BACKGROUND", (0, 0), (-1, 0), colors.HexColor("#e5e7eb")),
+        ("GRID", (0, 0), (-1, -1), 0.25, colors.grey),
+        ("VALIGN", (0, 0), (-1, -1), "TOP"),
+    ]
+)
+
+
+class ReportContent(NamedTuple):
+    title: str
+    columns: list[str]
+    rows: Iterator[tuple]
+    # Filled in while rows are consumed, so renderers write it after the rows.
+    summary: dict
+
+
+def _cell(value):
+    if isinstance(value, (datetime, date)):
+        return value.isoformat()
+    return value
+
+
+def _header(report, content: ReportContent) -> dict:
+    return {
+        "report_id": report.id,
+        "report_type": report.report_type,
+        "title": content.title,
+        "tenant_id": report.tenant_id,
+        "generated_at": datetime.utcnow().isoformat(),
+    }
+
+
+def render_json(fh: BinaryIO, report, content: ReportContent) -> None:
+    out = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+    header = {**_header(report, content), "columns": content.columns}
+    out.write(json.dumps(header)[:-1] + ', "rows": [')
+    for i, row in enumerate(content.rows):
+        record = {column: _cell(value) for column, value in zip(content.columns, row)}
+        out.write(("," if i else "") + "\n" + json.dumps(record))
+    out.write('\n], "summary": ' + json.dumps(content.summary) + "}\n")
+    out.detach()
+
+
+def render_csv(fh: BinaryIO, report, content: ReportContent) -> None:
+    out = io.TextIOWrapper(fh, encoding="utf-8", newline="")
+    writer = csv.writer(out)
+    writer.writerow(content.columns)
+    for row in content.rows:
+        writer.writerow([_cell(value) for value in row])
+    out.detach()
+
+
+def render_xlsx(fh: BinaryIO, report, content: ReportContent) -> None:
+    # Write-only sheets stream rows to temporary files instead of building cell objects.
+    workbook = Workbook(write_only=True)
+    summary_sheet = workbook.create_sheet("Summary")
+    sheet = workbook.create_sheet(content.title[:31])
+    sheet.append(content.columns)
+    for row in content.rows:
+        sheet.append(list(row))
+    for key, value in {**_header(report, content), **content.summary}.items():
+        summary_sheet.append([key, value])
+    workbook.save(fh)
+
+
+class _FlowableFeed(list):
+    # doc.build() consumes flowables from the front of a list; refilling it from a generator
+    # keeps only the next table or two in memory instead of the whole story.
+    def __init__(self, source: Iterator):
+        super().__init__()
+        self._source = source
+
+    def _fill(self) -> None:
+        while list.__len__(self) < 2:
+            flowable = next(self._source, None)
+            if flowable is None:
+                return
+            self.append(flowable)
+
+    def __len__(self) -> int:
+        self._fill()
+        return list.__len__(self)
+
+    def __getitem__(self, index):
+        self._fill()
+        return list.__getitem__(self, index)
+
+
+def _pdf_text(value) -> str:
+    text = "" if value is None else str(_cell(value))
+    return text if len(text) <= PDF_CELL_CHARS else text[: PDF_CELL_CHARS - 1] + "…"
+
+
+def _pdf_story(report, content: ReportContent) -> Iterator:
+    styles = getSampleStyleSheet()
+    header = _header(report, content)
+    yield Paragraph(content.title, styles["Title"])
+    yield Paragraph(f"Generated {header['generated_at']}", styles["Normal"])
+    yield Spacer(0, 12)
+    rows = iter(content.rows)
+    while batch := list(islice(rows, PDF_TABLE_ROWS)):
+        table = Table(
+            [content.columns] + [[_pdf_text(v) for v in row] for row in batch], repeatRows=1
+        )
+        table.setStyle(PDF_TABLE_STYLE)
+        yield table
+    if content.summary:
+        yield Spacer(0, 12)
+        yield Paragraph("Summary", styles["Heading2"])
+        summary = Table([[key, _pdf_text(value)] for key, value in content.summary.items()])
+        summary.setStyle(PDF_TABLE_STYLE)
+        yield summary
+
+
+def render_pdf(fh: BinaryIO, report, content: ReportContent) -> None:
+    document = SimpleDocTemplate(fh, pagesize=landscape(A4), title=content.title)
+    document.build(_FlowableFeed(_pdf_story(report, content)))
+
+
+REPORT_RENDERERS = {
+    "json": render_json,
+    "csv": render_csv,
+    "xlsx": render_xlsx,
+    "pdf": render_pdf,
+}
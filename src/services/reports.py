@@ -0,0 +1,287 @@
+import hashlib
+from datetime import datetime
+from typing import Iterator
+
+import numpy as np
+from sqlalchemy import func, select
+from sqlalchemy.orm import Session
+
+from src.core.logging import get_logger
+from src.models.assessment import Assessment, DSRRequest, Framework
+from src.models.report import Report
+from src.services.frameworks.crosswalk import (
+    CONTROL_KEYS,
+    FRAMEWORK_SLICES,
+    control_index,
+    crosswalk_support,
+    equivalent_controls,
+    framework_coverage,
+)
+from src.services.frameworks.registry import FRAMEWORK_CATALOGS, catalog_name
+from src.services.report_renderers import REPORT_RENDERERS, ReportContent
+
+logger = get_logger(__name__)
+
+REPORT_BATCH_SIZE = 1000
+
+REPORT_TEMPLATES = {
+    "executive_summary": {
+        "name": "Executive Summary",
+        "description": "High-level compliance overview",
+    },
+    "detailed_assessment": {
+        "name": "Detailed Assessment",
+        "description": "Full assessment report with findings",
+    },
+    "gap_analysis": {
+        "name": "Gap Analysis",
+        "description": "Control gaps and remediation priorities",
+    },
+    "sla_compliance": {
+        "name": "SLA Compliance",
+        "description": "DSR and compliance deadline tracking",
+    },
+}
+
+
+def artifact_key(report: Report) -> str:
+    return f"reports/{report.tenant_id}/{report.id}.{report.format}"
+
+
+def _assessment_filters(report: Report) -> list:
+    filters = [Assessment.tenant_id == report.tenant_id]
+    if report.framework_id:
+        filters.append(Assessment.framework_id == report.framework_id)
+    if report.assessment_id:
+        filters.append(Assessment.id == report.assessment_id)
+    if report.start_date:
+        filters.append(Assessment.created_at >= report.start_date)
+    if report.end_date:
+        filters.append(Assessment.created_at <= report.end_date)
+    return filters
+
+
+def _stream(db: Session, query) -> Iterator:
+    return db.execute(query.execution_options(yield_per=REPORT_BATCH_SIZE))
+
+
+def executive_summary(db: Session, report: Report) -> ReportContent:
+    filters = _assessment_filters(report)
+    totals = db.execute(
+        select(
+            func.count().label("total_assessments"),
+            func.count().filter(Assessment.status == "completed").label("completed"),
+            func.count().filter(Assessment.status == "in_progress").label("in_progress"),
+            func.coalesce(func.avg(Assessment.score), 0).label("average_score"),
+        ).where(*filters)
+    ).one()
+    summary = dict(totals._mapping)
+    summary["average_score"] = round(float(summary["average_score"]), 1)
+
+    rows = _stream(
+        db,
+        select(
+            Framework.name,
+            func.count(),
+            func.count().filter(Assessment.status == "completed"),
+            func.avg(Assessment.score),
+        )
+        .join(Framework, Framework.id == Assessment.framework_id)
+        .where(*filters)
+        .group_by(Framework.name)
+        .order_by(Framework.name),
+    )
+    return ReportContent(
+        "Executive Summary",
+        ["framework", "assessments", "completed", "average_score"],
+        ((name, total, done, round(float(avg or 0), 1)) for name, total, done, avg in rows),
+        summary,
+    )
+
+
+def detailed_assessment(db: Session, report: Report) -> ReportContent:
+    summary = {"assessments": 0}
+
+    def rows() -> Iterator[tuple]:
+        for row in _stream(
+            db,
+            select(
+                Assessment.name,
+                Framework.name,
+                Assessment.status,
+                Assessment.score,
+                Assessment.progress,
+                Assessment.started_at,
+                Assessment.completed_at,
+                Assessment.due_date,
+                # Counted in the database so the findings themselves are never loaded.
+                func.coalesce(func.json_array_length(Assessment.findings), 0),
+            )
+            .join(Framework, Framework.id == Assessment.framework_id)
+            .where(*_assessment_filters(report))
+            .order_by(Assessment.created_at, Assessment.id),
+        ):
+            summary["assessments"] += 1
+            yield tuple(row)
+
+    return ReportContent(
+        "Detailed Assessment",
+        [
+            "assessment",
+            "framework",
+            "status",
+            "score",
+            "progress",
+            "started_at",
+            "completed_at",
+            "due_date",
+            "findings",
+        ],
+        rows(),
+        summary,
+    )
+
+
+def gap_analysis(db: Session, report: Report) -> ReportContent:
+    # Evidence from every framework counts towards the others through the crosswalk, so
+    # framework_id picks the framework to report on rather than filtering the evidence.
+    evidence_filters = [Assessment.tenant_id == report.tenant_id]
+    if report.assessment_id:
+        evidence_filters.append(Assessment.id == report.assessment_id)
+    if report.start_date:
+        evidence_filters.append(Assessment.created_at >= report.start_date)
+    if report.end_date:
+        evidence_filters.append(Assessment.created_at <= report.end_date)
+
+    satisfied = np.zeros(len(CONTROL_KEYS), dtype=bool)
+    notes = {}
+    unmapped = 0
+    # Later assessments override earlier ones for the same control.
+    for framework_type, controls in _stream(
+        db,
+        select(Framework.framework_type, Assessment.controls_status)
+        .join(Framework, Framework.id == Assessment.framework_id)
+        .where(*evidence_filters)
+        .order_by(Assessment.created_at, Assessment.id),
+    ):
+        catalog = catalog_name(framework_type)
+        for control_id, control in (controls or {}).items():
+            index = control_index(catalog, control_id) if catalog else None
+            if index is None:
+                unmapped += 1
+                continue
+            satisfied[index] = control.get("status") == "compliant"
+            notes[index] = control.get("notes")
+
+    targets = list(FRAMEWORK_CATALOGS)
+    if report.framework_id:
+        catalog = catalog_name(
+            db.scalar(select(Framework.framework_type).where(Framework.id == report.framework_id))
+        )
+        targets = [catalog] if catalog else []
+
+    support = crosswalk_support(satisfied)
+    summary = {"controls": 0, "compliant": 0, "covered": 0, "gaps": 0}
+    for framework in targets:
+        coverage = framework_coverage(satisfied, framework)
+        for key in ("controls", "compliant", "covered", "gaps"):
+            summary[key] += coverage[key]
+        summary[f"{framework}_coverage"] = coverage["coverage"]
+    summary["unmapped_controls"] = unmapped
+
+    def rows() -> Iterator[tuple]:
+        for framework in targets:
+            window = FRAMEWORK_SLICES[framework]
+            for index in range(window.start, window.stop):
+                control_id = CONTROL_KEYS[index][1]
+                satisfied_by = ""
+                if satisfied[index]:
+                    status = "compliant"
+                elif support[index]:
+                    status = "covered"
+                    satisfied_by = ", ".join(
+                        ":".join(CONTROL_KEYS[other])
+                        for other in equivalent_controls(index)
+                        if satisfied[other]
+                    )
+                else:
+                    status = "gap"
+                yield (
+                    framework,
+                    control_id,
+                    FRAMEWORK_CATALOGS[framework][control_id]["name"],
+                    status,
+                    satisfied_by,
+                    notes.get(index),
+                )
+
+    return ReportContent(
+        "Gap Analysis",
+        ["framework", "control_id", "control", "status", "satisfied_by", "notes"],
+        rows(),
+        summary,
+    )
+
+
+def sla_compliance(db: Session, report: Report) -> ReportContent:
+    filters = [DSRRequest.tenant_id == report.tenant_id]
+    if report.assessment_id:
+        filters.append(DSRRequest.assessment_id == report.assessment_id)
+    if report.start_date:
+        filters.append(DSRRequest.created_at >= report.start_date)
+    if report.end_date:
+        filters.append(DSRRequest.created_at <= report.end_date)
+    summary = {"requests": 0, "completed": 0, "on_time": 0, "overdue": 0}
+    now = datetime.utcnow()
+
+    def rows() -> Iterator[tuple]:
+        for row in _stream(
+            db,
+            select(
+                DSRRequest.id,
+                DSRRequest.request_type,
+                DSRRequest.status,
+                DSRRequest.created_at,
+                DSRRequest.sla_due_date,
+                DSRRequest.completed_at,
+            )
+            .where(*filters)
+            .order_by(DSRRequest.created_at, DSRRequest.id),
+        ):
+            due, completed = row.sla_due_date, row.completed_at
+            on_time = bool(completed and (due is None or completed <= due))
+            overdue = bool(due and (completed or now) > due)
+            summary["requests"] += 1
+            summary["completed"] += completed is not None
+            summary["on_time"] += on_time
+            summary["overdue"] += overdue
+            yield (*row, on_time, overdue)
+
+    return ReportContent(
+        "SLA Compliance",
+        ["id", "request_type", "status", "created_at", "sla_due_date", "completed_at"]
+        + ["on_time", "overdue"],
+        rows(),
+        summary,
+    )
+
+
+REPORT_BUILDERS = {
+    "executive_summary": executive_summary,
+    "detailed_assessment": detailed_assessment,
+    "gap_analysis": gap_analysis,
+    "sla_compliance": sla_compliance,
+}
+
+
+def render_report(db: Session, report: Report, storage) -> tuple[str, int, str]:
+    content = REPORT_BUILDERS[report.report_type](db, report)
+    key = artifact_key(report)
+    with storage.writer(key) as fh:
+        REPORT_RENDERERS[report.format](fh, report, content)
+
+    digest, size = hashlib.sha256(), 0
+    for chunk in storage.iter_chunks(key):
+        digest.update(chunk)
+        size += len(chunk)
+    return key, size, digest.hexdigest()
@@ -0,0 +1,158 @@
+import asyncio
+import time
+from typing import Iterable, Optional
+
+from prometheus_client import Counter, Gauge
+from redis.exceptions import RedisError
+
+from src.core.bloom import BloomFilter
+from src.core.config import settings
+from src.core.logging import get_logger
+from src.core.redis import get_redis, get_sync_redis
+from src.schemas.auth import TokenPayload
+
+logger = get_logger(__name__)
+
+REVOCATIONS_KEY = "auth:revocations"
+# Incremental refreshes re-read this far back so entries written by nodes with a
+# slightly slow clock are not skipped.
+CLOCK_SKEW_SECONDS = 60
+
+REVOCATION_CHECKS = Counter(
+    "auth_revocation_checks_total",
+    "Claims-mode revocation checks by outcome",
+    ["result"],
+)
+REVOCATION_ENTRIES = Gauge(
+    "auth_revocation_filter_entries",
+    "Entries loaded into the in-process revocation bloom filter",
+)
+
+
+def new_filter() -> BloomFilter:
+    return BloomFilter(
+        settings.AUTH_REVOCATION_BLOOM_CAPACITY, settings.AUTH_REVOCATION_BLOOM_ERROR_RATE
+    )
+
+
+_filter = new_filter()
+_synced_at: Optional[float] = None
+_built_at: Optional[float] = None
+_cursor = 0.0
+
+
+def token_lifetime_seconds() -> int:
+    return settings.JWT_ACCESS_TOKEN_EXPIRE_MINUTES * 60
+
+
+def subject_member(user_id: str) -> str:
+    return f"sub:{user_id}"
+
+
+def token_member(jti: str) -> str:
+    return f"jti:{jti}"
+
+
+def filter_is_fresh() -> bool:
+    return (
+        _synced_at is not None
+        and time.monotonic() - _synced_at <= settings.AUTH_REVOCATION_MAX_STALENESS_SECONDS
+    )
+
+
+async def refresh_revocations() -> int:
+    global _filter, _synced_at, _built_at, _cursor
+
+    client = get_redis()
+    now = time.time()
+    rebuild = (
+        _built_at is None
+        or time.monotonic() - _built_at >= settings.AUTH_REVOCATION_REBUILD_SECONDS
+    )
+    if rebuild:
+        # Bloom filters cannot forget, so expired entries only leave on a full rebuild.
+        await client.zremrangebyscore(REVOCATIONS_KEY, "-inf", now - token_lifetime_seconds())
+        entries = await client.zrange(REVOCATIONS_KEY, 0, -1, withscores=True)
+        bloom = new_filter()
+    else:
+        entries = await client.zrangebyscore(
+            REVOCATIONS_KEY, _cursor - CLOCK_SKEW_SECONDS, "+inf", withscores=True
+        )
+        bloom = _filter
+
+    for member, _ in entries:
+        bloom.add(member)
+    if entries:
+        _cursor = max(_cursor, max(score for _, score in entries))
+    if rebuild:
+        _filter = bloom
+        _built_at = time.monotonic()
+    _synced_at = time.monotonic()
+    REVOCATION_ENTRIES.set(_filter.count)
+    return len(entries)
+
+
+async def sync_revocations() -> None:
+    while True:
+        try:
+            await refresh_revocations()
+        except (RedisError, OSError) as e:
+            logger.warning("Revocation list refresh failed", error=str(e))
+        await asyncio.sleep(settings.AUTH_REVOCATION_REFRESH_SECONDS)
+
+
+async def is_revoked(payload: TokenPayload) -> bool:
+    members = [subject_member(payload.sub)]
+    if payload.jti:
+        members.append(token_member(payload.jti))
+    candidates = [member for member in members if member in _filter]
+    if not candidates:
+        REVOCATION_CHECKS.labels("bloom_negative").inc()
+        return False
+
+    try:
+        scores = await get_redis().zmscore(REVOCATIONS_KEY, candidates)
+    except RedisError as e:
+        REVOCATION_CHECKS.labels("unavailable").inc()
+        logger.warning("Revocation check failed", error=str(e))
+        return True
+
+    issued_at = payload.iat.timestamp() if payload.iat else 0.0
+    for member, revoked_at in zip(candidates, scores):
+        if revoked_at is None:
+            continue
+        # A subject revocation covers tokens issued up to it (iat has whole-second
+        # resolution, so the same second counts as before); later logins pass.
+        if member.startswith("jti:") or issued_at <= revoked_at:
+            REVOCATION_CHECKS.labels("revoked").inc()
+            return True
+    REVOCATION_CHECKS.labels("cleared").inc()
+    return False
+
+
+def _revocation_entries(members: Iterable[str]) -> dict[str, float]:
+    now = time.time()
+    entries = {member: now for member in members}
+    for member in entries:
+        _filter.add(member)
+    return entries
+
+
+async def revoke(members: Iterable[str]) -> None:
+    entries = _revocation_entries(members)
+    if not entries:
+        return
+    try:
+        await get_redis().zadd(REVOCATIONS_KEY, entries)
+    except RedisError as e:
+        logger.warning("Revocation write failed", error=str(e), entries=len(entries))
+
+
+def revoke_sync(members: Iterable[str]) -> None:
+    entries = _revocation_entries(members)
+    if not entries:
+        return
+    try:
+        get_sync_redis().zadd(REVOCATIONS_KEY, entries)
+    except RedisError as e:
+        logger.warning("Revocation write failed", error=str(e), entries=len(entries))
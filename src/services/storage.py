@@ -0,0 +1,57 @@
+import os
+from contextlib import contextmanager
+from pathlib import Path
+from typing import BinaryIO, Callable, Iterator
+
+from src.core.config import settings
+
+CHUNK_BYTES = 1024 * 1024
+
+
+class StorageError(Exception):
+    pass
+
+
+class LocalStorage:
+    def __init__(self, root: Path):
+        self.root = root
+
+    def path(self, key: str) -> Path:
+        return self.root / key
+
+    @contextmanager
+    def writer(self, key: str) -> Iterator[BinaryIO]:
+        # Written beside the target and renamed into place, so readers never see a partial file.
+        path = self.path(key)
+        path.parent.mkdir(parents=True, exist_ok=True)
+        part = path.with_name(path.name + ".part")
+        try:
+            with open(part, "wb") as fh:
+                yield fh
+            os.replace(part, path)
+        finally:
+            part.unlink(missing_ok=True)
+
+    def exists(self, key: str) -> bool:
+        return self.path(key).is_file()
+
+    def iter_chunks(self, key: str, chunk_size: int = CHUNK_BYTES) -> Iterator[bytes]:
+        with open(self.path(key), "rb") as fh:
+            while chunk := fh.read(chunk_size):
+                yield chunk
+
+    def delete(self, key: str) -> None:
+        self.path(key).unlink(missing_ok=True)
+
+
+STORAGE_BACKENDS: dict[str, Callable[[], LocalStorage]] = {
+    "local": lambda: LocalStorage(settings.get_upload_dir()),
+}
+
+
+def get_storage():
+    try:
+        backend = STORAGE_BACKENDS[settings.STORAGE_TYPE]
+    except KeyError:
+        raise StorageError(f"Unsupported STORAGE_TYPE: {settings.STORAGE_TYPE}")
+    return backend()
@@ -1,5 +1,10 @@
 from celery import shared_task
 
+from src.services.tasks.audit import maintain_audit_partitions, verify_audit_log_chains
+from src.services.tasks.dpdpa import process_pii_scan
+from src.services.tasks.metrics import reconcile_tenant_metrics
+from src.services.tasks.reports import generate_compliance_report, purge_expired_reports
+
 
 @shared_task(bind=True)
 def cleanup_expired_sessions(self):
@@ -9,13 +14,3 @@ def cleanup_expired_sessions(self):
 @shared_task(bind=True)
 def check_dsr_deadlines(self):
     return {"message": "DSR deadline check completed", "pending": 0}
-
-
-@shared_task(bind=True)
-def process_pii_scan(self, scan_id: str):
-    return {"message": f"PII scan {scan_id} completed"}
-
-
-@shared_task(bind=True)
-def generate_compliance_report(self, report_id: str):
-    return {"message": f"Report {report_id} generated"}
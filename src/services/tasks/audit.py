@@ -0,0 +1,32 @@
+from datetime import datetime
+
+from celery import shared_task
+
+from src.core.database import get_sync_session
+from src.core.logging import get_logger
+from src.services.audit_chain import verify_audit_chains
+from src.services.audit_partitions import maintain_partitions
+
+logger = get_logger(__name__)
+
+
+@shared_task(bind=True)
+def maintain_audit_partitions(self):
+    db = get_sync_session()
+    try:
+        result = maintain_partitions(db, datetime.utcnow())
+        logger.info("Audit partitions maintained", **result)
+        return result
+    finally:
+        db.close()
+
+
+@shared_task(bind=True)
+def verify_audit_log_chains(self):
+    db = get_sync_session()
+    try:
+        result = verify_audit_chains(db)
+        logger.info("Audit chains verified", **result)
+        return result
+    finally:
+        db.close()
@@ -0,0 +1,269 @@
+import time
+from datetime import datetime
+from typing import Optional
+
+from celery import chord, shared_task
+from sqlalchemy import select, update
+from sqlalchemy.orm import Session
+
+from src.core.config import settings
+from src.core.database import get_sync_session
+from src.core.logging import get_logger
+from src.models.assessment import DataDiscoveryScan
+from src.services.crypto import decrypt_secret
+from src.services.metrics import apply_tenant_metrics, metrics_of
+from src.services.pii import (
+    IncrementalPlan,
+    ScanStats,
+    build_manifest,
+    default_shard_count,
+    group_units,
+    iter_unit_scan,
+    manifest_stats,
+    plan_incremental,
+)
+
+logger = get_logger(__name__)
+
+
+class ScanCancelled(Exception):
+    pass
+
+
+def checkpoint_scan(db: Session, scan: DataDiscoveryScan, stats: ScanStats) -> None:
+    before = metrics_of(scan)
+    scan.pii_found = stats.pii_found()
+    scan.total_pii = stats.total_pii
+    scan.risk_score = stats.risk_score()
+    scan.rows_scanned = stats.rows
+    scan.bytes_scanned = stats.bytes
+    apply_tenant_metrics(db, scan.tenant_id, before, metrics_of(scan))
+    db.commit()
+
+
+def finish_scan(
+    db: Session,
+    scan: DataDiscoveryScan,
+    stats: ScanStats,
+    status: str,
+    error_message: Optional[str] = None,
+) -> dict:
+    scan.status = status
+    scan.error_message = error_message
+    scan.completed_at = datetime.utcnow()
+    checkpoint_scan(db, scan, stats)
+    logger.info(
+        "PII scan finished",
+        scan_id=scan.id,
+        status=status,
+        rows_scanned=stats.rows,
+        bytes_scanned=stats.bytes,
+    )
+    return {
+        "scan_id": scan.id,
+        "status": status,
+        "rows_scanned": stats.rows,
+        "bytes_scanned": stats.bytes,
+    }
+
+
+def is_cancel_requested(db: Session, scan_id: str) -> bool:
+    return bool(
+        db.scalar(select(DataDiscoveryScan.cancel_requested).where(DataDiscoveryScan.id == scan_id))
+    )
+
+
+def requested_shard_count(scan_config: Optional[dict]) -> int:
+    shards = (scan_config or {}).get("shards", 1)
+    if shards == "auto":
+        return default_shard_count()
+    return max(int(shards), 1)
+
+
+def scan_location(scan: DataDiscoveryScan) -> Optional[str]:
+    return decrypt_secret(scan.encrypted_location)
+
+
+def plan_scan(
+    db: Session,
+    scan: DataDiscoveryScan,
+    connection_string: Optional[str],
+) -> IncrementalPlan:
+    config = scan.scan_config or {}
+    previous = None
+    if config.get("incremental", True):
+        previous = db.scalars(
+            select(DataDiscoveryScan)
+            .where(
+                DataDiscoveryScan.tenant_id == scan.tenant_id,
+                DataDiscoveryScan.source_name == scan.source_name,
+                DataDiscoveryScan.source_type == scan.source_type,
+                DataDiscoveryScan.status == "completed",
+                DataDiscoveryScan.id != scan.id,
+            )
+            .order_by(DataDiscoveryScan.completed_at.desc())
+            .limit(1)
+        ).first()
+    plan = plan_incremental(
+        scan.source_type, connection_string, config, previous.manifest if previous else None
+    )
+    if plan.carried:
+        scan.base_scan_id = previous.id
+    scan.bytes_reused = manifest_stats(plan.carried).bytes
+    logger.info(
+        "PII scan planned",
+        scan_id=scan.id,
+        base_scan_id=scan.base_scan_id,
+        units_changed=len(plan.units),
+        units_reused=len(plan.carried),
+    )
+    return plan
+
+
+@shared_task(bind=True, time_limit=settings.PII_SCAN_TIME_LIMIT_SECONDS)
+def process_pii_scan(self, scan_id: str):
+    db = get_sync_session()
+    try:
+        scan = db.get(DataDiscoveryScan, scan_id)
+        if scan is None:
+            return {"message": f"PII scan {scan_id} not found"}
+        if scan.cancel_requested:
+            return finish_scan(db, scan, ScanStats(), "cancelled")
+
+        scan.status = "running"
+        scan.started_at = datetime.utcnow()
+        db.commit()
+
+        try:
+            connection_string = scan_location(scan)
+            plan = plan_scan(db, scan, connection_string)
+        except Exception as e:
+            logger.error("PII scan planning failed", scan_id=scan_id, error=str(e), exc_info=True)
+            return finish_scan(db, scan, ScanStats(), "failed", str(e))
+
+        shard_count = requested_shard_count(scan.scan_config)
+        if shard_count > 1 and len(plan.units) > 1:
+            return _process_sharded_scan(db, scan, plan, shard_count)
+
+        stats = manifest_stats(plan.carried)
+        entries = dict(plan.carried)
+        last_checkpoint = time.monotonic()
+        try:
+            for stats in iter_unit_scan(
+                plan.units, connection_string, scan.scan_config, stats, entries
+            ):
+                if time.monotonic() - last_checkpoint < settings.PII_SCAN_CHECKPOINT_SECONDS:
+                    continue
+                checkpoint_scan(db, scan, stats)
+                if self.request.id:
+                    self.update_state(
+                        state="PROGRESS",
+                        meta={"rows_scanned": stats.rows, "bytes_scanned": stats.bytes},
+                    )
+                if is_cancel_requested(db, scan_id):
+                    raise ScanCancelled()
+                last_checkpoint = time.monotonic()
+        except ScanCancelled:
+            return finish_scan(db, scan, stats, "cancelled")
+        except Exception as e:
+            logger.error("PII scan failed", scan_id=scan_id, error=str(e), exc_info=True)
+            return finish_scan(db, scan, stats, "failed", str(e))
+        scan.manifest = build_manifest(plan, entries)
+        return finish_scan(db, scan, stats, "completed")
+    finally:
+        db.close()
+
+
+def _process_sharded_scan(
+    db: Session,
+    scan: DataDiscoveryScan,
+    plan: IncrementalPlan,
+    shard_count: int,
+) -> dict:
+    # Shards fan out as separate Celery tasks: prefork workers are daemonic and cannot
+    # start a local process pool of their own.
+    groups = group_units(plan.units, shard_count)
+    scan.manifest = build_manifest(plan, plan.carried)
+    checkpoint_scan(db, scan, manifest_stats(plan.carried))
+    header = [scan_pii_shard.s(scan.id, group) for group in groups]
+    callback = merge_pii_scan_shards.s(scan.id).on_error(fail_pii_scan.s(scan.id))
+    chord(header)(callback)
+    logger.info("PII scan fanned out", scan_id=scan.id, shards=len(groups))
+    return {"scan_id": scan.id, "status": "running", "shards": len(groups)}
+
+
+def _scan_totals(scan: DataDiscoveryScan) -> dict:
+    return {
+        "rows": scan.rows_scanned or 0,
+        "bytes": scan.bytes_scanned or 0,
+        "counts": {p["type"]: p["count"] for p in scan.pii_found or []},
+    }
+
+
+def _add_progress(db: Session, scan_id: str, rows: int, nbytes: int) -> None:
+    db.execute(
+        update(DataDiscoveryScan)
+        .where(DataDiscoveryScan.id == scan_id)
+        .values(
+            rows_scanned=DataDiscoveryScan.rows_scanned + rows,
+            bytes_scanned=DataDiscoveryScan.bytes_scanned + nbytes,
+        )
+    )
+    db.commit()
+
+
+@shared_task(bind=True, time_limit=settings.PII_SCAN_TIME_LIMIT_SECONDS)
+def scan_pii_shard(self, scan_id: str, units: list[dict]):
+    db = get_sync_session()
+    try:
+        scan = db.get(DataDiscoveryScan, scan_id)
+        entries: dict[str, dict] = {}
+        if scan is None or scan.cancel_requested:
+            return entries
+
+        connection_string = scan_location(scan)
+        stats = ScanStats()
+        reported_rows = reported_bytes = 0
+        last_checkpoint = time.monotonic()
+        for stats in iter_unit_scan(units, connection_string, scan.scan_config, stats, entries):
+            if time.monotonic() - last_checkpoint < settings.PII_SCAN_CHECKPOINT_SECONDS:
+                continue
+            _add_progress(db, scan_id, stats.rows - reported_rows, stats.bytes - reported_bytes)
+            reported_rows, reported_bytes = stats.rows, stats.bytes
+            if is_cancel_requested(db, scan_id):
+                break
+            last_checkpoint = time.monotonic()
+        _add_progress(db, scan_id, stats.rows - reported_rows, stats.bytes - reported_bytes)
+        return entries
+    finally:
+        db.close()
+
+
+@shared_task(bind=True)
+def merge_pii_scan_shards(self, results: list[dict], scan_id: str):
+    db = get_sync_session()
+    try:
+        scan = db.get(DataDiscoveryScan, scan_id)
+        if scan is None:
+            return {"message": f"PII scan {scan_id} not found"}
+        entries = dict(scan.manifest["units"])
+        for result in results:
+            entries.update(result)
+        status = "cancelled" if scan.cancel_requested else "completed"
+        if status == "completed":
+            scan.manifest = {**scan.manifest, "units": entries}
+        return finish_scan(db, scan, manifest_stats(entries), status)
+    finally:
+        db.close()
+
+
+@shared_task
+def fail_pii_scan(request, exc, traceback, scan_id: str):
+    db = get_sync_session()
+    try:
+        scan = db.get(DataDiscoveryScan, scan_id)
+        if scan is not None:
+            db.refresh(scan)
+            finish_scan(db, scan, ScanStats.from_dict(_scan_totals(scan)), "failed", str(exc))
+    finally:
+        db.close()
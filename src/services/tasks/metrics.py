@@ -0,0 +1,47 @@
+from celery import shared_task
+from sqlalchemy import select
+
+from src.core.database import get_sync_session
+from src.core.logging import get_logger
+from src.models.metrics import TenantMetrics
+from src.models.user import Tenant
+from src.services.metrics import (
+    METRIC_COLUMNS,
+    collect_tenant_metrics,
+    tenant_metrics_queries,
+    tenant_metrics_upsert,
+)
+
+logger = get_logger(__name__)
+
+RECONCILE_BATCH_SIZE = 1000
+
+
+@shared_task(bind=True)
+def reconcile_tenant_metrics(self):
+    db = get_sync_session()
+    try:
+        tenant_ids = list(db.scalars(select(Tenant.id).order_by(Tenant.id)))
+        for offset in range(0, len(tenant_ids), RECONCILE_BATCH_SIZE):
+            batch = tenant_ids[offset : offset + RECONCILE_BATCH_SIZE]
+            # Lock the counter rows before recounting: a writer that already bumped a
+            # counter commits before the recount starts, and later writers wait until the
+            # recount is committed, so no increment is counted twice or overwritten.
+            db.execute(
+                select(TenantMetrics.tenant_id)
+                .where(TenantMetrics.tenant_id.in_(batch))
+                .order_by(TenantMetrics.tenant_id, TenantMetrics.slot)
+                .with_for_update()
+            ).all()
+            rows = []
+            for query in tenant_metrics_queries(batch):
+                rows.extend(db.execute(query).mappings().all())
+            metrics = collect_tenant_metrics(rows)
+            for tenant_id in batch:
+                metrics.setdefault(tenant_id, dict.fromkeys(METRIC_COLUMNS, 0))
+            db.execute(tenant_metrics_upsert(metrics))
+            db.commit()
+        logger.info("Tenant metrics reconciled", tenants=len(tenant_ids))
+        return {"message": "Tenant metrics reconciled", "tenants": len(tenant_ids)}
+    finally:
+        db.close()
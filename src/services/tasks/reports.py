@@ -0,0 +1,71 @@
+from datetime import datetime
+
+from celery import shared_task
+from sqlalchemy import select
+
+from src.core.database import get_sync_session
+from src.core.logging import get_logger
+from src.models.report import Report
+from src.services.reports import render_report
+from src.services.storage import get_storage
+
+logger = get_logger(__name__)
+
+
+@shared_task(bind=True)
+def generate_compliance_report(self, report_id: str):
+    db = get_sync_session()
+    try:
+        report = db.get(Report, report_id)
+        if report is None:
+            return {"message": f"Report {report_id} not found"}
+        if report.status != "queued":
+            return {"report_id": report_id, "status": report.status}
+
+        report.status = "running"
+        report.started_at = datetime.utcnow()
+        db.commit()
+
+        try:
+            report.storage_key, report.size_bytes, report.etag = render_report(
+                db, report, get_storage()
+            )
+        except Exception as e:
+            db.rollback()
+            logger.error("Report failed", report_id=report_id, error=str(e), exc_info=True)
+            report.status = "failed"
+            report.error_message = str(e)
+        else:
+            report.status = "completed"
+        report.completed_at = datetime.utcnow()
+        db.commit()
+        logger.info(
+            "Report finished",
+            report_id=report_id,
+            report_type=report.report_type,
+            status=report.status,
+            size_bytes=report.size_bytes,
+        )
+        return {"report_id": report_id, "status": report.status}
+    finally:
+        db.close()
+
+
+@shared_task(bind=True)
+def purge_expired_reports(self):
+    db = get_sync_session()
+    try:
+        storage = get_storage()
+        expired = db.scalars(
+            select(Report).where(
+                Report.status == "completed", Report.expires_at <= datetime.utcnow()
+            )
+        ).all()
+        for report in expired:
+            storage.delete(report.storage_key)
+            report.status = "expired"
+        db.commit()
+        logger.info("Expired reports purged", reports=len(expired))
+        return {"purged": len(expired)}
+    finally:
+        db.close()
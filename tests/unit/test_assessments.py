@@ -0,0 +1,87 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+@pytest.fixture
+async def assessment_db(tmp_path):
+    from sqlalchemy import create_engine
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.models import Assessment, Base, Framework, Tenant
+
+    sync_engine = create_engine(f"sqlite:///{tmp_path / 'assessments.db'}")
+    Base.metadata.create_all(sync_engine)
+    sync_engine.dispose()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'assessments.db'}")
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    async with factory() as db:
+        db.add(Tenant(id="t1", name="Acme", slug="acme"))
+        db.add(Framework(id="soc2", tenant_id="t1", name="SOC 2", framework_type="SOC2"))
+        db.add(Framework(id="custom", tenant_id="t1", name="Internal", framework_type="internal"))
+        db.add(Assessment(id="a1", tenant_id="t1", framework_id="soc2", name="Q1"))
+        db.add(Assessment(id="a2", tenant_id="t1", framework_id="custom", name="Q1"))
+        await db.commit()
+    yield factory
+    await engine.dispose()
+
+
+async def submit(factory, assessment_id: str, *controls: dict):
+    from types import SimpleNamespace
+
+    from src.api.assessments import submit_control_status
+    from src.schemas.framework import AssessmentSubmitControls
+
+    user = SimpleNamespace(id=None, tenant_id="t1")
+    async with factory() as db:
+        response = await submit_control_status(
+            assessment_id, AssessmentSubmitControls(controls=list(controls)), user, db
+        )
+        await db.commit()
+        return response
+
+
+class TestSubmitControlStatus:
+    async def test_controls_are_scored_and_counted_by_delta(self, assessment_db):
+        full = ["policy_exists", "procedure_documented", "testing_performed", "audit_passed"]
+        response = await submit(
+            assessment_db,
+            "a1",
+            {"control_id": "CC6.1", "evidence": full},
+            {"control_id": "CC6.2", "status": "compliant", "evidence": ["policy_exists"]},
+        )
+        assert response.controls_status["CC6.1"]["status"] == "compliant"
+        assert response.controls_status["CC6.1"]["score"] == 75
+        assert response.controls_status["CC6.2"]["status"] == "non_compliant"
+        assert (response.controls_total, response.controls_compliant) == (2, 1)
+        assert response.progress == 50
+
+        response = await submit(
+            assessment_db,
+            "a1",
+            {"control_id": "CC6.1", "evidence": ["policy_exists"]},
+            {"control_id": "CC6.2", "evidence": full},
+            {"control_id": "CC7.1", "evidence": full},
+        )
+        assert response.controls_status["CC6.1"]["status"] == "non_compliant"
+        assert (response.controls_total, response.controls_compliant) == (3, 2)
+        assert response.progress == 66
+
+    async def test_unknown_controls_and_evidence_are_rejected(self, assessment_db):
+        from fastapi import HTTPException
+
+        with pytest.raises(HTTPException) as error:
+            await submit(assessment_db, "a1", {"control_id": "CC99.1"})
+        assert error.value.status_code == 400 and "CC99.1" in error.value.detail
+        with pytest.raises(HTTPException) as error:
+            await submit(assessment_db, "a1", {"control_id": "CC6.1", "evidence": ["hunch"]})
+        assert "hunch" in error.value.detail
+
+        response = await submit(assessment_db, "a2", {"control_id": "ANY-1", "status": "compliant"})
+        assert (response.controls_total, response.controls_compliant) == (1, 1)
+        with pytest.raises(HTTPException):
+            await submit(assessment_db, "a2", {"control_id": "ANY-2"})
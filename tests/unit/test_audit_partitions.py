@@ -0,0 +1,149 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+
+class TestAuditPartitions:
+    def test_longest_tenant_retention_sets_the_cutoff(self):
+        from datetime import datetime
+
+        from src.services.audit_partitions import (
+            expired_partitions,
+            partition_name,
+            retention_cutoff,
+            tenant_retention,
+        )
+
+        policies = {
+            "t1": tenant_retention('{"audit_retention_months": 6}'),
+            "t2": tenant_retention('{"audit_retention_months": 12, "audit_archive": false}'),
+            "t3": tenant_retention("not json"),
+        }
+        assert policies["t2"] == (12, False)
+        assert policies["t3"][1] is True
+
+        del policies["t3"]
+        cutoff = retention_cutoff(policies, datetime(2026, 10, 17, 9, 30))
+        assert cutoff == datetime(2025, 10, 1)
+        names = [partition_name(datetime(2025, month, 1)) for month in range(8, 12)]
+        assert expired_partitions(names + ["audit_logs"], cutoff) == [
+            "audit_logs_y2025m08",
+            "audit_logs_y2025m09",
+        ]
+
+    def test_shorter_tenant_retention_purges_inside_kept_partitions(self):
+        from datetime import datetime
+
+        from src.services.audit_partitions import DEFAULT_PARTITION, partition_name, tenant_purges
+
+        policies = {"t1": (6, True), "t2": (12, False), "t3": (8, False)}
+        names = [partition_name(datetime(2025, month, 1)) for month in range(9, 13)]
+        names += [partition_name(datetime(2026, month, 1)) for month in range(1, 5)]
+        purges = tenant_purges(names + [DEFAULT_PARTITION], policies, datetime(2026, 10, 17))
+        # 2025-09 is past every retention and is retired as a whole partition instead.
+        assert purges == {
+            "audit_logs_y2025m10": ["t1", "t3"],
+            "audit_logs_y2025m11": ["t1", "t3"],
+            "audit_logs_y2025m12": ["t1", "t3"],
+            "audit_logs_y2026m01": ["t1", "t3"],
+            "audit_logs_y2026m02": ["t1"],
+            "audit_logs_y2026m03": ["t1"],
+        }
+
+    def test_export_writes_one_archive_per_archiving_tenant(self, tmp_path, monkeypatch):
+        import gzip
+        import json
+        from datetime import datetime
+
+        from sqlalchemy import MetaData, create_engine, insert
+        from sqlalchemy.orm import Session
+
+        from src.core.config import settings
+        from src.models import AuditLog
+        from src.services.audit_partitions import archive_path, export_partition
+
+        monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+        engine = create_engine(f"sqlite:///{tmp_path / 'archive.db'}")
+        detached = AuditLog.__table__.to_metadata(MetaData(), name="audit_logs_y2024m01")
+        for constraint in list(detached.foreign_key_constraints):
+            detached.constraints.discard(constraint)
+        detached.create(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(detached),
+                [
+                    {
+                        "id": f"{tenant}-{i}",
+                        "tenant_id": tenant,
+                        "action": "user.login",
+                        "details": {"i": i},
+                        "created_at": datetime(2024, 1, 1 + i),
+                    }
+                    for tenant in ("t1", "t2", "t3")
+                    for i in range(3)
+                ],
+            )
+
+        policies = {"t1": (12, True), "t2": (12, False)}
+        with Session(engine) as db:
+            exported = export_partition(db, "audit_logs_y2024m01", policies)
+            assert export_partition(db, "audit_logs_y2024m01", policies, ["t2", "t3"]) == {"t3": 3}
+
+        assert exported == {"t1": 3, "t3": 3}
+        month = datetime(2024, 1, 1)
+        with gzip.open(archive_path("t1", month), "rt") as fh:
+            rows = [json.loads(line) for line in fh]
+        assert [row["id"] for row in rows] == ["t1-0", "t1-1", "t1-2"]
+        assert rows[0]["details"] == {"i": 0}
+        assert not archive_path("t2", month).exists()
+        assert not list(tmp_path.rglob("*.part"))
+
+    def test_tenant_purge_deletes_and_archives_in_batches(self, tmp_path, monkeypatch):
+        import gzip
+        import json
+        from datetime import datetime
+
+        from sqlalchemy import MetaData, create_engine, insert, select
+        from sqlalchemy.orm import Session
+
+        from src.core.config import settings
+        from src.models import AuditLog
+        from src.services import audit_partitions
+        from src.services.audit_partitions import archive_path, purge_tenant_rows
+
+        monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path))
+        monkeypatch.setattr(audit_partitions, "PURGE_BATCH_SIZE", 2)
+        engine = create_engine(f"sqlite:///{tmp_path / 'purge.db'}")
+        partition = AuditLog.__table__.to_metadata(MetaData(), name="audit_logs_y2024m01")
+        for constraint in list(partition.foreign_key_constraints):
+            partition.constraints.discard(constraint)
+        partition.create(engine)
+        with engine.begin() as conn:
+            conn.execute(
+                insert(partition),
+                [
+                    {
+                        "id": f"{tenant}-{i}",
+                        "tenant_id": tenant,
+                        "action": "user.login",
+                        "details": {"i": i},
+                        "created_at": datetime(2024, 1, 10 - i),
+                    }
+                    for tenant in ("t1", "t2", "t3")
+                    for i in range(5)
+                ],
+            )
+
+        policies = {"t1": (12, True), "t2": (12, False)}
+        with Session(engine) as db:
+            exported, deleted = purge_tenant_rows(db, "audit_logs_y2024m01", ["t1", "t2"], policies)
+            assert (exported, deleted) == ({"t1": 5}, 10)
+            remaining = db.scalars(select(partition.c.tenant_id).distinct()).all()
+            assert remaining == ["t3"]
+
+        month = datetime(2024, 1, 1)
+        with gzip.open(archive_path("t1", month), "rt") as fh:
+            rows = [json.loads(line) for line in fh]
+        assert [row["id"] for row in rows] == ["t1-4", "t1-3", "t1-2", "t1-1", "t1-0"]
+        assert not archive_path("t2", month).exists()
@@ -0,0 +1,202 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    from sqlalchemy import event, insert
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.models import Base, Tenant
+    from src.services import audit
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'audit.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Tenant).values(id="t1", name="Acme", slug="acme"))
+
+    statements = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    factory.statements = statements
+    monkeypatch.setattr(audit, "async_session_maker", factory)
+    monkeypatch.setattr(audit, "_buffer", [])
+    yield factory
+    await engine.dispose()
+
+
+class TestAuditWriter:
+    async def test_committed_entries_are_written_in_one_batch(self, session_factory):
+        from sqlalchemy import func, select
+
+        from src.models import AuditLog
+        from src.services import audit
+
+        async with session_factory() as db:
+            for i in range(50):
+                audit.record_audit(db, "t1", None, "assessment.updated", resource_id=str(i))
+            assert session_factory.statements == []
+            await db.commit()
+
+        async with session_factory() as db:
+            audit.record_audit(db, "t1", None, "assessment.deleted")
+            await db.rollback()
+
+        assert len(audit._buffer) == 50
+        session_factory.statements.clear()
+        assert await audit.flush_audit_log() == 50
+        inserts = [s for s in session_factory.statements if s.startswith("INSERT INTO audit_logs")]
+        assert len(inserts) == 1
+
+        async with session_factory() as db:
+            actions = await db.scalars(select(AuditLog.action).distinct())
+            assert actions.all() == ["assessment.updated"]
+            assert await db.scalar(select(func.count()).select_from(AuditLog)) == 50
+
+    async def test_full_buffer_drops_and_counts(self, session_factory, monkeypatch):
+        from prometheus_client import REGISTRY
+
+        from src.core.config import settings
+        from src.services import audit
+
+        monkeypatch.setattr(settings, "AUDIT_BUFFER_SIZE", 3)
+        labels = {"reason": "buffer_full"}
+        dropped = REGISTRY.get_sample_value("audit_log_entries_dropped_total", labels) or 0
+
+        async with session_factory() as db:
+            for _ in range(5):
+                audit.record_audit(db, "t1", None, "user.login")
+            await db.commit()
+
+        assert len(audit._buffer) == 3
+        assert REGISTRY.get_sample_value("audit_log_backlog") == 3
+        assert REGISTRY.get_sample_value("audit_log_entries_dropped_total", labels) == dropped + 2
+        await audit.drain_audit_log()
+        assert audit._buffer == []
+
+
+class TestAuditExport:
+    async def test_export_streams_filtered_rows_in_order(self, session_factory, monkeypatch):
+        import csv
+        import io
+        import json
+        from datetime import datetime, timedelta
+
+        from src.services import audit
+
+        monkeypatch.setattr(audit, "EXPORT_BATCH_SIZE", 300)
+        start = datetime(2026, 7, 1)
+        async with session_factory() as db:
+            for i in range(2500):
+                audit.record_audit(
+                    db, "t1", None, "assessment.updated", resource_id=f"a{i % 2}", details={"i": i}
+                )
+            await db.commit()
+        for i, entry in enumerate(audit._buffer):
+            entry["created_at"] = start + timedelta(minutes=i)
+        await audit.flush_audit_log()
+
+        query = audit.audit_log_query(
+            "t1", resource_id="a1", since=start, until=start + timedelta(minutes=2000)
+        )
+        chunks = [chunk async for chunk in audit.stream_audit_export(query, "ndjson")]
+        rows = [json.loads(line) for chunk in chunks for line in chunk.splitlines()]
+        assert len(chunks) == 4
+        assert [row["details"]["i"] for row in rows] == list(range(1, 2000, 2))
+
+        chunks = [chunk async for chunk in audit.stream_audit_export(query, "csv")]
+        assert len(chunks) == 5
+        parsed = list(csv.DictReader(io.StringIO("".join(chunks))))
+        assert len(parsed) == 1000
+        assert json.loads(parsed[-1]["details"]) == {"i": 1999}
+        assert parsed[0]["created_at"] == (start + timedelta(minutes=1)).isoformat()
+
+
+class TestAuditChain:
+    async def test_verification_detects_edits_and_deletions(
+        self, session_factory, tmp_path, monkeypatch
+    ):
+        from sqlalchemy import create_engine, delete, select, update
+        from sqlalchemy.orm import Session
+
+        from src.core.config import settings
+        from src.models import AuditCheckpoint, AuditLog
+        from src.services import audit
+        from src.services import audit_chain
+        from src.services.audit_chain import verify_audit_chains, verify_audit_window
+
+        real = audit_chain.chain_hash
+
+        monkeypatch.setattr(settings, "AUDIT_CHECKPOINT_ENTRIES", 100)
+        monkeypatch.setattr(settings, "AUDIT_VERIFY_BATCH_SIZE", 64)
+        for _ in range(3):
+            async with session_factory() as db:
+                for i in range(110):
+                    audit.record_audit(db, "t1", None, "assessment.updated", details={"i": i})
+                await db.commit()
+            await audit.flush_audit_log()
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'audit.db'}")
+        with Session(engine) as db:
+            assert verify_audit_chains(db) == {"tenants": 1, "entries": 330, "failed": []}
+            checkpoints = db.scalars(select(AuditCheckpoint).order_by("first_seq")).all()
+            assert [(c.first_seq, c.last_seq) for c in checkpoints] == [
+                (1, 100),
+                (101, 200),
+                (201, 300),
+            ]
+            assert all(c.verified_at for c in checkpoints)
+            # Later runs start from the last verified checkpoint.
+            assert verify_audit_chains(db)["entries"] == 30
+
+            db.execute(update(AuditLog).where(AuditLog.seq == 320).values(action="user.login"))
+            db.commit()
+            assert verify_audit_chains(db)["failed"] == ["t1"]
+
+        async with session_factory() as db:
+            result = await verify_audit_window(db, "t1")
+            assert (result["valid"], result["error"], result["error_seq"]) == (
+                False,
+                "hash_mismatch",
+                320,
+            )
+
+        with Session(engine) as db:
+            db.execute(
+                update(AuditLog).where(AuditLog.seq == 320).values(action="assessment.updated")
+            )
+            db.commit()
+
+        # Entries up to the last verified checkpoint are counted, not hashed again.
+        hashed = []
+        monkeypatch.setattr(audit_chain, "chain_hash", lambda row: hashed.append(row) or real(row))
+        async with session_factory() as db:
+            result = await verify_audit_window(db, "t1")
+            assert result == {
+                "valid": True,
+                "entries": 330,
+                "first_seq": 1,
+                "last_seq": 330,
+                "checkpoints": 3,
+                "error": None,
+                "error_seq": None,
+            }
+            assert len(hashed) == 30
+            monkeypatch.setattr(settings, "AUDIT_VERIFY_WINDOW_MAX_ENTRIES", 29)
+            with pytest.raises(audit_chain.AuditWindowTooLarge):
+                await verify_audit_window(db, "t1")
+
+        with Session(engine) as db:
+            db.execute(delete(AuditLog).where(AuditLog.seq == 120))
+            db.commit()
+
+        async with session_factory() as db:
+            result = await verify_audit_window(db, "t1")
+            assert (result["valid"], result["error"], result["error_seq"]) == (False, "gap", 120)
+        engine.dispose()
@@ -0,0 +1,64 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+class TestBloomFilter:
+    def test_no_false_negatives_and_bounded_false_positives(self):
+        from src.core.bloom import BloomFilter
+
+        bloom = BloomFilter(capacity=5000, error_rate=0.001)
+        members = [f"sub:{i}" for i in range(5000)]
+        for member in members:
+            bloom.add(member)
+
+        assert all(member in bloom for member in members)
+        false_positives = sum(f"jti:{i}" in bloom for i in range(20000))
+        assert false_positives < 20000 * 0.005
+
+
+class TestClaimsAuth:
+    @pytest.fixture
+    async def claims_mode(self, monkeypatch):
+        import time
+
+        from src.core.config import settings
+        from src.core.redis import close_redis, get_redis
+        from src.services import revocation
+
+        monkeypatch.setattr(settings, "AUTH_MODE", "claims")
+        monkeypatch.setattr(revocation, "_filter", revocation.new_filter())
+        monkeypatch.setattr(revocation, "_synced_at", time.monotonic())
+        get_redis.cache_clear()
+        yield
+        await close_redis()
+
+    async def test_claims_principal_needs_no_database(self, claims_mode):
+        from src.services.auth import create_access_token, decode_token, get_current_user
+
+        token = create_access_token(
+            {"sub": "u1", "email": "ana@acme.io", "tenant_id": "t1", "role": "admin"}
+        )
+        payload = decode_token(token)
+        assert payload.jti and payload.iat
+
+        user = await get_current_user(payload=payload, db=None)
+        assert (user.id, user.tenant_id, user.role) == ("u1", "t1", "admin")
+
+    async def test_revoked_subject_is_rejected(self, claims_mode):
+        from fastapi import HTTPException
+
+        from src.services.auth import create_access_token, decode_token, get_current_user
+        from src.services.revocation import revoke, subject_member
+
+        payload = decode_token(
+            create_access_token({"sub": "u2", "email": "bo@acme.io", "tenant_id": "t1"})
+        )
+        await revoke([subject_member("u2")])
+
+        with pytest.raises(HTTPException) as exc:
+            await get_current_user(payload=payload, db=None)
+        assert exc.value.status_code == 401
@@ -41,6 +41,64 @@ class TestPasswordHashing:
         hash2 = hash_password(password)
         assert hash1 != hash2
 
+    async def test_hashing_pool_sheds_when_saturated(self, monkeypatch):
+        import asyncio
+        import threading
+
+        from src.core.config import settings
+        from src.services import hashing
+
+        monkeypatch.setattr(settings, "PASSWORD_HASH_WORKERS", 1)
+        monkeypatch.setattr(settings, "PASSWORD_HASH_MAX_QUEUE", 1)
+        hashing.shutdown_hash_pool()
+        release = threading.Event()
+
+        jobs = [asyncio.create_task(hashing.run_hash("verify", release.wait)) for _ in range(2)]
+        await asyncio.sleep(0.05)
+        assert hashing.queue_depth() == 1
+        with pytest.raises(hashing.HashPoolSaturated) as exc:
+            await hashing.run_hash("verify", release.wait)
+        assert exc.value.retry_after >= 1
+
+        release.set()
+        assert await asyncio.gather(*jobs) == [True, True]
+        assert await hashing.run_hash("hash", len, "pw") == 2
+        hashing.shutdown_hash_pool()
+
+    async def test_login_rehashes_only_below_the_floor(self, monkeypatch):
+        from passlib.hash import bcrypt
+
+        from src.core.config import settings
+        from src.models.user import User
+        from src.services import auth, hashing
+
+        users = {
+            "old@acme.io": User(id="u1", password_hash=bcrypt.using(rounds=4).hash("pw")),
+            "new@acme.io": User(id="u2", password_hash=bcrypt.using(rounds=6).hash("pw")),
+        }
+        for user in users.values():
+            user.is_active = True
+
+        async def get_user_by_email(db, email):
+            return users[email]
+
+        monkeypatch.setattr(auth, "get_user_by_email", get_user_by_email)
+        try:
+            hashing.set_bcrypt_rounds(5, 5)
+            with pytest.raises(ValueError):
+                hashing.set_bcrypt_rounds(5, 6)
+            for email in users:
+                assert await auth.authenticate_user(None, email, "pw") is users[email]
+            assert bcrypt.from_string(users["old@acme.io"].password_hash).rounds == 5
+            assert bcrypt.from_string(users["new@acme.io"].password_hash).rounds == 6
+            assert not any(
+                hashing.pwd_context.needs_update(u.password_hash) for u in users.values()
+            )
+            assert auth.verify_password("pw", users["old@acme.io"].password_hash)
+        finally:
+            hashing.set_bcrypt_rounds(settings.BCRYPT_ROUNDS, settings.BCRYPT_MIN_ROUNDS)
+            hashing.shutdown_hash_pool()
+
 
 class TestTokenGeneration:
     def test_create_access_token(self):
@@ -175,3 +233,99 @@ class TestSchemas:
         )
         assert response.name == "SOC2"
         assert response.is_active is True
+
+
+class TestCrosswalk:
+    def test_adjacency_links_equivalent_controls_across_frameworks(self):
+        from src.services.frameworks.crosswalk import (
+            CONTROL_KEYS,
+            control_index,
+            equivalent_controls,
+        )
+
+        art32 = control_index("gdpr", "ART32")
+        equivalents = {CONTROL_KEYS[i] for i in equivalent_controls(art32)}
+        assert {("iso27001", "A.9"), ("soc2", "CC6.1"), ("hipaa", "164.312.A.1")} <= equivalents
+        assert all(framework != "gdpr" for framework, _ in equivalents)
+        for other in equivalent_controls(art32):
+            assert art32 in equivalent_controls(other)
+
+    def test_evidence_counts_in_every_framework_it_applies_to(self):
+        import numpy as np
+
+        from src.services.frameworks.crosswalk import (
+            CONTROL_KEYS,
+            catalog_name,
+            control_index,
+            equivalent_controls,
+            framework_coverage,
+        )
+
+        satisfied = np.zeros(len(CONTROL_KEYS), dtype=bool)
+        satisfied[control_index("soc2", "CC6.1")] = True
+        iso = framework_coverage(satisfied, catalog_name("ISO 27001"))
+        assert iso["compliant"] == 0
+        assert iso["covered"] == 1
+        assert iso["gaps"] == iso["controls"] - 1
+        soc2 = framework_coverage(satisfied, "soc2")
+        assert (soc2["compliant"], soc2["covered"]) == (1, 0)
+
+        # Logical access (CC6.1) says nothing about physical security (ISO A.11); CC6.4 does.
+        a11 = control_index("iso27001", "A.11")
+        assert a11 not in equivalent_controls(control_index("soc2", "CC6.1"))
+        assert a11 in equivalent_controls(control_index("soc2", "CC6.4"))
+
+    def test_business_continuity_does_not_cover_incident_response(self):
+        import numpy as np
+
+        from src.services.frameworks.crosswalk import (
+            CONTROL_KEYS,
+            control_index,
+            equivalent_controls,
+            framework_coverage,
+        )
+
+        cc81 = control_index("soc2", "CC8.1")
+        equivalents = {CONTROL_KEYS[i] for i in equivalent_controls(cc81)}
+        assert ("iso27001", "A.17") in equivalents
+        assert ("iso27001", "A.16") not in equivalents
+        assert ("gdpr", "ART33") not in equivalents
+
+        satisfied = np.zeros(len(CONTROL_KEYS), dtype=bool)
+        satisfied[cc81] = True
+        assert framework_coverage(satisfied, "gdpr")["covered"] == 0
+
+
+class TestFrameworkRegistry:
+    def test_bulk_scores_match_per_control_assessment(self):
+        import numpy as np
+
+        from src.services.frameworks.registry import FRAMEWORK_REGISTRY, assess_bulk
+
+        rng = np.random.default_rng(7)
+        for name, columns in FRAMEWORK_REGISTRY.items():
+            evidence = rng.random((3, len(columns.control_ids), len(columns.evidence_fields)))
+            evidence = evidence < 0.6
+            result = assess_bulk(name, evidence)
+            assert result.scores.shape == evidence.shape[:2]
+            for tenant in range(3):
+                for i, control_id in enumerate(columns.control_ids):
+                    expected = columns.assess(
+                        str(control_id), dict(zip(columns.evidence_fields, evidence[tenant, i]))
+                    )
+                    assert result.scores[tenant, i] == expected["score"]
+                    assert result.statuses[tenant, i] == expected["status"]
+
+    def test_evidence_matrix_and_unknown_framework(self):
+        import pytest
+
+        from src.services.frameworks.registry import assess_bulk, build_evidence_matrix
+
+        matrix = build_evidence_matrix(
+            "SOC 2", [{"policy_exists": True, "procedure_documented": True}, {}]
+        )
+        assert assess_bulk("soc2", matrix).statuses.tolist() == ["partial", "non_compliant"]
+        with pytest.raises(ValueError):
+            assess_bulk("dpdpa", matrix)
+        with pytest.raises(ValueError):
+            assess_bulk("gdpr", matrix)
@@ -0,0 +1,88 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+@pytest.fixture
+async def session_factory(tmp_path, monkeypatch):
+    from sqlalchemy import event, insert
+    from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+    from src.core.config import settings
+    from src.models import Base, Tenant, User
+    from src.services import principals
+
+    monkeypatch.setattr(settings, "PRINCIPAL_CACHE_REDIS_ENABLED", False)
+    principals._principals.clear()
+
+    engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'principals.db'}")
+    async with engine.begin() as conn:
+        await conn.run_sync(Base.metadata.create_all)
+        await conn.execute(insert(Tenant).values(id="t1", name="Acme", slug="acme"))
+        await conn.execute(
+            insert(User).values(
+                id="u1",
+                tenant_id="t1",
+                email="ana@acme.io",
+                password_hash="x",
+                role="user",
+                is_active=True,
+                email_verified=False,
+            )
+        )
+
+    statements = []
+    event.listen(
+        engine.sync_engine, "before_cursor_execute", lambda *args: statements.append(args[2])
+    )
+    factory = async_sessionmaker(engine, expire_on_commit=False)
+    factory.statements = statements
+    yield factory
+    await engine.dispose()
+
+
+class TestPrincipalCache:
+    async def test_repeat_lookups_skip_the_database(self, session_factory):
+        from prometheus_client import REGISTRY
+
+        from src.services.principals import get_principal
+
+        labels = {"layer": "local", "result": "hit"}
+        hits = REGISTRY.get_sample_value("principal_cache_lookups_total", labels) or 0
+
+        async with session_factory() as db:
+            first = await get_principal(db, "u1")
+        assert len(session_factory.statements) == 1
+
+        session_factory.statements.clear()
+        async with session_factory() as db:
+            cached = await get_principal(db, "u1")
+        assert session_factory.statements == []
+        assert (cached.id, cached.tenant_id, cached.role) == (first.id, "t1", "user")
+        assert REGISTRY.get_sample_value("principal_cache_lookups_total", labels) == hits + 1
+
+    async def test_role_change_invalidates_on_commit(self, session_factory):
+        from src.models import User
+        from src.services.principals import _principals, get_principal
+
+        async with session_factory() as db:
+            await get_principal(db, "u1")
+        assert _principals.get("u1") is not None
+
+        async with session_factory() as db:
+            user = await db.get(User, "u1")
+            user.first_name = "Ana"
+            await db.rollback()
+        assert _principals.get("u1") is not None
+
+        async with session_factory() as db:
+            user = await db.get(User, "u1")
+            user.role = "admin"
+            await db.commit()
+        assert _principals.get("u1") is None
+
+        async with session_factory() as db:
+            assert (await get_principal(db, "u1")).role == "admin"
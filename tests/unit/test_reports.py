@@ -0,0 +1,215 @@
+import sys
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+@pytest.fixture
+def report_db(tmp_path, monkeypatch):
+    from datetime import datetime, timedelta
+
+    from sqlalchemy import create_engine
+    from sqlalchemy.orm import sessionmaker
+
+    from src.core.config import settings
+    from src.models import Assessment, Base, DSRRequest, Framework, Tenant
+    from src.services.tasks import reports as report_tasks
+
+    engine = create_engine(f"sqlite:///{tmp_path / 'reports.db'}")
+    Base.metadata.create_all(engine)
+    factory = sessionmaker(engine, expire_on_commit=False)
+    now = datetime.utcnow()
+    with factory() as db:
+        db.add(Tenant(id="t1", name="Acme", slug="acme"))
+        db.add(Framework(id="f1", tenant_id="t1", name="SOC2", framework_type="soc2"))
+        for i in range(5):
+            db.add(
+                Assessment(
+                    tenant_id="t1",
+                    framework_id="f1",
+                    name=f"Q{i}",
+                    status="completed" if i % 2 else "in_progress",
+                    score=20 * i,
+                    controls_status={
+                        "CC6.1": {"status": "compliant"},
+                        "CC7.2": {"status": "non_compliant", "notes": f"gap {i}"},
+                    },
+                    findings=[{"title": f"finding {n}"} for n in range(i)],
+                    created_at=now - timedelta(days=i),
+                )
+            )
+        db.add(
+            DSRRequest(
+                tenant_id="t1",
+                data_subject_id="a@example.com",
+                request_type="access",
+                status="completed",
+                sla_due_date=now,
+                completed_at=now - timedelta(hours=1),
+            )
+        )
+        db.commit()
+
+    monkeypatch.setattr(settings, "UPLOAD_DIR", str(tmp_path / "uploads"))
+    monkeypatch.setattr(report_tasks, "get_sync_session", factory)
+    yield factory
+    engine.dispose()
+
+
+def queue_report(factory, report_type: str, fmt: str, **filters) -> str:
+    from datetime import datetime, timedelta
+
+    from src.models import Report
+
+    with factory() as db:
+        report = Report(
+            tenant_id="t1",
+            report_type=report_type,
+            format=fmt,
+            expires_at=datetime.utcnow() + timedelta(hours=1),
+            **filters,
+        )
+        db.add(report)
+        db.commit()
+        return report.id
+
+
+class TestReportPipeline:
+    def test_worker_renders_artifact_once_with_etag(self, report_db):
+        import csv
+        import hashlib
+        import io
+        import json
+
+        from src.models import Report
+        from src.services.storage import get_storage
+        from src.services.tasks.reports import generate_compliance_report
+
+        json_id = queue_report(report_db, "detailed_assessment", "json")
+        csv_id = queue_report(report_db, "gap_analysis", "csv")
+        sla_id = queue_report(report_db, "sla_compliance", "json")
+        for report_id in (json_id, csv_id, sla_id):
+            assert generate_compliance_report(report_id)["status"] == "completed"
+        assert generate_compliance_report(json_id)["status"] == "completed"
+
+        storage = get_storage()
+        with report_db() as db:
+            report = db.get(Report, json_id)
+            body = b"".join(storage.iter_chunks(report.storage_key))
+            assert report.etag == hashlib.sha256(body).hexdigest()
+            assert report.size_bytes == len(body)
+            data = json.loads(body)
+            assert [row["assessment"] for row in data["rows"]] == ["Q4", "Q3", "Q2", "Q1", "Q0"]
+            assert [row["findings"] for row in data["rows"]] == [4, 3, 2, 1, 0]
+            assert data["summary"] == {"assessments": 5}
+
+            report = db.get(Report, csv_id)
+            rows = list(csv.DictReader(io.StringIO(storage.path(report.storage_key).read_text())))
+            by_control = {(row["framework"], row["control_id"]): row for row in rows}
+            assert len(rows) == 68
+            assert by_control[("soc2", "CC6.1")]["status"] == "compliant"
+            gap = by_control[("soc2", "CC7.2")]
+            assert (gap["status"], gap["notes"]) == ("gap", "gap 0")
+            covered = by_control[("iso27001", "A.9")]
+            assert (covered["status"], covered["satisfied_by"]) == ("covered", "soc2:CC6.1")
+            assert by_control[("iso27001", "A.16")]["status"] == "gap"
+
+            report = db.get(Report, sla_id)
+            data = json.loads(b"".join(storage.iter_chunks(report.storage_key)))
+            assert data["summary"] == {"requests": 1, "completed": 1, "on_time": 1, "overdue": 0}
+
+    def test_expired_artifacts_are_purged(self, report_db, monkeypatch):
+        from datetime import datetime, timedelta
+
+        from src.models import Report
+        from src.services.storage import get_storage
+        from src.services.tasks.reports import generate_compliance_report, purge_expired_reports
+
+        report_id = queue_report(report_db, "executive_summary", "csv", framework_id="f1")
+        generate_compliance_report(report_id)
+        with report_db() as db:
+            report = db.get(Report, report_id)
+            key = report.storage_key
+            report.expires_at = datetime.utcnow() - timedelta(seconds=1)
+            db.commit()
+        assert get_storage().path(key).read_text().splitlines()[1] == "SOC2,5,2,40.0"
+
+        assert purge_expired_reports() == {"purged": 1}
+        with report_db() as db:
+            assert db.get(Report, report_id).status == "expired"
+        assert not get_storage().exists(key)
+
+    def test_xlsx_and_pdf_renderers_stream_rows(self, report_db, monkeypatch):
+        from openpyxl import load_workbook
+
+        from src.models import Report
+        from src.services import report_renderers
+        from src.services.storage import get_storage
+        from src.services.tasks.reports import generate_compliance_report
+
+        monkeypatch.setattr(report_renderers, "PDF_TABLE_ROWS", 2)
+        xlsx_id = queue_report(report_db, "detailed_assessment", "xlsx")
+        pdf_id = queue_report(report_db, "gap_analysis", "pdf")
+        for report_id in (xlsx_id, pdf_id):
+            assert generate_compliance_report(report_id)["status"] == "completed"
+
+        storage = get_storage()
+        with report_db() as db:
+            workbook = load_workbook(storage.path(db.get(Report, xlsx_id).storage_key))
+            assert workbook.sheetnames == ["Summary", "Detailed Assessment"]
+            rows = list(workbook["Detailed Assessment"].values)
+            assert rows[0][0] == "assessment" and len(rows) == 6
+            assert dict(workbook["Summary"].values)["assessments"] == 5
+
+            body = storage.path(db.get(Report, pdf_id).storage_key).read_bytes()
+            assert body.startswith(b"%PDF") and b"Gap Analysis" in body
+
+
+class TestReportCache:
+    async def test_writes_bump_data_version_and_miss_the_cache(self, report_db, tmp_path):
+        from datetime import datetime
+
+        from sqlalchemy import select
+        from sqlalchemy.ext.asyncio import async_sessionmaker, create_async_engine
+
+        from src.models import Assessment, Report, TenantDataVersion
+        from src.services.report_cache import find_cached_report
+        from src.services.tasks.reports import generate_compliance_report
+
+        engine = create_async_engine(f"sqlite+aiosqlite:///{tmp_path / 'reports.db'}")
+        factory = async_sessionmaker(engine, expire_on_commit=False)
+        now = datetime.utcnow()
+
+        def request():
+            return Report(tenant_id="t1", report_type="executive_summary", format="json")
+
+        async with factory() as db:
+            key, cached = await find_cached_report(db, request(), now)
+            assert cached is None
+        report_id = queue_report(report_db, "executive_summary", "json")
+        with report_db() as db:
+            db.get(Report, report_id).cache_key = key
+            db.commit()
+        generate_compliance_report(report_id)
+
+        async with factory() as db:
+            assert (await find_cached_report(db, request(), now)) == (
+                key,
+                await db.get(Report, report_id),
+            )
+            version = await db.scalar(select(TenantDataVersion.version)) or 0
+            assessment = (await db.scalars(select(Assessment).limit(1))).one()
+            assessment.score = 99
+            await db.flush()
+            assessment.progress = 50
+            await db.flush()
+            assert await db.scalar(select(TenantDataVersion.version)) in (None, version)
+            await db.commit()
+            # Once per transaction, however many flushes it made.
+            assert await db.scalar(select(TenantDataVersion.version)) == version + 1
+
+            new_key, cached = await find_cached_report(db, request(), now)
+            assert new_key != key and cached is None
+        await engine.dispose()
@@ -0,0 +1,73 @@
+import sys
+from datetime import datetime, timedelta
+from pathlib import Path
+
+sys.path.insert(0, str(Path(__file__).parent.parent / "src"))
+
+import pytest
+
+
+class TestTenantMetrics:
+    def test_assessment_transition_only_updates_changed_counters(self):
+        from src.models.assessment import Assessment
+        from src.services.metrics import metrics_of, tenant_metrics_update
+
+        assessment = Assessment(
+            status="in_progress", score=0, due_date=datetime.utcnow() + timedelta(days=3)
+        )
+        before = metrics_of(assessment)
+        assessment.status = "completed"
+        assessment.score = 80
+        after = metrics_of(assessment)
+
+        sql = str(tenant_metrics_update("tenant-1", before, after, slot=3))
+        for column in ("assessments_completed", "assessments_in_progress", "assessments_score_sum"):
+            assert f"{column}=(tenant_metrics.{column} +" in sql
+        assert "assessments_total" not in sql
+        assert "upcoming_deadlines" not in sql
+        assert "tenant_metrics.slot = :slot_1" in sql
+        assert tenant_metrics_update("tenant-1", after, after) is None
+
+    def test_collect_merges_rows_per_tenant(self):
+        from src.services.metrics import METRIC_COLUMNS, collect_tenant_metrics
+
+        metrics = collect_tenant_metrics(
+            [
+                {"tenant_id": "t1", "assessments_total": 3, "assessments_completed": 1},
+                {"tenant_id": "t1", "dsrs_total": 2, "dsrs_pending": 2},
+                {"tenant_id": "t2", "consents_total": 5},
+            ]
+        )
+        assert set(metrics["t1"]) == set(METRIC_COLUMNS)
+        assert metrics["t1"]["assessments_total"] == 3
+        assert metrics["t1"]["dsrs_pending"] == 2
+        assert metrics["t2"]["consents_total"] == 5
+        assert metrics["t2"]["assessments_total"] == 0
+
+    def test_increments_spread_over_slots_and_sum_on_read(self, tmp_path):
+        from sqlalchemy import create_engine
+        from sqlalchemy.orm import Session
+
+        from src.models import Base, Tenant, TenantMetrics
+        from src.services.metrics import METRIC_COLUMNS, apply_tenant_metrics, tenant_metrics_select
+
+        engine = create_engine(f"sqlite:///{tmp_path / 'metrics.db'}")
+        Base.metadata.create_all(engine)
+        with Session(engine) as db:
+            db.add(Tenant(id="t1", name="Acme", slug="acme"))
+            db.add(TenantMetrics(tenant_id="t1", slot=0, **dict.fromkeys(METRIC_COLUMNS, 0)))
+            db.commit()
+
+            # Slot 3 has not been created by a reconcile yet, so the write lands on slot 0.
+            db.info["tenant_metrics_slot"] = 3
+            apply_tenant_metrics(db, "t1", {}, {"assessments_total": 1})
+            db.add(TenantMetrics(tenant_id="t1", slot=3, **dict.fromkeys(METRIC_COLUMNS, 0)))
+            apply_tenant_metrics(db, "t1", {}, {"assessments_total": 1, "dsrs_total": 1})
+            db.commit()
+
+            slots = dict(db.query(TenantMetrics.slot, TenantMetrics.assessments_total).all())
+            assert slots == {0: 1, 3: 1}
+            metrics = db.execute(tenant_metrics_select("t1")).one()
+            assert (metrics.assessments_total, metrics.dsrs_total) == (2, 1)
+            assert db.execute(tenant_metrics_select("t2")).first() is None
+        engine.dispose()